@@ -101,6 +101,14 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--startup-trace",
+        action="store_true",
+        help=(
+            "Write a trace of the startup to startup_trace.json in the configuration"
+            " directory, in the Chrome trace event format"
+        ),
+    )
 
     skip_pip_group = parser.add_mutually_exclusive_group()
     skip_pip_group.add_argument(
@@ -196,6 +204,7 @@ def main() -> int:
         safe_mode=args.safe_mode,
         debug=args.debug,
         open_ui=args.open_ui,
+        startup_trace=args.startup_trace,
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
@@ -54,10 +54,15 @@ class PolicyPermissions(AbstractPermissions):
         """Initialize the permission class."""
         self._policy = policy
         self._perm_lookup = perm_lookup
+        self._access_all_entities: dict[str, bool] = {}
 
     def access_all_entities(self, key: str) -> bool:
         """Check if we have a certain access to all entities."""
-        return test_all(self._policy.get(CAT_ENTITIES), key)
+        # The policy does not change, a user gets new permissions instead
+        if (access := self._access_all_entities.get(key)) is None:
+            access = test_all(self._policy.get(CAT_ENTITIES), key)
+            self._access_all_entities[key] = access
+        return access
 
     def _entity_func(self) -> Callable[[str, str], bool]:
         """Return a function that can test entity access."""
@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Iterable
 import contextlib
 from datetime import datetime, timedelta
+import importlib
 import logging
 import logging.handlers
 import os
@@ -11,12 +13,13 @@ import platform
 import sys
 import threading
 from time import monotonic
+from timeit import default_timer as timer
 from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 import yarl
 
-from . import config as conf_util, config_entries, core, loader
+from . import config as conf_util, config_entries, core, loader, requirements
 from .components import http
 from .const import (
     FORMAT_DATETIME,
@@ -36,17 +39,24 @@ from .helpers import (
     template,
 )
 from .helpers.dispatcher import async_dispatcher_send
+from .helpers.json import save_json
 from .helpers.typing import ConfigType
 from .setup import (
+    BASE_PLATFORMS,
+    DATA_IMPORT_TIME,
+    DATA_PRE_IMPORTS,
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
+    DATA_STARTUP_TIMELINE,
+    async_record_startup_phase,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
 from .util import dt as dt_util
 from .util.logging import async_activate_log_queue_handler
 from .util.package import async_get_user_site, is_virtual_env
+from .util.timeline import Timeline
 
 if TYPE_CHECKING:
     from .runner import RuntimeConfig
@@ -54,6 +64,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 ERROR_LOG_FILENAME = "home-assistant.log"
+STARTUP_TRACE_FILENAME = "startup_trace.json"
 
 # hass.data key for logging information.
 DATA_LOGGING = "logging"
@@ -111,6 +122,8 @@ async def async_setup_hass(
 ) -> core.HomeAssistant | None:
     """Set up Home Assistant."""
     hass = core.HomeAssistant(runtime_config.config_dir)
+    if runtime_config.startup_trace:
+        hass.data[DATA_STARTUP_TIMELINE] = Timeline()
 
     async_enable_logging(
         hass,
@@ -138,16 +151,18 @@ async def async_setup_hass(
     basic_setup_success = False
 
     if not (safe_mode := runtime_config.safe_mode):
-        await hass.async_add_executor_job(conf_util.process_ha_config_upgrade, hass)
+        with async_record_startup_phase(hass, "load configuration", "config"):
+            await hass.async_add_executor_job(conf_util.process_ha_config_upgrade, hass)
+
+            try:
+                config_dict = await conf_util.async_hass_config_yaml(hass)
+            except HomeAssistantError as err:
+                _LOGGER.error(
+                    "Failed to parse configuration.yaml: %s. Activating safe mode",
+                    err,
+                )
 
-        try:
-            config_dict = await conf_util.async_hass_config_yaml(hass)
-        except HomeAssistantError as err:
-            _LOGGER.error(
-                "Failed to parse configuration.yaml: %s. Activating safe mode",
-                err,
-            )
-        else:
+        if config_dict is not None:
             if not is_virtual_env():
                 await async_mount_local_lib_path(runtime_config.config_dir)
 
@@ -176,10 +191,13 @@ async def async_setup_hass(
         safe_mode = True
         old_config = hass.config
         old_logging = hass.data.get(DATA_LOGGING)
+        old_timeline = hass.data.get(DATA_STARTUP_TIMELINE)
 
         hass = core.HomeAssistant(old_config.config_dir)
         if old_logging:
             hass.data[DATA_LOGGING] = old_logging
+        if old_timeline:
+            hass.data[DATA_STARTUP_TIMELINE] = old_timeline
         hass.config.skip_pip = old_config.skip_pip
         hass.config.skip_pip_packages = old_config.skip_pip_packages
         hass.config.internal_url = old_config.internal_url
@@ -201,6 +219,17 @@ async def async_setup_hass(
     if runtime_config.open_ui:
         hass.add_job(open_hass_ui, hass)
 
+    if (timeline := hass.data.pop(DATA_STARTUP_TIMELINE, None)) is not None:
+        trace_path = hass.config.path(STARTUP_TRACE_FILENAME)
+        try:
+            await hass.async_add_executor_job(
+                save_json, trace_path, timeline.as_trace_events()
+            )
+        except HomeAssistantError as err:
+            _LOGGER.error("Unable to write the startup trace: %s", err)
+        else:
+            _LOGGER.info("Startup trace written to %s", trace_path)
+
     return hass
 
 
@@ -240,17 +269,22 @@ async def load_registries(hass: core.HomeAssistant) -> None:
         """
         platform.uname().processor  # pylint: disable=expression-not-assigned
 
+    async def _async_load(name: str, load: Awaitable[Any]) -> None:
+        """Load a registry and record it in the startup timeline."""
+        with async_record_startup_phase(hass, name, "registry", name):
+            await load
+
     # Load the registries and cache the result of platform.uname().processor
     entity.async_setup(hass)
     template.async_setup(hass)
     await asyncio.gather(
-        area_registry.async_load(hass),
-        device_registry.async_load(hass),
-        entity_registry.async_load(hass),
-        issue_registry.async_load(hass),
+        _async_load("area_registry", area_registry.async_load(hass)),
+        _async_load("device_registry", device_registry.async_load(hass)),
+        _async_load("entity_registry", entity_registry.async_load(hass)),
+        _async_load("issue_registry", issue_registry.async_load(hass)),
         hass.async_add_executor_job(_cache_uname_processor),
-        template.async_load_custom_templates(hass),
-        restore_state.async_load(hass),
+        _async_load("custom_templates", template.async_load_custom_templates(hass)),
+        _async_load("restore_state", restore_state.async_load(hass)),
     )
 
 
@@ -265,20 +299,22 @@ async def async_from_config_dict(
     start = monotonic()
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
-    await hass.config_entries.async_initialize()
-    await load_registries(hass)
+    with async_record_startup_phase(hass, "load config entries", "config"):
+        await hass.config_entries.async_initialize()
+    with async_record_startup_phase(hass, "load registries", "registry"):
+        await load_registries(hass)
 
     # Set up core.
     _LOGGER.debug("Setting up %s", CORE_INTEGRATIONS)
 
-    if not all(
-        await asyncio.gather(
+    with async_record_startup_phase(hass, "core integrations", "bootstrap"):
+        core_results = await asyncio.gather(
             *(
                 async_setup_component(hass, domain, config)
                 for domain in CORE_INTEGRATIONS
             )
         )
-    ):
+    if not all(core_results):
         _LOGGER.error("Home Assistant core failed to initialize. ")
         return None
 
@@ -536,6 +572,75 @@ async def async_setup_multi_components(
             )
 
 
+def _pre_import_integration(
+    integration: loader.Integration, platforms: set[str]
+) -> float | None:
+    """Import an integration and its platforms.
+
+    Returns how long the import took or None if it failed. Errors are
+    reported when the integration is set up and imports itself again.
+
+    This method runs in the executor.
+    """
+    start = timer()
+    try:
+        importlib.import_module(integration.pkg_path)
+        if platforms and integration.file_path is not None:
+            for file_name in os.listdir(integration.file_path):
+                platform_name, _, suffix = file_name.partition(".")
+                if suffix == "py" and platform_name in platforms:
+                    importlib.import_module(f"{integration.pkg_path}.{platform_name}")
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.debug("Unable to pre-import %s", integration.domain, exc_info=True)
+        return None
+    return timer() - start
+
+
+@core.callback
+def _async_pre_import_integrations(
+    hass: core.HomeAssistant,
+    integrations: Iterable[loader.Integration],
+    platforms: set[str],
+) -> None:
+    """Import integrations in the executor before they are set up.
+
+    The integration and its platforms for the given entity domains are imported
+    once its requirements are processed. Setting up the integration waits for
+    the import to finish.
+    """
+    pre_imports: dict[str, asyncio.Task[None]] = hass.data.setdefault(
+        DATA_PRE_IMPORTS, {}
+    )
+    import_time: dict[str, timedelta] = hass.data.setdefault(DATA_IMPORT_TIME, {})
+    semaphore = asyncio.Semaphore(MAX_LOAD_CONCURRENTLY)
+
+    async def _async_pre_import(integration: loader.Integration) -> None:
+        """Import an integration once its requirements are processed."""
+        domain = integration.domain
+        try:
+            await requirements.async_get_integration_with_requirements(hass, domain)
+            async with semaphore:
+                with async_record_startup_phase(
+                    hass, "pre-import", "import", f"{domain} (executor)"
+                ):
+                    seconds = await hass.async_add_executor_job(
+                        _pre_import_integration, integration, platforms
+                    )
+            if seconds is not None:
+                import_time[domain] = timedelta(seconds=seconds)
+        except (HomeAssistantError, loader.LoaderError):
+            # Reported when the integration is set up
+            pass
+        finally:
+            del pre_imports[domain]
+
+    for integration in integrations:
+        if integration.domain not in pre_imports:
+            pre_imports[integration.domain] = hass.async_create_task(
+                _async_pre_import(integration), f"pre-import {integration.domain}"
+            )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -551,35 +656,36 @@ async def _async_set_up_integrations(
     # that will have to be loaded and start rightaway
     integration_cache: dict[str, loader.Integration] = {}
     to_resolve: set[str] = domains_to_setup
-    while to_resolve:
-        old_to_resolve: set[str] = to_resolve
-        to_resolve = set()
-
-        integrations_to_process = [
-            int_or_exc
-            for int_or_exc in (
-                await loader.async_get_integrations(hass, old_to_resolve)
-            ).values()
-            if isinstance(int_or_exc, loader.Integration)
-        ]
-        resolve_dependencies_tasks = [
-            itg.resolve_dependencies()
-            for itg in integrations_to_process
-            if not itg.all_dependencies_resolved
-        ]
-
-        if resolve_dependencies_tasks:
-            await asyncio.gather(*resolve_dependencies_tasks)
-
-        for itg in integrations_to_process:
-            integration_cache[itg.domain] = itg
-
-            for dep in itg.all_dependencies:
-                if dep in domains_to_setup:
-                    continue
-
-                domains_to_setup.add(dep)
-                to_resolve.add(dep)
+    with async_record_startup_phase(hass, "resolve integrations", "bootstrap"):
+        while to_resolve:
+            old_to_resolve: set[str] = to_resolve
+            to_resolve = set()
+
+            integrations_to_process = [
+                int_or_exc
+                for int_or_exc in (
+                    await loader.async_get_integrations(hass, old_to_resolve)
+                ).values()
+                if isinstance(int_or_exc, loader.Integration)
+            ]
+            resolve_dependencies_tasks = [
+                itg.resolve_dependencies()
+                for itg in integrations_to_process
+                if not itg.all_dependencies_resolved
+            ]
+
+            if resolve_dependencies_tasks:
+                await asyncio.gather(*resolve_dependencies_tasks)
+
+            for itg in integrations_to_process:
+                integration_cache[itg.domain] = itg
+
+                for dep in itg.all_dependencies:
+                    if dep in domains_to_setup:
+                        continue
+
+                    domains_to_setup.add(dep)
+                    to_resolve.add(dep)
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
@@ -590,22 +696,26 @@ async def _async_set_up_integrations(
     # Load logging as soon as possible
     if logging_domains := domains_to_setup & LOGGING_INTEGRATIONS:
         _LOGGER.info("Setting up logging: %s", logging_domains)
-        await async_setup_multi_components(hass, logging_domains, config)
+        with async_record_startup_phase(hass, "logging", "bootstrap"):
+            await async_setup_multi_components(hass, logging_domains, config)
 
     # Setup frontend
     if frontend_domains := domains_to_setup & FRONTEND_INTEGRATIONS:
         _LOGGER.info("Setting up frontend: %s", frontend_domains)
-        await async_setup_multi_components(hass, frontend_domains, config)
+        with async_record_startup_phase(hass, "frontend", "bootstrap"):
+            await async_setup_multi_components(hass, frontend_domains, config)
 
     # Setup recorder
     if recorder_domains := domains_to_setup & RECORDER_INTEGRATIONS:
         _LOGGER.info("Setting up recorder: %s", recorder_domains)
-        await async_setup_multi_components(hass, recorder_domains, config)
+        with async_record_startup_phase(hass, "recorder", "bootstrap"):
+            await async_setup_multi_components(hass, recorder_domains, config)
 
     # Start up debuggers. Start these first in case they want to wait.
     if debuggers := domains_to_setup & DEBUGGER_INTEGRATIONS:
         _LOGGER.debug("Setting up debuggers: %s", debuggers)
-        await async_setup_multi_components(hass, debuggers, config)
+        with async_record_startup_phase(hass, "debuggers", "bootstrap"):
+            await async_setup_multi_components(hass, debuggers, config)
 
     # calculate what components to setup in what stage
     stage_1_domains: set[str] = set()
@@ -648,7 +758,8 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                with async_record_startup_phase(hass, "stage 1", "bootstrap"):
+                    await async_setup_multi_components(hass, stage_1_domains, config)
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 1 - moving forward")
 
@@ -657,11 +768,21 @@ async def _async_set_up_integrations(
 
     if stage_2_domains:
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
+        _async_pre_import_integrations(
+            hass,
+            (
+                integration_cache[domain]
+                for domain in stage_2_domains
+                if domain in integration_cache
+            ),
+            domains_to_setup & BASE_PLATFORMS,
+        )
         try:
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                with async_record_startup_phase(hass, "stage 2", "bootstrap"):
+                    await async_setup_multi_components(hass, stage_2_domains, config)
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 2 - moving forward")
 
@@ -669,7 +790,8 @@ async def _async_set_up_integrations(
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
         async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
+            with async_record_startup_phase(hass, "wrap up", "bootstrap"):
+                await hass.async_block_till_done()
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
 
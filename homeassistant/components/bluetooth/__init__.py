@@ -45,6 +45,7 @@ from .api import (
     async_ble_device_from_address,
     async_discovered_service_info,
     async_get_advertisement_callback,
+    async_get_advertisements_callback,
     async_get_fallback_availability_interval,
     async_get_learned_advertising_interval,
     async_get_scanner,
@@ -89,6 +90,7 @@ __all__ = [
     "async_address_present",
     "async_ble_device_from_address",
     "async_discovered_service_info",
+    "async_get_advertisements_callback",
     "async_get_fallback_availability_interval",
     "async_get_learned_advertising_interval",
     "async_get_scanner",
@@ -199,6 +199,14 @@ def async_get_advertisement_callback(
     return _get_manager(hass).scanner_adv_received
 
 
+@hass_callback
+def async_get_advertisements_callback(
+    hass: HomeAssistant,
+) -> Callable[[list[BluetoothServiceInfoBleak]], None]:
+    """Get the callback for batches of advertisements."""
+    return _get_manager(hass).scanner_advs_received
+
+
 @hass_callback
 def async_get_learned_advertising_interval(
     hass: HomeAssistant, address: str
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Generator
+from collections.abc import Callable, Generator, Iterable
 from contextlib import contextmanager
 from dataclasses import dataclass
 import datetime
@@ -187,6 +187,7 @@ class BaseHaRemoteScanner(BaseHaScanner):
 
     __slots__ = (
         "_new_info_callback",
+        "_new_infos_callback",
         "_discovered_device_advertisement_datas",
         "_discovered_device_timestamps",
         "_details",
@@ -202,10 +203,13 @@ class BaseHaRemoteScanner(BaseHaScanner):
         new_info_callback: Callable[[BluetoothServiceInfoBleak], None],
         connector: HaBluetoothConnector | None,
         connectable: bool,
+        new_infos_callback: Callable[[list[BluetoothServiceInfoBleak]], None]
+        | None = None,
     ) -> None:
         """Initialize the scanner."""
         super().__init__(hass, scanner_id, name, connector)
         self._new_info_callback = new_info_callback
+        self._new_infos_callback = new_infos_callback
         self._discovered_device_advertisement_datas: dict[
             str, tuple[BLEDevice, AdvertisementData]
         ] = {}
@@ -305,6 +309,66 @@ class BaseHaRemoteScanner(BaseHaScanner):
         advertisement_monotonic_time: float,
     ) -> None:
         """Call the registered callback."""
+        self._new_info_callback(
+            self._async_service_info_from_advertisement(
+                address,
+                rssi,
+                local_name,
+                service_uuids,
+                service_data,
+                manufacturer_data,
+                tx_power,
+                details,
+                advertisement_monotonic_time,
+            )
+        )
+
+    @hass_callback
+    def _async_on_advertisements(
+        self,
+        advertisements: Iterable[
+            tuple[
+                str,
+                int,
+                str | None,
+                list[str],
+                dict[str, bytes],
+                dict[int, bytes],
+                int | None,
+                dict[Any, Any],
+                float,
+            ]
+        ],
+    ) -> None:
+        """Call the registered callback with a batch of advertisements.
+
+        The advertisements are tuples of the arguments of
+        _async_on_advertisement.
+        """
+        service_infos = [
+            self._async_service_info_from_advertisement(*advertisement)
+            for advertisement in advertisements
+        ]
+        if self._new_infos_callback is not None:
+            self._new_infos_callback(service_infos)
+            return
+        for service_info in service_infos:
+            self._new_info_callback(service_info)
+
+    @hass_callback
+    def _async_service_info_from_advertisement(
+        self,
+        address: str,
+        rssi: int,
+        local_name: str | None,
+        service_uuids: list[str],
+        service_data: dict[str, bytes],
+        manufacturer_data: dict[int, bytes],
+        tx_power: int | None,
+        details: dict[Any, Any],
+        advertisement_monotonic_time: float,
+    ) -> BluetoothServiceInfoBleak:
+        """Merge an advertisement into the discovered devices and return it."""
         self.scanning = not self._connecting
         self._last_detection = advertisement_monotonic_time
         try:
@@ -375,20 +439,18 @@ class BaseHaRemoteScanner(BaseHaScanner):
             advertisement_data,
         )
         self._discovered_device_timestamps[address] = advertisement_monotonic_time
-        self._new_info_callback(
-            BluetoothServiceInfoBleak(
-                name=local_name or address,
-                address=address,
-                rssi=rssi,
-                manufacturer_data=manufacturer_data,
-                service_data=service_data,
-                service_uuids=service_uuids,
-                source=self.source,
-                device=device,
-                advertisement=advertisement_data,
-                connectable=self.connectable,
-                time=advertisement_monotonic_time,
-            )
+        return BluetoothServiceInfoBleak(
+            name=local_name or address,
+            address=address,
+            rssi=rssi,
+            manufacturer_data=manufacturer_data,
+            service_data=service_data,
+            service_uuids=service_uuids,
+            source=self.source,
+            device=device,
+            advertisement=advertisement_data,
+            connectable=self.connectable,
+            time=advertisement_monotonic_time,
         )
 
     async def async_diagnostics(self) -> dict[str, Any]:
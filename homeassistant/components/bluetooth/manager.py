@@ -99,6 +99,18 @@ def _dispatch_bleak_callback(
         _LOGGER.exception("Error in callback: %s", callback)
 
 
+def _advertisement_data_changed(
+    old: BluetoothServiceInfoBleak, new: BluetoothServiceInfoBleak
+) -> bool:
+    """Return if the data of an advertisement changed."""
+    return (
+        new.manufacturer_data != old.manufacturer_data
+        or new.service_data != old.service_data
+        or new.service_uuids != old.service_uuids
+        or new.name != old.name
+    )
+
+
 class BluetoothManager:
     """Manage Bluetooth."""
 
@@ -434,6 +446,35 @@ class BluetoothManager:
             return False
         return True
 
+    @hass_callback
+    def scanner_advs_received(
+        self, service_infos: Iterable[BluetoothServiceInfoBleak]
+    ) -> None:
+        """Handle a batch of new advertisements from any scanner.
+
+        Advertisements of an address that repeat the data of its previous
+        advertisement in the batch are only handled once, with the newest
+        one, so matchers and callbacks run once per unique payload.
+        """
+        batch: list[BluetoothServiceInfoBleak] = []
+        positions: dict[str, int] = {}
+        for service_info in service_infos:
+            address = service_info.address
+            if (position := positions.get(address)) is not None:
+                previous = batch[position]
+                if (
+                    previous.source == service_info.source
+                    and previous.connectable == service_info.connectable
+                    and not _advertisement_data_changed(previous, service_info)
+                ):
+                    batch[position] = service_info
+                    continue
+            positions[address] = len(batch)
+            batch.append(service_info)
+
+        for service_info in batch:
+            self.scanner_adv_received(service_info)
+
     @hass_callback
     def scanner_adv_received(self, service_info: BluetoothServiceInfoBleak) -> None:
         """Handle a new advertisement from any scanner.
@@ -537,12 +578,7 @@ class BluetoothManager:
             not (connectable and not old_connectable_service_info)
             # Than check if advertisement data is the same
             and old_service_info
-            and not (
-                service_info.manufacturer_data != old_service_info.manufacturer_data
-                or service_info.service_data != old_service_info.service_data
-                or service_info.service_uuids != old_service_info.service_uuids
-                or service_info.name != old_service_info.name
-            )
+            and not _advertisement_data_changed(old_service_info, service_info)
         ):
             return
 
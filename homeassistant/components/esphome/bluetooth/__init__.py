@@ -9,6 +9,7 @@ from aioesphomeapi import APIClient, BluetoothProxyFeature
 from homeassistant.components.bluetooth import (
     HaBluetoothConnector,
     async_get_advertisement_callback,
+    async_get_advertisements_callback,
     async_register_scanner,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -89,7 +90,13 @@ async def async_connect_scanner(
         ),
     )
     scanner = ESPHomeScanner(
-        hass, source, entry.title, new_info_callback, connector, connectable
+        hass,
+        source,
+        entry.title,
+        new_info_callback,
+        connector,
+        connectable,
+        async_get_advertisements_callback(hass),
     )
     client_data.scanner = scanner
     if connectable:
@@ -38,11 +38,13 @@ class ESPHomeScanner(BaseHaRemoteScanner):
     ) -> None:
         """Call the registered callback."""
         now = MONOTONIC_TIME()
-        for adv in advertisements:
-            self._async_on_advertisement(
+        self._async_on_advertisements(
+            (
                 int_to_bluetooth_address(adv.address),
                 adv.rssi,
                 *parse_advertisement_data_tuple((adv.data,)),
                 {"address_type": adv.address_type},
                 now,
             )
+            for adv in advertisements
+        )
@@ -36,6 +36,7 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.json import JSON_DUMP
 from homeassistant.helpers.typing import EventType
+from homeassistant.util.async_ import run_callback_threadsafe
 import homeassistant.util.dt as dt_util
 
 from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
@@ -209,6 +210,45 @@ def _generate_websocket_response(
     )
 
 
+def _last_updated_ts(states: MutableMapping[str, list[dict[str, Any]]]) -> float:
+    """Return the last time a state was updated or 0 if there are no states."""
+    last_time_ts = 0.0
+    for state_list in states.values():
+        if (
+            state_list
+            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
+            > last_time_ts
+        ):
+            last_time_ts = cast(float, state_last_time)
+    return last_time_ts
+
+
+def _generate_final_response(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    states: MutableMapping[str, list[dict[str, Any]]],
+    last_time_ts: float,
+    send_empty: bool,
+) -> tuple[float, dt | None, str | None]:
+    """Generate the response which ends the historical states."""
+    if last_time_ts == 0:
+        # If we did not send any states ever, we need to send an empty response
+        # so the websocket client knows it should render/process/consume the
+        # data.
+        if not send_empty:
+            return last_time_ts, None, None
+        last_time_dt = end_time
+    else:
+        last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
+
+    return (
+        last_time_ts,
+        last_time_dt,
+        _generate_websocket_response(msg_id, start_time, last_time_dt, states),
+    )
+
+
 def _generate_historical_response(
     hass: HomeAssistant,
     msg_id: int,
@@ -237,51 +277,42 @@ def _generate_historical_response(
             True,
         ),
     )
-    last_time_ts = 0.0
-    for state_list in states.values():
-        if (
-            state_list
-            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
-            > last_time_ts
-        ):
-            last_time_ts = cast(float, state_last_time)
+    return _generate_final_response(
+        msg_id, start_time, end_time, states, _last_updated_ts(states), send_empty
+    )
 
-    if last_time_ts == 0:
-        # If we did not send any states ever, we need to send an empty response
-        # so the websocket client knows it should render/process/consume the
-        # data.
-        if not send_empty:
-            return last_time_ts, None, None
-        last_time_dt = end_time
-    else:
-        last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
 
-    return (
-        last_time_ts,
-        last_time_dt,
-        _generate_websocket_response(msg_id, start_time, last_time_dt, states),
-    )
+@callback
+def _async_send_chunk(connection: ActiveConnection, msg_id: int, payload: str) -> bool:
+    """Send a chunk of historical states unless the client unsubscribed."""
+    if msg_id not in connection.subscriptions:
+        return False
+    connection.send_message(payload)
+    return True
 
 
-async def _async_send_historical_states(
+def _send_historical_chunks(
     hass: HomeAssistant,
     connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
-) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
-    instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
+    chunk_size: int,
+) -> tuple[float, dt | None, str | None]:
+    """Send the historical states in chunks and generate the final response.
+
+    Each chunk is sent before the next one is read from the database
+    so the states are never all held in memory at once.
+    """
+    last_time_ts = 0.0
+    for states in history.get_significant_states_chunks(
         hass,
-        msg_id,
         start_time,
         end_time,
         entity_ids,
@@ -289,8 +320,70 @@ async def _async_send_historical_states(
         significant_changes_only,
         minimal_response,
         no_attributes,
-        send_empty,
+        chunk_size,
+    ):
+        last_time_ts = max(last_time_ts, _last_updated_ts(states))
+        payload = JSON_DUMP(messages.event_message(msg_id, {"states": states}))
+        if not run_callback_threadsafe(
+            hass.loop, _async_send_chunk, connection, msg_id, payload
+        ).result():
+            return last_time_ts, None, None
+    return _generate_final_response(
+        msg_id, start_time, end_time, {}, last_time_ts, send_empty
     )
+
+
+async def _async_send_historical_states(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    send_empty: bool,
+    chunk_size: int | None = None,
+) -> dt | None:
+    """Fetch history significant_states and send them to the client.
+
+    If chunk_size is set, the states are sent in event messages of at most
+    chunk_size states followed by a message without states which has the
+    start and end time.
+    """
+    instance = get_instance(hass)
+    if chunk_size:
+        last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+            _send_historical_chunks,
+            hass,
+            connection,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty,
+            chunk_size,
+        )
+    else:
+        last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty,
+        )
     if payload:
         connection.send_message(payload)
     return last_time_dt if last_time_ts != 0 else None
@@ -404,6 +497,7 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunk_size"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -443,6 +537,7 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    chunk_size: int | None = msg.get("chunk_size")
 
     if end_time and end_time <= utc_now:
         if (
@@ -469,6 +564,7 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            chunk_size,
         )
         return
 
@@ -533,6 +629,7 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        chunk_size,
     )
 
     if msg_id not in connection.subscriptions:
@@ -574,4 +671,5 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         send_empty=not last_event_time,
+        chunk_size=chunk_size,
     )
@@ -3,11 +3,11 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable, Coroutine, Iterable
-from functools import lru_cache
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
 import ssl
+import threading
 import time
 from typing import TYPE_CHECKING, Any
 import uuid
@@ -79,6 +79,7 @@ from .models import (
     PublishPayloadType,
     ReceiveMessage,
 )
+from .topic_trie import TopicTrie, topic_matches
 from .util import get_file_path, get_mqtt_data, mqtt_config_entry_enabled
 
 if TYPE_CHECKING:
@@ -93,6 +94,10 @@ INITIAL_SUBSCRIBE_COOLDOWN = 1.0
 SUBSCRIBE_COOLDOWN = 0.1
 UNSUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
+# Maximum number of topics to cache the matching subscriptions of
+MAX_MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+# Maximum number of received messages to handle in one event loop callback
+MAX_RECEIVED_MESSAGES_BATCH_SIZE = 1000
 
 MQTT_ENTRIES_NAMING_BLOG_URL = (
     "https://developers.home-assistant.io/blog/2023-057-21-change-naming-mqtt-entities/"
@@ -217,7 +222,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None] = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
@@ -381,12 +385,17 @@ class MQTT:
         self.conf = conf
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions: TopicTrie[Subscription] = TopicTrie()
+        self._matching_subscriptions_cache: dict[str, list[Subscription]] = {}
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
         # which has subscribed messages.
         self._retained_topics: dict[Subscription, set[str]] = {}
+        # Messages received by the paho thread that are not handled yet
+        self._received_messages: list[mqtt.MQTTMessage] = []
+        self._received_messages_lock = threading.Lock()
+        self._received_messages_scheduled = False
         self.connected = False
         self._ha_started = asyncio.Event()
         self._cleanup_on_unload: list[Callable[[], None]] = []
@@ -455,7 +464,7 @@ class MQTT:
         """Return the tracked subscriptions."""
         return [
             *chain.from_iterable(self._simple_subscriptions.values()),
-            *self._wildcard_subscriptions,
+            *self._wildcard_subscriptions.values(),
         ]
 
     def cleanup(self) -> None:
@@ -484,8 +493,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions or topic in self._wildcard_subscriptions
         )
 
     async def async_publish(
@@ -566,30 +575,25 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
-        if _is_simple_match(subscription.topic):
-            self._simple_subscriptions.setdefault(subscription.topic, []).append(
-                subscription
-            )
+        topic = subscription.topic
+        if _is_simple_match(topic):
+            self._simple_subscriptions.setdefault(topic, []).append(subscription)
         else:
-            self._wildcard_subscriptions.append(subscription)
+            self._wildcard_subscriptions.add(topic, subscription)
+        self._async_invalidate_matching_subscriptions(topic)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -599,9 +603,20 @@ class MQTT:
                 if not simple_subscriptions[topic]:
                     del simple_subscriptions[topic]
             else:
-                self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_subscriptions.remove(topic, subscription)
         except (KeyError, ValueError) as ex:
             raise HomeAssistantError("Can't remove subscription twice") from ex
+        self._async_invalidate_matching_subscriptions(topic)
+
+    @callback
+    def _async_invalidate_matching_subscriptions(self, topic_filter: str) -> None:
+        """Drop the cached matching subscriptions of the topics a filter matches."""
+        cache = self._matching_subscriptions_cache
+        if _is_simple_match(topic_filter):
+            cache.pop(topic_filter, None)
+            return
+        for topic in [topic for topic in cache if topic_matches(topic_filter, topic)]:
+            del cache[topic]
 
     @callback
     def _async_queue_subscriptions(
@@ -634,11 +649,8 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -648,7 +660,6 @@ class MQTT:
         def async_remove() -> None:
             """Remove subscription."""
             self._async_untrack_subscription(subscription)
-            self._matching_subscriptions.cache_clear()
             if subscription in self._retained_topics:
                 del self._retained_topics[subscription]
             # Only unsubscribe if currently connected
@@ -806,21 +817,76 @@ class MQTT:
     def _mqtt_on_message(
         self, _mqttc: mqtt.Client, _userdata: None, msg: mqtt.MQTTMessage
     ) -> None:
-        """Message received callback."""
-        self.loop.call_soon_threadsafe(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        Messages are handed to the event loop in batches, the loop is only
+        woken up when no batch is scheduled yet.
+        """
+        with self._received_messages_lock:
+            self._received_messages.append(msg)
+            if self._received_messages_scheduled:
+                return
+            self._received_messages_scheduled = True
+        self.loop.call_soon_threadsafe(self._mqtt_handle_received_messages)
+
+    @callback
+    def _mqtt_handle_received_messages(self) -> None:
+        """Handle a batch of the messages received by the paho thread."""
+        with self._received_messages_lock:
+            received_messages = self._received_messages
+            messages = received_messages[:MAX_RECEIVED_MESSAGES_BATCH_SIZE]
+            del received_messages[:MAX_RECEIVED_MESSAGES_BATCH_SIZE]
+            if not received_messages:
+                self._received_messages_scheduled = False
+        if received_messages:
+            # Give other callbacks a chance to run before the next batch
+            self.loop.call_soon(self._mqtt_handle_received_messages)
+        self._mqtt_handle_messages(messages)
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
+        """Return the subscriptions that match a topic."""
+        cache = self._matching_subscriptions_cache
+        if (subscriptions := cache.get(topic)) is not None:
+            return subscriptions
+        subscriptions = self._wildcard_subscriptions.match(topic)
         if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        for subscription in self._wildcard_subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
+            subscriptions[:0] = self._simple_subscriptions[topic]
+        if len(cache) >= MAX_MATCHING_SUBSCRIPTIONS_CACHE_SIZE:
+            # Evict the topic that was cached first
+            del cache[next(iter(cache))]
+        cache[topic] = subscriptions
         return subscriptions
 
     @callback
     def _mqtt_handle_message(self, msg: mqtt.MQTTMessage) -> None:
+        """Handle a received message."""
+        self._mqtt_handle_messages((msg,))
+
+    @callback
+    def _mqtt_handle_messages(self, messages: Iterable[mqtt.MQTTMessage]) -> None:
+        """Handle received messages.
+
+        The state writes the messages request are coalesced per entity. They
+        are written before a topic is handled again, so every value received
+        on a topic is written.
+        """
+        state_write_requests = self._mqtt_data.state_write_requests
+        topics: set[str] = set()
+        try:
+            for msg in messages:
+                if (topic := msg.topic) in topics:
+                    state_write_requests.process_write_state_requests()
+                    topics.clear()
+                topics.add(topic)
+                state_write_requests.message = msg
+                self._mqtt_dispatch_message(msg)
+        finally:
+            state_write_requests.message = None
+            state_write_requests.process_write_state_requests()
+
+    @callback
+    def _mqtt_dispatch_message(self, msg: mqtt.MQTTMessage) -> None:
+        """Run the jobs of the subscriptions that match a message."""
         _LOGGER.debug(
             "Received%s message on %s (qos=%s): %s",
             " retained" if msg.retain else "",
@@ -831,6 +897,9 @@ class MQTT:
         timestamp = dt_util.utcnow()
 
         subscriptions = self._matching_subscriptions(msg.topic)
+        # The subscribers share the decoded payload, which lets their value
+        # templates share the parsed JSON of it
+        decoded_payloads: dict[str, str] = {}
 
         for subscription in subscriptions:
             if msg.retain:
@@ -842,9 +911,13 @@ class MQTT:
                 self._retained_topics[subscription].add(msg.topic)
 
             payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
+            if (encoding := subscription.encoding) is not None:
                 try:
-                    payload = msg.payload.decode(subscription.encoding)
+                    if (decoded := decoded_payloads.get(encoding)) is None:
+                        decoded = decoded_payloads[encoding] = msg.payload.decode(
+                            encoding
+                        )
+                    payload = decoded
                 except (AttributeError, UnicodeDecodeError):
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
@@ -865,7 +938,6 @@ class MQTT:
                     timestamp,
                 ),
             )
-        self._mqtt_data.state_write_requests.process_write_state_requests(msg)
 
     def _mqtt_on_callback(
         self,
@@ -961,13 +1033,3 @@ def _raise_on_error(result_code: int) -> None:
 
     if result_code and (message := mqtt.error_string(result_code)):
         raise HomeAssistantError(f"Error talking to MQTT: {message}")
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
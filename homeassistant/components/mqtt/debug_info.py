@@ -233,11 +233,11 @@ def _info_for_trigger(
     return {"discovery_data": discovery_data, "trigger_key": trigger_key}
 
 
-def info_for_config_entry(hass: HomeAssistant) -> dict[str, list[Any]]:
+def info_for_config_entry(hass: HomeAssistant) -> dict[str, Any]:
     """Get debug info for all entities and triggers."""
 
     mqtt_data = get_mqtt_data(hass)
-    mqtt_info: dict[str, list[Any]] = {"entities": [], "triggers": []}
+    mqtt_info: dict[str, Any] = {"entities": [], "triggers": []}
 
     for entity_id in mqtt_data.debug_info_entities:
         mqtt_info["entities"].append(_info_for_entity(hass, entity_id))
@@ -245,6 +245,13 @@ def info_for_config_entry(hass: HomeAssistant) -> dict[str, list[Any]]:
     for trigger_key in mqtt_data.debug_info_triggers:
         mqtt_info["triggers"].append(_info_for_trigger(hass, trigger_key))
 
+    # Payloads the value templates parsed as JSON and parses they shared
+    payload_json_cache = mqtt_data.payload_json_cache
+    mqtt_info["payload_json"] = {
+        "parsed": payload_json_cache.parsed,
+        "reused": payload_json_cache.reused,
+    }
+
     return mqtt_info
 
 
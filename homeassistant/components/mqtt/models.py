@@ -19,6 +19,9 @@ from homeassistant.helpers import template
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.service_info.mqtt import ReceivePayloadType
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, TemplateVarsType
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
+
+from .const import DATA_MQTT
 
 if TYPE_CHECKING:
     from paho.mqtt.client import MQTTMessage
@@ -180,6 +183,37 @@ class MqttCommandTemplate:
         )
 
 
+class PayloadJsonCache:
+    """Cache of the JSON parsed from the last rendered payload.
+
+    The subscribers of a message receive the same decoded payload object,
+    so their value templates share a single parse of it.
+    """
+
+    __slots__ = ("_payload", "_value", "parsed", "reused")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._payload: ReceivePayloadType | None = None
+        self._value: Any = PayloadSentinel.NONE
+        self.parsed = 0
+        self.reused = 0
+
+    @callback
+    def json_loads(self, payload: ReceivePayloadType) -> Any:
+        """Return the JSON of a payload, PayloadSentinel.NONE if it is not JSON."""
+        if payload is self._payload:
+            self.reused += 1
+            return self._value
+        self.parsed += 1
+        self._payload = payload
+        try:
+            self._value = json_loads(payload)
+        except JSON_DECODE_EXCEPTIONS:
+            self._value = PayloadSentinel.NONE
+        return self._value
+
+
 class MqttValueTemplate:
     """Class for rendering MQTT value template with possible json values."""
 
@@ -234,6 +268,13 @@ class MqttValueTemplate:
                 )
             values[ATTR_THIS] = self._template_state
 
+        if (hass := self._value_template.hass) and (
+            mqtt_data := hass.data.get(DATA_MQTT)
+        ):
+            value_json = mqtt_data.payload_json_cache.json_loads(payload)
+            if value_json is not PayloadSentinel.NONE:
+                values["value_json"] = value_json
+
         if default is PayloadSentinel.NONE:
             _LOGGER.debug(
                 "Rendering incoming payload '%s' with variables %s and %s",
@@ -294,13 +335,15 @@ class EntityTopicState:
 
     def __init__(self) -> None:
         """Register topic."""
-        self.subscribe_calls: dict[str, Entity] = {}
+        self.subscribe_calls: dict[str, tuple[Entity, MQTTMessage | None]] = {}
+        # The message that is being handled
+        self.message: MQTTMessage | None = None
 
     @callback
-    def process_write_state_requests(self, msg: MQTTMessage) -> None:
+    def process_write_state_requests(self) -> None:
         """Process the write state requests."""
         while self.subscribe_calls:
-            _, entity = self.subscribe_calls.popitem()
+            _, (entity, msg) = self.subscribe_calls.popitem()
             try:
                 entity.async_write_ha_state()
             except Exception:  # pylint: disable=broad-except
@@ -308,14 +351,14 @@ class EntityTopicState:
                     "Exception raised when updating state of %s, topic: "
                     "'%s' with payload: %s",
                     entity.entity_id,
-                    msg.topic,
-                    msg.payload,
+                    msg.topic if msg else None,
+                    msg.payload if msg else None,
                 )
 
     @callback
     def write_state_request(self, entity: Entity) -> None:
         """Register write state request."""
-        self.subscribe_calls[entity.entity_id] = entity
+        self.subscribe_calls[entity.entity_id] = (entity, self.message)
 
 
 @dataclass
@@ -345,6 +388,7 @@ class MqttData:
     reload_handlers: dict[str, Callable[[], Coroutine[Any, Any, None]]] = field(
         default_factory=dict
     )
+    payload_json_cache: PayloadJsonCache = field(default_factory=PayloadJsonCache)
     state_write_requests: EntityTopicState = field(default_factory=EntityTopicState)
     subscriptions_to_restore: list[Subscription] = field(default_factory=list)
     tags: dict[str, dict[str, MQTTTagScanner]] = field(default_factory=dict)
@@ -0,0 +1,127 @@
+"""Match MQTT topics against the topic filters of subscriptions."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+MULTI_LEVEL_WILDCARD = "#"
+SINGLE_LEVEL_WILDCARD = "+"
+
+
+class _TopicNode(Generic[_T]):
+    """Node of a topic trie that holds one level of topic filters."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicNode[_T]] = {}
+        self.values: list[_T] = []
+
+
+class TopicTrie(Generic[_T]):
+    """Trie of topic filters that finds the values of the filters matching a topic.
+
+    Matching a topic only visits the levels of the filters that can match it
+    instead of testing every filter. Filters are added and removed in place.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicNode[_T] = _TopicNode()
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        node.values.append(value)
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value of a topic filter.
+
+        Raises KeyError or ValueError if the value was not added for the filter.
+        """
+        path: list[tuple[_TopicNode[_T], str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.values.remove(value)
+
+        # Prune the nodes that no longer lead to a value
+        for parent, level in reversed(path):
+            if node.values or node.children:
+                break
+            del parent.children[level]
+            node = parent
+
+    def __contains__(self, topic_filter: str) -> bool:
+        """Return if a value was added for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def values(self) -> Iterator[_T]:
+        """Iterate over the values of all topic filters."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.values
+            nodes.extend(node.children.values())
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of all topic filters that match a topic."""
+        matches: list[_T] = []
+        # Wildcards in the first level do not match topics starting with $
+        _match_node(self._root, topic.split("/"), 0, not topic.startswith("$"), matches)
+        return matches
+
+
+def _match_node(
+    node: _TopicNode[_T],
+    levels: list[str],
+    index: int,
+    wildcards: bool,
+    matches: list[_T],
+) -> None:
+    """Add the values of the filters below a node that match the topic levels."""
+    children = node.children
+    # A multi level wildcard also matches the parent level
+    if wildcards and (multi_level := children.get(MULTI_LEVEL_WILDCARD)):
+        matches.extend(multi_level.values)
+    if index == len(levels):
+        matches.extend(node.values)
+        return
+    if child := children.get(levels[index]):
+        _match_node(child, levels, index + 1, True, matches)
+    if wildcards and (single_level := children.get(SINGLE_LEVEL_WILDCARD)):
+        _match_node(single_level, levels, index + 1, True, matches)
+
+
+def topic_matches(topic_filter: str, topic: str) -> bool:
+    """Return if a topic filter matches a topic."""
+    filter_levels = topic_filter.split("/")
+    levels = topic.split("/")
+    if topic.startswith("$") and filter_levels[0] in (
+        MULTI_LEVEL_WILDCARD,
+        SINGLE_LEVEL_WILDCARD,
+    ):
+        return False
+    for index, filter_level in enumerate(filter_levels):
+        if filter_level == MULTI_LEVEL_WILDCARD:
+            return True
+        if index == len(levels):
+            return False
+        if filter_level not in (SINGLE_LEVEL_WILDCARD, levels[index]):
+            return False
+    return len(filter_levels) == len(levels)
@@ -22,6 +22,7 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.storage import async_get_write_statistics
 
 from .const import DOMAIN
 
@@ -35,6 +36,7 @@ SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
 SERVICE_LRU_STATS = "lru_stats"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
+SERVICE_LOG_STORAGE_STATS = "log_storage_stats"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -57,6 +59,7 @@ SERVICES = (
     SERVICE_LRU_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_STORAGE_STATS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -254,6 +257,22 @@ async def async_setup_entry(  # noqa: C901
             arepr.maxstring = original_maxstring
             arepr.maxother = original_maxother
 
+    @callback
+    def _async_log_storage_stats(call: ServiceCall) -> None:
+        """Log the write stats of all stores, most bytes written first."""
+        for key, statistics in sorted(
+            async_get_write_statistics(hass).items(),
+            key=lambda item: item[1].bytes_written,
+            reverse=True,
+        ):
+            _LOGGER.critical(
+                "Storage writes for %s: %s writes, %s skipped, %s bytes written",
+                key,
+                statistics.writes,
+                statistics.skipped_writes,
+                statistics.bytes_written,
+            )
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -348,6 +367,13 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_STORAGE_STATS,
+        _async_log_storage_stats,
+    )
+
     return True
 
 
@@ -0,0 +1,177 @@
+"""Write States and Events rows to the database in bulk."""
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Table, bindparam, func, insert, select
+from sqlalchemy.orm.session import Session
+
+from .db_schema import Events, States
+
+_STATES_TABLE: Table = States.__table__  # type: ignore[assignment]
+_EVENTS_TABLE: Table = Events.__table__  # type: ignore[assignment]
+
+_STATES_COLUMNS = tuple(
+    column.key for column in _STATES_TABLE.columns if column.key != "state_id"
+)
+_EVENTS_COLUMNS = tuple(
+    column.key for column in _EVENTS_TABLE.columns if column.key != "event_id"
+)
+
+_INSERT_STATES_RETURNING_STATE_ID = insert(_STATES_TABLE).returning(
+    _STATES_TABLE.c.state_id, sort_by_parameter_order=True
+)
+_INSERT_STATES = insert(_STATES_TABLE)
+_INSERT_EVENTS = insert(_EVENTS_TABLE)
+_SELECT_MAX_STATE_ID = select(func.max(_STATES_TABLE.c.state_id))
+_SELECT_STATE_IDS_AFTER = select(
+    _STATES_TABLE.c.state_id,
+    _STATES_TABLE.c.metadata_id,
+    _STATES_TABLE.c.entity_id,
+).where(_STATES_TABLE.c.state_id > bindparam("state_id"))
+
+
+def _state_to_row(dbstate: States) -> dict[str, Any]:
+    """Convert a States object to a row for a multi-row insert."""
+    row = {key: getattr(dbstate, key) for key in _STATES_COLUMNS}
+    if (old_state := dbstate.old_state) is not None:
+        row["old_state_id"] = old_state.state_id
+    if (state_attributes := dbstate.state_attributes) is not None:
+        row["attributes_id"] = state_attributes.attributes_id
+    if (states_meta := dbstate.states_meta_rel) is not None:
+        row["metadata_id"] = states_meta.metadata_id
+    return row
+
+
+def _state_key(dbstate: States) -> tuple[int | None, str | None]:
+    """Return the metadata_id and entity_id a state is written with."""
+    if (states_meta := dbstate.states_meta_rel) is not None:
+        return states_meta.metadata_id, dbstate.entity_id
+    return dbstate.metadata_id, dbstate.entity_id
+
+
+def _event_to_row(dbevent: Events) -> dict[str, Any]:
+    """Convert an Events object to a row for a multi-row insert."""
+    row = {key: getattr(dbevent, key) for key in _EVENTS_COLUMNS}
+    if (event_type := dbevent.event_type_rel) is not None:
+        row["event_type_id"] = event_type.event_type_id
+    if (event_data := dbevent.event_data_rel) is not None:
+        row["data_id"] = event_data.data_id
+    return row
+
+
+class BulkWriter:
+    """Accumulate States and Events for a commit and insert them in bulk.
+
+    The rows are never added to the session so they skip the unit of
+    work and identity map bookkeeping. The rows they link to (state
+    attributes, states meta, event data and event types) are still
+    added to the session and are flushed first so their ids are known.
+
+    If the dialect can return the generated state_ids in the order of
+    the parameters they are read from the insert, otherwise they are
+    selected after each layer of states is inserted.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bulk writer."""
+        self.use_returning = False
+        self.states: list[States] = []
+        self.events: list[Events] = []
+
+    def add_state(self, dbstate: States) -> None:
+        """Add a state to be inserted on the next write.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self.states.append(dbstate)
+
+    def add_event(self, dbevent: Events) -> None:
+        """Add an event to be inserted on the next write.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self.events.append(dbevent)
+
+    def write(self, session: Session) -> None:
+        """Flush the session and insert the pending rows.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        session.flush()
+        if self.states:
+            self._insert_states(session)
+        if self.events:
+            session.execute(_INSERT_EVENTS, [_event_to_row(e) for e in self.events])
+
+    def _insert_states(self, session: Session) -> None:
+        """Insert the pending states in layers.
+
+        A state can only link to an earlier state in the same commit once
+        that state has its state_id so each layer holds at most one state
+        per entity and is inserted with a single multi-row insert.
+        """
+        layers: list[list[States]] = []
+        depths: dict[int, int] = {}
+        key_depths: dict[tuple[int | None, str | None], int] = {}
+        for dbstate in self.states:
+            old_state = dbstate.old_state
+            depth = 0 if old_state is None else depths.get(id(old_state), -1) + 1
+            key = _state_key(dbstate)
+            # An entity that was removed and added again in the same
+            # commit has two states without an old state in this commit
+            depth = max(depth, key_depths.get(key, -1) + 1)
+            depths[id(dbstate)] = key_depths[key] = depth
+            if depth == len(layers):
+                layers.append([])
+            layers[depth].append(dbstate)
+
+        insert_layer = (
+            self._insert_layer_returning
+            if self.use_returning
+            else self._insert_layer_select_state_ids
+        )
+        for layer in layers:
+            insert_layer(session, layer)
+
+    def _insert_layer_returning(self, session: Session, layer: list[States]) -> None:
+        """Insert a layer of states and set the state_ids returned in order."""
+        state_ids = session.scalars(
+            _INSERT_STATES_RETURNING_STATE_ID,
+            [_state_to_row(dbstate) for dbstate in layer],
+        ).all()
+        for dbstate, state_id in zip(layer, state_ids):
+            dbstate.state_id = state_id
+
+    def _insert_layer_select_state_ids(
+        self, session: Session, layer: list[States]
+    ) -> None:
+        """Insert a layer of states and select the state_ids afterwards.
+
+        MySQL and MariaDB cannot return the generated state_ids in the
+        order of the parameters. The recorder is the only writer so every
+        row after the highest state_id before the insert belongs to the
+        layer, and a layer has at most one state per entity.
+        """
+        max_state_id = session.execute(_SELECT_MAX_STATE_ID).scalar() or 0
+        session.execute(_INSERT_STATES, [_state_to_row(dbstate) for dbstate in layer])
+        state_ids = {
+            (metadata_id, entity_id): state_id
+            for state_id, metadata_id, entity_id in session.execute(
+                _SELECT_STATE_IDS_AFTER, {"state_id": max_state_id}
+            )
+        }
+        for dbstate in layer:
+            dbstate.state_id = state_ids[_state_key(dbstate)]
+
+    def reset(self) -> None:
+        """Reset after the rows have been committed or rolled back.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self.states.clear()
+        self.events.clear()
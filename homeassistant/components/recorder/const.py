@@ -22,6 +22,15 @@ MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 ESTIMATED_QUEUE_ITEM_SIZE = 10240
 QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY = 0.65
 
+# Once the backlog reaches this percentage of the max backlog, state
+# changes for the same entity are coalesced before they are written
+COALESCE_BACKLOG_PERCENTAGE = 25
+# The number of tasks taken from the queue at once while coalescing
+MAX_COALESCE_TASKS = 5000
+# The commit interval is never stretched beyond this multiple while
+# the recorder is working through a backlog
+MAX_COMMIT_INTERVAL_MULTIPLIER = 6
+
 # The maximum number of rows (events) we purge in one delete statement
 
 # sqlite3 has a limit of 999 until version 3.32.0
@@ -29,7 +29,7 @@ from homeassistant.const import (
     EVENT_STATE_CHANGED,
     MATCH_ALL,
 )
-from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
 from homeassistant.helpers.event import (
     async_track_time_change,
     async_track_time_interval,
@@ -41,7 +41,9 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import migration, statistics
+from .bulk_writer import BulkWriter
 from .const import (
+    COALESCE_BACKLOG_PERCENTAGE,
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -51,6 +53,8 @@ from .const import (
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
     MARIADB_PYMYSQL_URL_PREFIX,
     MARIADB_URL_PREFIX,
+    MAX_COALESCE_TASKS,
+    MAX_COMMIT_INTERVAL_MULTIPLIER,
     MAX_QUEUE_BACKLOG_MIN_VALUE,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
@@ -214,7 +218,15 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
-
+        self._last_commit_time = time.monotonic()
+        self._tasks_since_commit = 0
+        self._processing_time_since_commit = 0.0
+        self._drain_rate = 0.0
+        self._coalesce_window_size = 0
+        self._coalescing = False
+        self._coalesced_state_changes = 0
+
+        self.bulk_writer = BulkWriter()
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
         self.event_data_manager = EventDataManager(self)
@@ -244,8 +256,12 @@ class Recorder(threading.Thread):
 
     @property
     def backlog(self) -> int:
-        """Return the number of items in the recorder backlog."""
-        return self._queue.qsize()
+        """Return the number of items in the recorder backlog.
+
+        Tasks taken from the queue to be coalesced that have not been
+        processed yet are included.
+        """
+        return self._queue.qsize() + self._coalesce_window_size
 
     @property
     def dialect_name(self) -> SupportedDialect | None:
@@ -703,6 +719,16 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_event_to_bulk_writer(self, dbevent: Events) -> None:
+        """Add an event to be inserted in bulk on the next commit."""
+        self._event_session_has_pending_writes = True
+        self.bulk_writer.add_event(dbevent)
+
+    def _add_state_to_bulk_writer(self, dbstate: States) -> None:
+        """Add a state to be inserted in bulk on the next commit."""
+        self._event_session_has_pending_writes = True
+        self.bulk_writer.add_state(dbstate)
+
     def _run(self) -> None:
         """Start processing events to save."""
         self.thread_id = threading.get_ident()
@@ -862,7 +888,64 @@ class Recorder(threading.Thread):
 
         self.stop_requested = False
         while not self.stop_requested:
-            self._guarded_process_one_task_or_recover(queue_.get())
+            task = queue_.get()
+            if queue_.qsize() >= self.max_backlog * COALESCE_BACKLOG_PERCENTAGE / 100:
+                self._process_tasks_coalescing_state_changes(task)
+                continue
+            if self._coalescing:
+                self._coalescing = False
+                _LOGGER.info(
+                    "The recorder caught up with the backlog after coalescing %s "
+                    "state changes",
+                    self._coalesced_state_changes,
+                )
+                self._coalesced_state_changes = 0
+            self._process_one_task_measured(task)
+
+    def _process_one_task_measured(self, task: RecorderTask) -> None:
+        """Process a task and measure the time spent on it.
+
+        Only the time spent processing tasks is used to measure the drain
+        rate so time waiting for an empty queue does not lower it.
+        """
+        self._tasks_since_commit += 1
+        start = time.monotonic()
+        self._guarded_process_one_task_or_recover(task)
+        self._processing_time_since_commit += time.monotonic() - start
+
+    def _process_tasks_coalescing_state_changes(self, first_task: RecorderTask) -> None:
+        """Take a window of tasks from the backlog and process them coalesced.
+
+        State changes that are superseded by a later state change of the
+        same entity in the window are dropped so the recorder can catch
+        up before the backlog reaches the point where it stops recording.
+        """
+        if not self._coalescing:
+            self._coalescing = True
+            _LOGGER.warning(
+                "The recorder backlog reached %s events; state changes for the "
+                "same entity will be coalesced until it catches up",
+                self.backlog,
+            )
+        queue_ = self._queue
+        tasks = [first_task]
+        with contextlib.suppress(queue.Empty):
+            while len(tasks) < MAX_COALESCE_TASKS:
+                tasks.append(queue_.get_nowait())
+        coalesced_tasks = _coalesce_state_changed_tasks(tasks)
+        coalesced = len(tasks) - len(coalesced_tasks)
+        self._coalesced_state_changes += coalesced
+        # The dropped state changes count as drained as well
+        self._tasks_since_commit += coalesced
+        self._coalesce_window_size = len(coalesced_tasks)
+        try:
+            for task in coalesced_tasks:
+                self._coalesce_window_size -= 1
+                self._process_one_task_measured(task)
+                if self.stop_requested:
+                    return
+        finally:
+            self._coalesce_window_size = 0
 
     def _pre_process_startup_tasks(self, startup_tasks: list[RecorderTask]) -> None:
         """Pre process startup tasks."""
@@ -1035,7 +1118,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_event_to_bulk_writer(dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1060,7 +1143,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_event_to_bulk_writer(dbevent)
 
     def _process_state_changed_event_into_session(self, event: Event) -> None:
         """Process a state_changed event into the session."""
@@ -1133,7 +1216,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        self._add_state_to_bulk_writer(dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1167,13 +1250,44 @@ class Recorder(threading.Thread):
                 tries += 1
                 time.sleep(self.db_retry_wait)
 
+    def _stretched_commit_interval(self) -> float | None:
+        """Return the commit interval to use while working through a backlog.
+
+        Returns None when there is no backlog to drain or it can be
+        drained within the configured commit interval.
+        """
+        if not (backlog := self.backlog) or not self._drain_rate:
+            return None
+        if (seconds_to_drain := backlog / self._drain_rate) <= self.commit_interval:
+            return None
+        return min(
+            seconds_to_drain, self.commit_interval * MAX_COMMIT_INTERVAL_MULTIPLIER
+        )
+
+    def _periodic_commit(self) -> None:
+        """Commit the event session unless the commit interval is stretched."""
+        if (interval := self._stretched_commit_interval()) and (
+            time.monotonic() - self._last_commit_time < interval
+        ):
+            return
+        self._commit_event_session_or_retry()
+
     def _commit_event_session(self) -> None:
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
 
+        self.bulk_writer.write(session)
         session.commit()
+        self.bulk_writer.reset()
         self._event_session_has_pending_writes = False
+        # Measure how fast the queue is drained so the commit
+        # interval can be stretched while working through a backlog
+        if processing_time := self._processing_time_since_commit:
+            self._drain_rate = self._tasks_since_commit / processing_time
+        self._last_commit_time = time.monotonic()
+        self._tasks_since_commit = 0
+        self._processing_time_since_commit = 0.0
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1204,6 +1318,7 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self.bulk_writer.reset()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1395,6 +1510,9 @@ class Recorder(threading.Thread):
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
+        self.bulk_writer.use_returning = (
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
@@ -1452,3 +1570,32 @@ class Recorder(threading.Thread):
         finally:
             self._stop_executor()
             self._close_connection()
+
+
+def _coalesce_state_changed_tasks(tasks: list[RecorderTask]) -> list[RecorderTask]:
+    """Drop attribute only changes that are superseded by a later one.
+
+    Only a state change that did not change the state itself is dropped, and
+    only when a later state change of the same entity follows it, so every
+    change of the state is still recorded. State changes are not coalesced
+    across tasks that are not events or across the removal of the entity.
+    """
+    coalesced: list[RecorderTask | None] = []
+    # entity_id -> index of the pending attribute only state change
+    pending: dict[str, int] = {}
+    for task in tasks:
+        if not isinstance(task, EventTask):
+            pending.clear()
+        elif task.event.event_type == EVENT_STATE_CHANGED:
+            entity_id: str = task.event.data["entity_id"]
+            new_state: State | None = task.event.data.get("new_state")
+            if (previous := pending.pop(entity_id, None)) is not None:
+                if new_state is not None:
+                    coalesced[previous] = None
+            if (
+                new_state is not None
+                and new_state.last_changed != new_state.last_updated
+            ):
+                pending[entity_id] = len(coalesced)
+        coalesced.append(task)
+    return [task for task in coalesced if task is not None]
@@ -1,21 +1,25 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections.abc import MutableMapping
+from collections.abc import Iterator, MutableMapping
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import HomeAssistant, State
+import homeassistant.util.dt as dt_util
 
 from ... import recorder
 from ..filters import Filters
+from ..models import StateColumns
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
+    get_full_significant_state_columns_with_session as _modern_get_full_significant_state_columns_with_session,
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_chunks as _modern_get_significant_states_chunks,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -24,9 +28,11 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "get_full_significant_state_columns_with_session",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_chunks",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -65,6 +71,36 @@ def get_full_significant_states_with_session(
     )
 
 
+def get_full_significant_state_columns_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    significant_changes_only: bool = True,
+) -> MutableMapping[str, StateColumns]:
+    """Return a dict of significant states during a time period as columns."""
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        return {
+            entity_id: StateColumns(
+                [state.state for state in states],
+                [dt_util.utc_to_timestamp(state.last_updated) for state in states],
+                [state.attributes for state in states],
+            )
+            for entity_id, states in get_full_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                significant_changes_only=significant_changes_only,
+            ).items()
+        }
+    return _modern_get_full_significant_state_columns_with_session(
+        hass, session, start_time, end_time, entity_ids, significant_changes_only
+    )
+
+
 def get_last_state_changes(
     hass: HomeAssistant, number_of_states: int, entity_id: str
 ) -> MutableMapping[str, list[State]]:
@@ -115,6 +151,48 @@ def get_significant_states(
     )
 
 
+def get_significant_states_chunks(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+) -> Iterator[dict[str, list[dict[str, Any]]]]:
+    """Yield the significant states during a time period in chunks."""
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        # The legacy schema is only used until the migration is done,
+        # return everything as a single chunk
+        if states := get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ):
+            yield cast(dict[str, list[dict[str, Any]]], states)
+        return
+    yield from _modern_get_significant_states_chunks(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        chunk_size,
+    )
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -30,11 +30,13 @@ from ..db_schema import SHARED_ATTR_OR_LEGACY_ATTRIBUTES, StateAttributes, State
 from ..filters import Filters
 from ..models import (
     LazyState,
+    StateColumns,
     datetime_to_timestamp_or_none,
     extract_metadata_ids,
     process_timestamp,
     row_to_compressed_state,
 )
+from ..models.state_attributes import decode_attributes_from_source
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
     LAST_CHANGED_KEY,
@@ -183,34 +185,26 @@ def _significant_states_stmt(
     ).order_by(unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts)
 
 
-def get_significant_states_with_session(
+def _significant_states_rows(
     hass: HomeAssistant,
     session: Session,
     start_time: datetime,
-    end_time: datetime | None = None,
-    entity_ids: list[str] | None = None,
-    filters: Filters | None = None,
-    include_start_time_state: bool = True,
-    significant_changes_only: bool = True,
-    minimal_response: bool = False,
-    no_attributes: bool = False,
-    compressed_state_format: bool = False,
-) -> MutableMapping[str, list[State | dict[str, Any]]]:
-    """Return states changes during UTC period start_time - end_time.
-
-    entity_ids is an optional iterable of entities to include in the results.
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    stream: bool = False,
+) -> tuple[Iterable[Row], dict[str, int | None], float | None] | None:
+    """Query the significant states during a period.
 
-    filters is an optional SQLAlchemy filter which will be applied to the database
-    queries unless entity_ids is given, in which case its ignored.
+    Returns the rows, the metadata_id of each entity_id and the
+    start time to use for the states at the start time, or None
+    if none of the entity_ids have been recorded.
 
-    Significant states are all states where there is a state change,
-    as well as all states from certain domains (for instance
-    thermostat so that we get current temperature in our graphs).
+    If stream is set, the rows of periods longer than a day are
+    fetched with yield_per instead of all at once.
     """
-    if filters is not None:
-        raise NotImplementedError("Filters are no longer supported")
-    if not entity_ids:
-        raise ValueError("entity_ids must be provided")
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -219,7 +213,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -257,9 +251,60 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+    return (
+        execute_stmt_lambda_element(
+            session, stmt, start_time if stream else None, end_time, orm_rows=False
+        ),
+        entity_id_to_metadata_id,
         start_time_ts if include_start_time_state else None,
+    )
+
+
+def get_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    filters: Filters | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> MutableMapping[str, list[State | dict[str, Any]]]:
+    """Return states changes during UTC period start_time - end_time.
+
+    entity_ids is an optional iterable of entities to include in the results.
+
+    filters is an optional SQLAlchemy filter which will be applied to the database
+    queries unless entity_ids is given, in which case its ignored.
+
+    Significant states are all states where there is a state change,
+    as well as all states from certain domains (for instance
+    thermostat so that we get current temperature in our graphs).
+    """
+    if filters is not None:
+        raise NotImplementedError("Filters are no longer supported")
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        significant_states := _significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    rows, entity_id_to_metadata_id, start_time_ts = significant_states
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
         entity_ids,
         entity_id_to_metadata_id,
         minimal_response,
@@ -268,6 +313,100 @@ def get_significant_states_with_session(
     )
 
 
+def get_significant_states_chunks(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+) -> Iterator[dict[str, list[dict[str, Any]]]]:
+    """Yield the significant states during a period in compressed state format.
+
+    The rows are streamed from the database and converted as they are
+    read, so only one chunk of at most chunk_size states is held in memory.
+    Chunks are ordered by entity and last_updated, the states of an entity
+    may be split over consecutive chunks.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            significant_states := _significant_states_rows(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+                stream=True,
+            )
+        ):
+            return
+        rows, entity_id_to_metadata_id, start_time_ts = significant_states
+        metadata_id_to_entity_id = {
+            v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+        }
+        state_idx = _FIELD_MAP["state"]
+        last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+        chunk: dict[str, list[dict[str, Any]]] = {}
+        chunk_states = 0
+        for metadata_id, group in groupby(rows, itemgetter(_FIELD_MAP["metadata_id"])):
+            entity_id = metadata_id_to_entity_id[metadata_id]
+            attr_cache: dict[str, dict[str, Any]] = {}
+            # With minimal response only the first state has attributes
+            # and states are only included when the state changed
+            minimal = (
+                minimal_response
+                and split_entity_id(entity_id)[0] not in NEED_ATTRIBUTE_DOMAINS
+            )
+            prev_state: str | None = None
+            ent_results: list[dict[str, Any]] | None = None
+            for idx, row in enumerate(group):
+                state = row[state_idx]
+                if not minimal:
+                    comp_state = row_to_compressed_state(
+                        row,
+                        attr_cache,
+                        start_time_ts,
+                        entity_id,
+                        state,
+                        row[last_updated_ts_idx],
+                        False,
+                    )
+                elif idx == 0:
+                    comp_state = row_to_compressed_state(
+                        row,
+                        attr_cache,
+                        start_time_ts,
+                        entity_id,
+                        state,
+                        row[last_updated_ts_idx],
+                        no_attributes,
+                    )
+                elif state == prev_state:
+                    continue
+                else:
+                    comp_state = {
+                        COMPRESSED_STATE_STATE: state,
+                        COMPRESSED_STATE_LAST_UPDATED: row[last_updated_ts_idx],
+                    }
+                prev_state = state
+                if ent_results is None:
+                    ent_results = chunk[entity_id] = []
+                ent_results.append(comp_state)
+                if (chunk_states := chunk_states + 1) >= chunk_size:
+                    yield chunk
+                    chunk = {}
+                    chunk_states = 0
+                    ent_results = None
+        if chunk:
+            yield chunk
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -301,6 +440,60 @@ def get_full_significant_states_with_session(
     )
 
 
+def get_full_significant_state_columns_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    significant_changes_only: bool = True,
+) -> MutableMapping[str, StateColumns]:
+    """Variant of get_full_significant_states_with_session returning columns.
+
+    No State is created for the rows and the attributes are only decoded
+    once for each distinct set of shared attributes.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        significant_states := _significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            True,
+            significant_changes_only,
+            False,
+        )
+    ):
+        return {}
+    rows, entity_id_to_metadata_id, _ = significant_states
+    # The states at the start time are selected with a last_updated_ts of 0
+    start_time_ts = dt_util.utc_to_timestamp(start_time)
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    # last_changed_ts is only selected when significant_changes_only is False
+    attributes_idx = 3 if significant_changes_only else 4
+    attr_cache: dict[str, dict[str, Any]] = {}
+    result: dict[str, StateColumns] = {}
+    for metadata_id, group in groupby(rows, itemgetter(0)):
+        states: list[str] = []
+        last_updated_ts: list[float] = []
+        attributes: list[dict[str, Any]] = []
+        for row in group:
+            states.append(row[1] or "")
+            last_updated_ts.append(row[2] or start_time_ts)
+            attributes.append(
+                decode_attributes_from_source(row[attributes_idx], attr_cache)
+            )
+        result[metadata_id_to_entity_id[metadata_id]] = StateColumns(
+            states, last_updated_ts, attributes
+        )
+    return result
+
+
 def _state_changed_during_period_stmt(
     start_time_ts: float,
     end_time_ts: float | None,
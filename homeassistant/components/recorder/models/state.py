@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime
 import logging
-from typing import Any
+from typing import Any, NamedTuple
 
 from sqlalchemy.engine.row import Row
 
@@ -33,6 +33,14 @@ def extract_metadata_ids(
     ]
 
 
+class StateColumns(NamedTuple):
+    """The states of an entity as columns, ordered by last_updated."""
+
+    state: list[str]
+    last_updated_ts: list[float]
+    attributes: list[dict[str, Any]]
+
+
 class LazyState(State):
     """A lazy version of core State after schema 31."""
 
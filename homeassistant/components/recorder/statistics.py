@@ -9,12 +9,27 @@ from datetime import datetime, timedelta
 from functools import lru_cache, partial
 from itertools import chain, groupby
 import logging
+import math
 from operator import itemgetter
 import re
 from statistics import mean
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Select,
+    and_,
+    bindparam,
+    case,
+    cast as sql_cast,
+    extract,
+    func,
+    lambda_stmt,
+    literal,
+    select,
+    text,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError, StatementError
 from sqlalchemy.orm.session import Session
@@ -1070,6 +1085,200 @@ def _reduce_statistics_per_month(
     )
 
 
+_PERIOD_START_END_FACTORIES: dict[
+    str,
+    Callable[
+        [],
+        tuple[Callable[[float, float], bool], Callable[[float], tuple[float, float]]],
+    ],
+] = {
+    "day": reduce_day_ts_factory,
+    "week": reduce_week_ts_factory,
+    "month": reduce_month_ts_factory,
+}
+
+# The UTC offset of the configured time zone is sampled at this interval
+# and searched for the exact time of the change when it differs
+_UTC_OFFSET_SAMPLE_SECONDS = 86400
+
+
+def _utc_offset(timestamp: float) -> float:
+    """Return the UTC offset in seconds of the configured time zone."""
+    offset = datetime.fromtimestamp(timestamp, tz=dt_util.DEFAULT_TIME_ZONE).utcoffset()
+    return offset.total_seconds() if offset else 0.0
+
+
+def _utc_offset_segments(start_ts: float, end_ts: float) -> list[tuple[float, float]]:
+    """Return the UTC offsets of the configured time zone between start and end.
+
+    Each item is the timestamp from which the offset applies and the offset
+    in seconds. The first item applies to everything before the second item.
+    """
+    segments = [(start_ts, _utc_offset(start_ts))]
+    sample_ts = start_ts
+    while sample_ts < end_ts:
+        next_sample_ts = min(sample_ts + _UTC_OFFSET_SAMPLE_SECONDS, end_ts)
+        if (offset := _utc_offset(next_sample_ts)) != segments[-1][1]:
+            # Find the first second with the new offset
+            low, high = math.floor(sample_ts), math.ceil(next_sample_ts)
+            while high - low > 1:
+                middle = (low + high) // 2
+                if _utc_offset(middle) == offset:
+                    high = middle
+                else:
+                    low = middle
+            segments.append((high, offset))
+        sample_ts = next_sample_ts
+    return segments
+
+
+def _local_period_key(
+    dialect_name: SupportedDialect,
+    period: str,
+    start_ts: float,
+    end_ts: float,
+) -> ColumnElement[Any]:
+    """Return an expression for the local day, week or month of a statistic."""
+    segments = _utc_offset_segments(start_ts, end_ts)
+    utc_offset: ColumnElement[Any] | float = segments[-1][1]
+    if len(segments) > 1:
+        utc_offset = case(
+            *(
+                (Statistics.start_ts < segment_start_ts, offset)
+                for (_, offset), (segment_start_ts, _) in zip(segments, segments[1:])
+            ),
+            else_=segments[-1][1],
+        )
+    local_ts = Statistics.start_ts + utc_offset
+
+    if period == "month":
+        if dialect_name == SupportedDialect.SQLITE:
+            return func.strftime("%Y%m", local_ts, "unixepoch")
+        if dialect_name == SupportedDialect.POSTGRESQL:
+            return func.to_char(
+                func.timezone("UTC", func.to_timestamp(local_ts)), "YYYYMM"
+            )
+        return extract(
+            "year_month",
+            func.timestampadd(
+                text("SECOND"), func.floor(local_ts), literal("1970-01-01")
+            ),
+        )
+
+    def _floor(value: ColumnElement[Any]) -> ColumnElement[Any]:
+        """Floor a positive value."""
+        # Truncating a positive value is the same as flooring it, which
+        # avoids depending on the optional math functions in SQLite
+        if dialect_name == SupportedDialect.SQLITE:
+            return sql_cast(value, Integer)
+        return func.floor(value)
+
+    local_day = _floor(local_ts / 86400)
+    if period == "day":
+        return local_day
+    # 1970-01-01 was a Thursday, shift by 3 days to have weeks start on Monday
+    return _floor((local_day + 3) / 7)
+
+
+def _reduced_statistics_during_period(
+    session: Session,
+    dialect_name: SupportedDialect,
+    period: str,
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> Sequence[Row]:
+    """Return statistics reduced to days, weeks or months by the database."""
+    start_time_ts = start_time.timestamp()
+    if end_time is not None:
+        last_start_ts: float | None = end_time.timestamp()
+    else:
+        # The UTC offsets must be known up to the last statistic
+        stmt = select(func.max(Statistics.start_ts))
+        if metadata_ids:
+            stmt = stmt.filter(Statistics.metadata_id.in_(metadata_ids))
+        last_start_ts = session.execute(stmt).scalar()
+    if last_start_ts is None:
+        return []
+    return session.execute(
+        _generate_reduced_statistics_during_period_stmt(
+            dialect_name,
+            period,
+            start_time_ts,
+            end_time,
+            last_start_ts,
+            metadata_ids,
+            types,
+        )
+    ).all()
+
+
+def _generate_reduced_statistics_during_period_stmt(
+    dialect_name: SupportedDialect,
+    period: str,
+    start_time_ts: float,
+    end_time: datetime | None,
+    last_start_ts: float,
+    metadata_ids: list[int] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> Select:
+    """Prepare a database query for statistics reduced to days, weeks or months.
+
+    The hourly statistics are grouped by the local period in the database. The
+    start_ts of each row is the start_ts of the first hourly statistic in the
+    period, and last_reset, state and sum are the values of the last one.
+    """
+    period_key = _local_period_key(dialect_name, period, start_time_ts, last_start_ts)
+    columns = [
+        Statistics.metadata_id,
+        func.min(Statistics.start_ts).label("start_ts"),
+        func.max(Statistics.start_ts).label("last_start_ts"),
+    ]
+    if "mean" in types:
+        columns.append(func.avg(Statistics.mean).label("mean"))
+    if "min" in types:
+        columns.append(func.min(Statistics.min).label("min"))
+    if "max" in types:
+        columns.append(func.max(Statistics.max).label("max"))
+    periods = select(*columns).filter(Statistics.start_ts >= start_time_ts)
+    if end_time is not None:
+        end_time_ts = end_time.timestamp()
+        periods = periods.filter(Statistics.start_ts < end_time_ts)
+    if metadata_ids:
+        periods = periods.filter(Statistics.metadata_id.in_(metadata_ids))
+    periods_subquery = periods.group_by(Statistics.metadata_id, period_key).subquery()
+
+    stmt = select(
+        periods_subquery.c.metadata_id,
+        periods_subquery.c.start_ts,
+        *(periods_subquery.c[key] for key in ("mean", "min", "max") if key in types),
+    ).select_from(periods_subquery)
+    if last_columns := [
+        getattr(Statistics, _type_column_mapping[key])
+        for key in ("last_reset", "state", "sum")
+        if key in types
+    ]:
+        stmt = stmt.add_columns(*last_columns).join(
+            Statistics,
+            and_(
+                Statistics.metadata_id == periods_subquery.c.metadata_id,
+                Statistics.start_ts == periods_subquery.c.last_start_ts,
+            ),
+        )
+    return stmt.order_by(periods_subquery.c.metadata_id, periods_subquery.c.start_ts)
+
+
+def _set_period_start_end(
+    result: dict[str, list[StatisticsRow]],
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> None:
+    """Set the start and end of reduced statistics to the start and end of the period."""
+    for rows in result.values():
+        for row in rows:
+            row["start"], row["end"] = period_start_end(row["start"])
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1695,12 +1904,23 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    # Reduce the hourly statistics in the database when the dialect
+    # is known, else they are reduced in Python below
+    period_start_end: Callable[[float], tuple[float, float]] | None = None
+    if (dialect_name := get_instance(hass).dialect_name) and (
+        period_factory := _PERIOD_START_END_FACTORIES.get(period)
+    ):
+        _, period_start_end = period_factory()
+        stats = _reduced_statistics_during_period(
+            session, dialect_name, period, start_time, end_time, metadata_ids, types
+        )
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
     if not stats:
         return {}
@@ -1718,13 +1938,16 @@ def _statistics_during_period_with_session(
         types,
     )
 
-    if period == "day":
+    if period_start_end is not None:
+        _set_period_start_end(result, period_start_end)
+
+    elif period == "day":
         result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
+    elif period == "week":
         result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
+    elif period == "month":
         result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
@@ -302,7 +302,7 @@ class CommitTask(RecorderTask):
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
         # pylint: disable-next=[protected-access]
-        instance._commit_event_session_or_retry()
+        instance._periodic_commit()
 
 
 @dataclass(slots=True)
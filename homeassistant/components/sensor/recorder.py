@@ -2,12 +2,11 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, MutableMapping
+from collections.abc import Callable, MutableMapping
 import datetime
-import itertools
 import logging
 import math
-from typing import Any
+from typing import Any, NamedTuple
 
 from sqlalchemy.orm.session import Session
 
@@ -19,6 +18,7 @@ from homeassistant.components.recorder import (
     util as recorder_util,
 )
 from homeassistant.components.recorder.models import (
+    StateColumns,
     StatisticData,
     StatisticMetaData,
     StatisticResult,
@@ -65,6 +65,18 @@ WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
 
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=dt_util.UTC)
+
+
+class _FloatColumns(NamedTuple):
+    """The states of an entity with a float value, as columns."""
+
+    values: list[float]
+    # last_updated in microseconds since the epoch
+    timestamps: list[int]
+    attributes: list[dict[str, Any]]
+    states: list[str]
+
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     """Get the current state of all sensors for which to compile statistics."""
@@ -78,43 +90,46 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     ]
 
 
-def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
-) -> float:
+def _timestamp_to_microseconds(timestamp: float) -> int:
+    """Convert a timestamp to whole microseconds.
+
+    The timestamp is rounded the same way as datetime.fromtimestamp does.
+    """
+    fraction, seconds = math.modf(timestamp)
+    return int(seconds) * 1_000_000 + round(fraction * 1_000_000)
+
+
+def _microseconds_to_datetime(microseconds: int) -> datetime.datetime:
+    """Convert whole microseconds since the epoch to a datetime."""
+    return _EPOCH + datetime.timedelta(microseconds=microseconds)
+
+
+def _time_weighted_average(fstates: _FloatColumns, start_us: int, end_us: int) -> float:
     """Calculate a time weighted average.
 
     The average is calculated by weighting the states by duration in seconds between
-    state changes.
+    state changes. Times are in microseconds to give the same result as when
+    subtracting datetimes.
     Note: there's no interpolation of values between state changes.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
+    values = fstates.values
+    timestamps = fstates.timestamps
+    # The recorder will give us the last known state, which may be well
+    # before the requested start time for the statistics. Adjust the start
+    # time, if there was no last known state.
+    start_us = old_start_us = max(start_us, timestamps[0])
     accumulated = 0.0
 
-    for fstate, state in fstates:
-        # The recorder will give us the last known state, which may be well
-        # before the requested start time for the statistics
-        start_time = start if state.last_updated < start else state.last_updated
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
-        else:
-            duration = start_time - old_start_time
-            # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
-
-        old_fstate = fstate
-        old_start_time = start_time
-
-    if old_fstate is not None:
-        # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
-
-    period_seconds = (end - start).total_seconds()
-    if period_seconds == 0:
+    for idx in range(1, len(values)):
+        start_time_us = max(start_us, timestamps[idx])
+        # Accumulate the value, weighted by duration until next state change
+        accumulated += values[idx - 1] * ((start_time_us - old_start_us) / 1_000_000)
+        old_start_us = start_time_us
+
+    # Accumulate the value, weighted by duration until end of the period
+    accumulated += values[-1] * ((end_us - old_start_us) / 1_000_000)
+
+    if (period_us := end_us - start_us) == 0:
         # If the only state changed that happened was at the exact moment
         # at the end of the period, we can't calculate a meaningful average
         # so we return 0.0 since it represents a time duration smaller than
@@ -122,12 +137,24 @@ def _time_weighted_average(
         # column schema in the database is incorrect but it is actually possible
         # to happen if the state change event fired at the exact microsecond
         return 0.0
-    return accumulated / period_seconds
+    return accumulated / (period_us / 1_000_000)
 
 
-def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
+def _float_columns_to_state(entity_id: str, fstates: _FloatColumns, idx: int) -> State:
+    """Create a State from a row of the float columns."""
+    return State(
+        entity_id,
+        fstates.states[idx],
+        fstates.attributes[idx],
+        last_updated=_microseconds_to_datetime(fstates.timestamps[idx]),
+    )
+
+
+def _get_units(fstates: _FloatColumns) -> set[str | None]:
     """Return a set of all units."""
-    return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
+    return {
+        attributes.get(ATTR_UNIT_OF_MEASUREMENT) for attributes in fstates.attributes
+    }
 
 
 def _equivalent_units(units: set[str | None]) -> bool:
@@ -156,27 +183,29 @@ def _float_or_none(state: str) -> float | None:
         return None
 
 
-def _entity_history_to_float_and_state(
-    entity_history: Iterable[State],
-) -> list[tuple[float, State]]:
-    """Return a list of (float, state) tuples for the given entity."""
-    return [
-        (fstate, state)
-        for state in entity_history
-        if (fstate := _float_or_none(state.state)) is not None
-    ]
+def _entity_history_to_float_columns(entity_history: StateColumns) -> _FloatColumns:
+    """Return the states of the given entity with a float value."""
+    fstates = _FloatColumns([], [], [], [])
+    for state, last_updated_ts, attributes in zip(*entity_history):
+        if (fstate := _float_or_none(state)) is None:
+            continue
+        fstates.values.append(fstate)
+        fstates.timestamps.append(_timestamp_to_microseconds(last_updated_ts))
+        fstates.attributes.append(attributes)
+        fstates.states.append(state)
+    return fstates
 
 
 def _normalize_states(
     hass: HomeAssistant,
     old_metadatas: dict[str, tuple[int, StatisticMetaData]],
-    fstates: list[tuple[float, State]],
+    fstates: _FloatColumns,
     entity_id: str,
-) -> tuple[str | None, list[tuple[float, State]]]:
+) -> tuple[str | None, _FloatColumns | None]:
     """Normalize units."""
     state_unit: str | None = None
     statistics_unit: str | None
-    state_unit = fstates[0][1].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    state_unit = fstates.attributes[0].get(ATTR_UNIT_OF_MEASUREMENT)
     old_metadata = old_metadatas[entity_id][1] if entity_id in old_metadatas else None
     if not old_metadata:
         # We've not seen this sensor before, the first valid state determines the unit
@@ -212,17 +241,23 @@ def _normalize_states(
                     extra,
                     LINK_DEV_STATISTICS,
                 )
-            return None, []
-        state_unit = fstates[0][1].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+            return None, None
+        state_unit = fstates.attributes[0].get(ATTR_UNIT_OF_MEASUREMENT)
         return state_unit, fstates
 
+    units = [
+        attributes.get(ATTR_UNIT_OF_MEASUREMENT) for attributes in fstates.attributes
+    ]
+    if units.count(statistics_unit) == len(units):
+        # All states are in the unit of the statistics, nothing to convert
+        return statistics_unit, fstates
+
     converter = statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER[statistics_unit]
-    valid_fstates: list[tuple[float, State]] = []
+    valid_fstates = _FloatColumns([], [], [], [])
     convert: Callable[[float], float]
     last_unit: str | None | object = object()
 
-    for fstate, state in fstates:
-        state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    for idx, state_unit in enumerate(units):
         # Exclude states with unsupported unit from statistics
         if state_unit not in converter.VALID_UNITS:
             if WARN_UNSUPPORTED_UNIT not in hass.data:
@@ -249,8 +284,13 @@ def _normalize_states(
             convert = converter.converter_factory(state_unit, statistics_unit)
             last_unit = state_unit
 
-        valid_fstates.append((convert(fstate), state))
+        valid_fstates.values.append(convert(fstates.values[idx]))
+        valid_fstates.timestamps.append(fstates.timestamps[idx])
+        valid_fstates.attributes.append(fstates.attributes[idx])
+        valid_fstates.states.append(fstates.states[idx])
 
+    if not valid_fstates.values:
+        return statistics_unit, None
     return statistics_unit, valid_fstates
 
 
@@ -411,6 +451,8 @@ def _compile_statistics(  # noqa: C901
 ) -> statistics.PlatformCompiledStatistics:
     """Compile statistics for all entities during start-end."""
     result: list[StatisticResult] = []
+    start_us = _timestamp_to_microseconds(dt_util.utc_to_timestamp(start))
+    end_us = _timestamp_to_microseconds(dt_util.utc_to_timestamp(end))
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
@@ -418,9 +460,9 @@ def _compile_statistics(  # noqa: C901
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
-    history_list: MutableMapping[str, list[State]] = {}
+    history_list: MutableMapping[str, StateColumns] = {}
     if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
+        history_list = history.get_full_significant_state_columns_with_session(
             hass,
             session,
             start - datetime.timedelta.resolution,
@@ -434,7 +476,7 @@ def _compile_statistics(  # noqa: C901
         if "sum" not in wanted_statistics[i.entity_id]
     ]
     if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
+        _history_list = history.get_full_significant_state_columns_with_session(
             hass,
             session,
             start - datetime.timedelta.resolution,
@@ -443,14 +485,19 @@ def _compile_statistics(  # noqa: C901
         )
         history_list = {**history_list, **_history_list}
 
-    entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
+    entities_with_float_states: dict[str, _FloatColumns] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
-        # If there are no recent state changes, the sensor's state may already be pruned
-        # from the recorder. Get the state from the state machine instead.
-        if not (entity_history := history_list.get(entity_id, [_state])):
-            continue
-        if not (float_states := _entity_history_to_float_and_state(entity_history)):
+        if not (entity_history := history_list.get(entity_id)):
+            # If there are no recent state changes, the sensor's state may already
+            # be pruned from the recorder. Get the state from the state machine instead.
+            entity_history = StateColumns(
+                [_state.state],
+                [dt_util.utc_to_timestamp(_state.last_updated)],
+                [_state.attributes],
+            )
+        float_states = _entity_history_to_float_columns(entity_history)
+        if not float_states.values:
             continue
         entities_with_float_states[entity_id] = float_states
 
@@ -461,7 +508,7 @@ def _compile_statistics(  # noqa: C901
     old_metadatas = statistics.get_metadata_with_session(
         get_instance(hass), session, statistic_ids=set(entities_with_float_states)
     )
-    to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
+    to_process: list[tuple[str, str | None, str, _FloatColumns]] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
@@ -527,22 +574,12 @@ def _compile_statistics(  # noqa: C901
         # Make calculations
         stat: StatisticData = {"start": start}
         if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(
-                    zip(*valid_float_states),  # type: ignore[typeddict-item]
-                    1,
-                )
-            )
+            stat["max"] = max(valid_float_states.values)
         if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(
-                    zip(*valid_float_states),  # type: ignore[typeddict-item]
-                    1,
-                )
-            )
+            stat["min"] = min(valid_float_states.values)
 
         if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            stat["mean"] = _time_weighted_average(valid_float_states, start_us, end_us)
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
@@ -560,13 +597,14 @@ def _compile_statistics(  # noqa: C901
                 new_state = old_state = last_stat.get("state")
                 _sum = last_stat.get("sum") or 0.0
 
-            for fstate, state in valid_float_states:
+            for idx, fstate in enumerate(valid_float_states.values):
                 reset = False
                 if (
                     state_class != SensorStateClass.TOTAL_INCREASING
                     and (
                         last_reset := _last_reset_as_utc_isoformat(
-                            state.attributes.get("last_reset"), entity_id
+                            valid_float_states.attributes[idx].get("last_reset"),
+                            entity_id,
                         )
                     )
                     != old_last_reset
@@ -601,8 +639,20 @@ def _compile_statistics(  # noqa: C901
                     )
                 elif state_class == SensorStateClass.TOTAL_INCREASING:
                     try:
-                        if old_state is None or reset_detected(
-                            hass, entity_id, fstate, new_state, state
+                        if old_state is None or (
+                            # Only a dip or a negative value may need a warning
+                            # or be a reset, avoid creating a State otherwise
+                            new_state is not None
+                            and (fstate < new_state or fstate < 0)
+                            and reset_detected(
+                                hass,
+                                entity_id,
+                                fstate,
+                                new_state,
+                                _float_columns_to_state(
+                                    entity_id, valid_float_states, idx
+                                ),
+                            )
                         ):
                             reset = True
                             _LOGGER.info(
@@ -614,7 +664,9 @@ def _compile_statistics(  # noqa: C901
                                 entity_id,
                                 new_state,
                                 fstate,
-                                state.last_updated.isoformat(),
+                                _microseconds_to_datetime(
+                                    valid_float_states.timestamps[idx]
+                                ).isoformat(),
                             )
                     except HomeAssistantError:
                         continue
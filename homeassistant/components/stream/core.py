@@ -7,6 +7,7 @@ from collections.abc import Callable, Coroutine, Iterable
 import datetime
 from enum import IntEnum
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 from aiohttp import web
@@ -21,12 +22,13 @@ from homeassistant.util.decorator import Registry
 from .const import (
     ATTR_STREAMS,
     DOMAIN,
+    KEYFRAME_IMAGE_TTL,
     SEGMENT_DURATION_ADJUSTER,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
 
 if TYPE_CHECKING:
-    from av import CodecContext, Packet
+    from av import CodecContext, Packet, VideoFrame
 
     from homeassistant.components.camera import DynamicStreamSettings
 
@@ -422,10 +424,12 @@ class KeyFrameConverter:
         the worker thread sets a packet
         get_image is called from the main asyncio loop
         get_image schedules _generate_image in an executor thread
-        _generate_image will try to create an image from the packet
+        _generate_image will try to decode the packet into a frame
         _generate_image will clear the packet, so there will only be one attempt per packet
-    If successful, self._image will be updated and returned by get_image
-    If unsuccessful, get_image will return the previous image
+    If successful, the frame replaces the previous frame. The jpeg images of a frame
+    are cached by size and orientation for KEYFRAME_IMAGE_TTL seconds, so consumers
+    polling the same stream share one decode and one scale per keyframe.
+    If unsuccessful, get_image will return an image of the previous frame
     """
 
     def __init__(
@@ -444,7 +448,9 @@ class KeyFrameConverter:
         self._packet: Packet = None
         self._event: asyncio.Event = asyncio.Event()
         self._hass = hass
-        self._image: bytes | None = None
+        self._frame: VideoFrame | None = None
+        # Images of the frame by width, height and orientation, with their time
+        self._images: dict[tuple[int | None, int | None, int], tuple[bytes, float]] = {}
         self._turbojpeg = TurboJPEGSingleton.instance()
         self._lock = asyncio.Lock()
         self._codec_context: CodecContext | None = None
@@ -483,6 +489,14 @@ class KeyFrameConverter:
         """Transform image to a given orientation."""
         return TRANSFORM_IMAGE_FUNCTION[orientation](image)
 
+    def _image_key(
+        self, width: int | None, height: int | None
+    ) -> tuple[int | None, int | None, int]:
+        """Return the cache key of an image."""
+        if not (width and height):
+            width = height = None
+        return (width, height, self._dynamic_stream_settings.orientation)
+
     def _generate_image(self, width: int | None, height: int | None) -> None:
         """Generate the keyframe image.
 
@@ -491,10 +505,30 @@ class KeyFrameConverter:
         at a time per instance.
         """
 
-        if not (self._turbojpeg and self._packet and self._codec_context):
+        if not self._turbojpeg:
+            return
+        if self._packet and self._codec_context:
+            packet = self._packet
+            self._packet = None
+            if frame := self._decode_packet(packet):
+                self._frame = frame
+                self._images.clear()
+        if not (frame := self._frame):
+            return
+        key = self._image_key(width, height)
+        if key in self._images:
             return
-        packet = self._packet
-        self._packet = None
+        if key[0] and key[1]:
+            if key[2] >= 5:
+                frame = frame.reformat(width=key[1], height=key[0])
+            else:
+                frame = frame.reformat(width=key[0], height=key[1])
+        bgr_array = self.transform_image(frame.to_ndarray(format="bgr24"), key[2])
+        self._images[key] = (bytes(self._turbojpeg.encode(bgr_array)), time.monotonic())
+
+    def _decode_packet(self, packet: Packet) -> VideoFrame | None:
+        """Decode a keyframe packet into a frame."""
+        assert self._codec_context
         for _ in range(2):  # Retry once if codec context needs to be flushed
             try:
                 # decode packet (flush afterwards)
@@ -510,19 +544,8 @@ class KeyFrameConverter:
                 self._codec_context.open()
         else:
             _LOGGER.debug("Unable to decode keyframe")
-            return
-        if frames:
-            frame = frames[0]
-            if width and height:
-                if self._dynamic_stream_settings.orientation >= 5:
-                    frame = frame.reformat(width=height, height=width)
-                else:
-                    frame = frame.reformat(width=width, height=height)
-            bgr_array = self.transform_image(
-                frame.to_ndarray(format="bgr24"),
-                self._dynamic_stream_settings.orientation,
-            )
-            self._image = bytes(self._turbojpeg.encode(bgr_array))
+            return None
+        return frames[0] if frames else None
 
     async def async_get_image(
         self,
@@ -537,5 +560,18 @@ class KeyFrameConverter:
             self._event.clear()
             await self._event.wait()
         async with self._lock:
-            await self._hass.async_add_executor_job(self._generate_image, width, height)
-        return self._image
+            now = time.monotonic()
+            for expired_key in [
+                key
+                for key, (_, created) in self._images.items()
+                if now - created > KEYFRAME_IMAGE_TTL
+            ]:
+                del self._images[expired_key]
+            key = self._image_key(width, height)
+            if self._packet or key not in self._images:
+                await self._hass.async_add_executor_job(
+                    self._generate_image, width, height
+                )
+            if image := self._images.get(key):
+                return image[0]
+            return None
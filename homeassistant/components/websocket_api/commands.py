@@ -17,7 +17,14 @@ from homeassistant.const import (
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
-from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
@@ -47,7 +54,11 @@ from homeassistant.loader import (
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+from homeassistant.setup import (
+    DATA_IMPORT_TIME,
+    DATA_SETUP_TIME,
+    async_get_loaded_integrations,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -55,6 +66,7 @@ from .connection import ActiveConnection
 from .messages import construct_event_message, construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+ENTITY_SUBSCRIPTIONS = "websocket_api_entity_subscriptions"
 
 
 @callback
@@ -75,6 +87,7 @@ def async_register_commands(
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_template_cache_stats)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
@@ -301,25 +314,72 @@ def _send_handle_get_states_response(
     connection.send_message(construct_result_message(msg_id, f"[{joined_states}]"))
 
 
-def _forward_entity_changes(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
-    entity_ids: set[str],
-    user: User,
-    msg_id: int,
-    event: Event,
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if not permissions.access_all_entities(
-        POLICY_READ
-    ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
-        return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+class _EntitySubscriptions:
+    """Forward state changes to all subscribe_entities subscriptions.
+
+    A single state_changed listener serves every subscription so the
+    permissions of a user are only checked once for each state change,
+    no matter how many connections the user has open.
+    """
+
+    __slots__ = ("_hass", "_subscriptions", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the subscriptions."""
+        self._hass = hass
+        self._subscriptions: dict[
+            tuple[ActiveConnection, int],
+            tuple[Callable[[str], None], set[str], User, int],
+        ] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self, connection: ActiveConnection, msg_id: int, entity_ids: set[str]
+    ) -> CALLBACK_TYPE:
+        """Subscribe a connection to state changes of entity_ids or all entities."""
+        key = (connection, msg_id)
+        self._subscriptions[key] = (
+            connection.send_message,
+            entity_ids,
+            connection.user,
+            msg_id,
+        )
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward, run_immediately=True
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Unsubscribe the connection."""
+            del self._subscriptions[key]
+            if not self._subscriptions and self._unsub:
+                self._unsub()
+                self._unsub = None
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_forward(self, event: Event) -> None:
+        """Forward entity state changed events to websocket."""
+        entity_id: str = event.data["entity_id"]
+        allowed_by_permissions: dict[int, bool] = {}
+        for send_message, entity_ids, user, msg_id in list(
+            self._subscriptions.values()
+        ):
+            if entity_ids and entity_id not in entity_ids:
+                continue
+            # We have to lookup the permissions again because the user might have
+            # changed since the subscription was created.
+            permissions = user.permissions
+            if (allowed := allowed_by_permissions.get(id(permissions))) is None:
+                allowed = permissions.access_all_entities(
+                    POLICY_READ
+                ) or permissions.check_entity(entity_id, POLICY_READ)
+                allowed_by_permissions[id(permissions)] = allowed
+            if allowed:
+                send_message(messages.cached_state_diff_message(msg_id, event))
 
 
 @callback
@@ -338,18 +398,12 @@ def handle_subscribe_entities(
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        callback(
-            partial(
-                _forward_entity_changes,
-                connection.send_message,
-                entity_ids,
-                connection.user,
-                msg["id"],
-            )
-        ),
-        run_immediately=True,
+    if (entity_subscriptions := hass.data.get(ENTITY_SUBSCRIPTIONS)) is None:
+        entity_subscriptions = hass.data[ENTITY_SUBSCRIPTIONS] = _EntitySubscriptions(
+            hass
+        )
+    connection.subscriptions[msg["id"]] = entity_subscriptions.async_subscribe(
+        connection, msg["id"], entity_ids
     )
     connection.send_result(msg["id"])
 
@@ -471,10 +525,19 @@ def handle_integration_setup_info(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle integrations command."""
+    import_time: dict[str, dt.timedelta] = hass.data.get(DATA_IMPORT_TIME, {})
     connection.send_result(
         msg["id"],
         [
-            {"domain": integration, "seconds": timedelta.total_seconds()}
+            {
+                "domain": integration,
+                "seconds": timedelta.total_seconds(),
+                "import_seconds": (
+                    import_time[integration].total_seconds()
+                    if integration in import_time
+                    else None
+                ),
+            }
             for integration, timedelta in cast(
                 dict[str, dt.timedelta], hass.data[DATA_SETUP_TIME]
             ).items()
@@ -595,6 +658,25 @@ async def handle_render_template(
     hass.loop.call_soon_threadsafe(info.async_refresh)
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "template/cache_stats"})
+def handle_template_cache_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle template cache stats command."""
+    statistics = template.COMPILE_STATISTICS
+    connection.send_result(
+        msg["id"],
+        {
+            "hits": statistics.hits,
+            "misses": statistics.misses,
+            "compile_seconds": statistics.compile_time,
+            "size": len(template.CACHED_COMPILED_TEMPLATES),
+            "max_size": template.COMPILED_TEMPLATE_CACHE_SIZE,
+        },
+    )
+
+
 def _serialize_entity_sources(
     entity_infos: dict[str, entity.EntityInfo]
 ) -> dict[str, Any]:
@@ -175,9 +175,22 @@ def _state_diff(
             additions[COMPRESSED_STATE_CONTEXT]["id"] = new_state_context.id
         else:
             additions[COMPRESSED_STATE_CONTEXT] = new_state_context.id
-    if (old_attributes := old_state.attributes) != (
-        new_attributes := new_state.attributes
-    ):
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    if (changed_attributes := new_state.changed_attributes) is not None:
+        # The state machine already knows which attributes changed
+        # so there is no need to compare all of them again
+        removed_keys: list[str] = []
+        for key in changed_attributes:
+            if key in new_attributes:
+                additions.setdefault(COMPRESSED_STATE_ATTRIBUTES, {})[
+                    key
+                ] = new_attributes[key]
+            else:
+                removed_keys.append(key)
+        if removed_keys:
+            diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: removed_keys}
+    elif old_attributes != new_attributes:
         for key, value in new_attributes.items():
             if old_attributes.get(key) != value:
                 additions.setdefault(COMPRESSED_STATE_ATTRIBUTES, {})[key] = value
@@ -33,7 +33,12 @@ from .helpers.event import (
 )
 from .helpers.frame import report
 from .helpers.typing import UNDEFINED, ConfigType, DiscoveryInfoType, UndefinedType
-from .setup import DATA_SETUP_DONE, async_process_deps_reqs, async_setup_component
+from .setup import (
+    DATA_SETUP_DONE,
+    async_process_deps_reqs,
+    async_record_startup_phase,
+    async_setup_component,
+)
 from .util import uuid as uuid_util
 from .util.decorator import Registry
 
@@ -396,7 +401,13 @@ class ConfigEntry:
         error_reason = None
 
         try:
-            result = await component.async_setup_entry(hass, self)
+            with async_record_startup_phase(
+                hass,
+                "async_setup_entry",
+                "config_entry",
+                self._async_startup_track(integration.domain),
+            ):
+                result = await component.async_setup_entry(hass, self)
 
             if not isinstance(result, bool):
                 _LOGGER.error(  # type: ignore[unreachable]
@@ -610,6 +621,13 @@ class ConfigEntry:
                 integration.domain,
             )
 
+    @callback
+    def _async_startup_track(self, domain: str) -> str:
+        """Return the startup timeline track of setting up the entry for a domain."""
+        if domain == self.domain:
+            return f"{self.domain}: {self.title}"
+        return f"{self.domain}.{domain}: {self.title}"
+
     @callback
     def _async_set_state(
         self, hass: HomeAssistant, state: ConfigEntryState, reason: str | None
@@ -1406,16 +1424,24 @@ class ConfigEntries:
         component also has related platforms, the component will have to
         forward the entry to be setup by that component.
         """
-        # Setup Component if not set up yet
-        if domain not in self.hass.config.components:
-            result = await async_setup_component(self.hass, domain, self._hass_config)
+        with async_record_startup_phase(
+            self.hass,
+            f"forward to {domain}",
+            "config_entry",
+            entry._async_startup_track(domain),
+        ):
+            # Setup Component if not set up yet
+            if domain not in self.hass.config.components:
+                result = await async_setup_component(
+                    self.hass, domain, self._hass_config
+                )
 
-            if not result:
-                return False
+                if not result:
+                    return False
 
-        integration = await loader.async_get_integration(self.hass, domain)
+            integration = await loader.async_get_integration(self.hass, domain)
 
-        await entry.async_setup(self.hass, integration=integration)
+            await entry.async_setup(self.hass, integration=integration)
         return True
 
     async def async_unload_platforms(
@@ -11,6 +11,7 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Hashable,
     Iterable,
     KeysView,
     Mapping,
@@ -30,12 +31,12 @@ import time
 from time import monotonic
 from typing import TYPE_CHECKING, Any, Generic, ParamSpec, Self, TypeVar, cast, overload
 from urllib.parse import urlparse
+import weakref
 
 import voluptuous as vol
 import yarl
 
 from . import block_async_io, util
-from .backports.functools import cached_property
 from .const import (
     ATTR_DOMAIN,
     ATTR_FRIENDLY_NAME,
@@ -81,7 +82,7 @@ from .util.async_ import (
 from .util.json import JsonObjectType
 from .util.read_only_dict import ReadOnlyDict
 from .util.timeout import TimeoutManager
-from .util.ulid import ulid, ulid_at_time
+from .util.ulid import ulid_at_time
 from .util.unit_system import (
     _CONF_UNIT_SYSTEM_IMPERIAL,
     _CONF_UNIT_SYSTEM_US_CUSTOMARY,
@@ -145,6 +146,8 @@ TIMEOUT_EVENT_START = 15
 
 MAX_EXPECTED_ENTITY_IDS = 16384
 
+_EMPTY_FROZENSET: frozenset[str] = frozenset()
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -884,7 +887,14 @@ class HomeAssistant:
 class Context:
     """The context that triggered something."""
 
-    __slots__ = ("user_id", "parent_id", "id", "origin_event", "_as_dict")
+    __slots__ = (
+        "user_id",
+        "parent_id",
+        "_id",
+        "_id_timestamp",
+        "origin_event",
+        "_as_dict",
+    )
 
     def __init__(
         self,
@@ -893,12 +903,22 @@ class Context:
         id: str | None = None,  # pylint: disable=redefined-builtin
     ) -> None:
         """Init the context."""
-        self.id = id or ulid()
+        # The ULID of a new context is generated from the creation time
+        # the first time it is accessed since most contexts never are.
+        self._id = id or None
+        self._id_timestamp = 0.0 if self._id else time.time()
         self.user_id = user_id
         self.parent_id = parent_id
         self.origin_event: Event | None = None
         self._as_dict: ReadOnlyDict[str, str | None] | None = None
 
+    @property
+    def id(self) -> str:
+        """Return the id of the context."""
+        if self._id is None:
+            self._id = ulid_at_time(self._id_timestamp)
+        return self._id
+
     def __eq__(self, other: Any) -> bool:
         """Compare contexts."""
         return bool(self.__class__ == other.__class__ and self.id == other.id)
@@ -946,9 +966,10 @@ class Event:
         self.origin = origin
         self.time_fired = time_fired or dt_util.utcnow()
         if not context:
-            context = Context(
-                id=ulid_at_time(dt_util.utc_to_timestamp(self.time_fired))
-            )
+            context = Context()
+            if time_fired is not None:
+                # pylint: disable-next=protected-access
+                context._id_timestamp = dt_util.utc_to_timestamp(time_fired)
         self.context = context
         self._as_dict: ReadOnlyDict[str, Any] | None = None
         if not context.origin_event:
@@ -992,13 +1013,27 @@ _FilterableJobType = tuple[
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = (
+        "_listeners",
+        "_match_all_listeners",
+        "_entity_listeners",
+        "_dispatch",
+        "_hass",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType]] = {}
         self._match_all_listeners: list[_FilterableJobType] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # Listeners that only care about events for a single entity_id,
+        # indexed by event_type and then by the entity_id in the event data
+        self._entity_listeners: dict[
+            str, dict[str, tuple[_FilterableJobType, ...]]
+        ] = {}
+        # Immutable per event_type dispatch tuples, rebuilt lazily after
+        # a listener for that event_type (or MATCH_ALL) is added or removed
+        self._dispatch: dict[str, tuple[_FilterableJobType, ...]] = {}
         self._hass = hass
 
     @callback
@@ -1007,7 +1042,25 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, entity_listeners in self._entity_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + sum(
+                len(jobs) for jobs in entity_listeners.values()
+            )
+        return listeners
+
+    @callback
+    def async_entity_listeners(self, event_type: str) -> dict[str, int]:
+        """Return dictionary with entity_ids and the number of listeners.
+
+        Only listeners indexed by entity_id for event_type are counted.
+
+        This method must be run in the event loop.
+        """
+        return {
+            entity_id: len(jobs)
+            for entity_id, jobs in self._entity_listeners.get(event_type, {}).items()
+        }
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -1037,6 +1090,9 @@ class EventBus:
     ) -> None:
         """Fire an event.
 
+        The Event is only created if a listener will receive it. When
+        nobody listens, context.origin_event is not set by this event.
+
         This method must be run in the event loop.
         """
         if len(event_type) > MAX_LENGTH_EVENT_EVENT_TYPE:
@@ -1044,21 +1100,44 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
-        match_all_listeners = self._match_all_listeners
+        if (listeners := self._dispatch.get(event_type)) is None:
+            listeners = self._async_build_dispatch(event_type)
+
+        dispatch_entity_id: str | None = None
+        if (
+            event_data is not None
+            and (entity_listeners := self._entity_listeners.get(event_type))
+            and isinstance(entity_id := event_data.get("entity_id"), str)
+            and (keyed_listeners := entity_listeners.get(entity_id))
+        ):
+            # Listeners keyed by entity_id that do not run immediately are
+            # dispatched together by a single call_soon, see
+            # _async_dispatch_entity_event
+            if immediate_listeners := tuple(
+                filterable_job
+                for filterable_job in keyed_listeners
+                if filterable_job[2]
+            ):
+                listeners = listeners + immediate_listeners
+            if len(immediate_listeners) != len(keyed_listeners):
+                dispatch_entity_id = entity_id
+
+        if (
+            not listeners
+            and dispatch_entity_id is None
+            and not _LOGGER.isEnabledFor(logging.DEBUG)
+        ):
+            # Nobody will ever see the event so there is no need to create it.
+            # This also means context.origin_event is not set by it. The
+            # logbook only reads origin_event for events it received, and
+            # those always have the recorder as a MATCH_ALL listener.
+            return
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners and not match_all_listeners:
-            return
-
-        # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
-        if event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
-
         for job, event_filter, run_immediately in listeners:
             if event_filter is not None:
                 try:
@@ -1075,6 +1154,73 @@ class EventBus:
             else:
                 self._hass.async_add_hass_job(job, event)
 
+        if dispatch_entity_id is not None:
+            self._hass.loop.call_soon(
+                self._async_dispatch_entity_event, event_type, dispatch_entity_id, event
+            )
+
+    @callback
+    def _async_dispatch_entity_event(
+        self, event_type: str, entity_id: str, event: Event
+    ) -> None:
+        """Dispatch an event to the listeners keyed by its entity_id.
+
+        Only listeners that do not run immediately are dispatched. They are
+        looked up when the dispatch runs so a listener added after the event
+        was fired still receives it.
+
+        This method must be run in the event loop.
+        """
+        if not (
+            (entity_listeners := self._entity_listeners.get(event_type))
+            and (keyed_listeners := entity_listeners.get(entity_id))
+        ):
+            return
+        for job, event_filter, run_immediately in keyed_listeners:
+            if run_immediately:
+                continue
+            if event_filter is not None:
+                try:
+                    if not event_filter(event):
+                        continue
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error in event filter")
+                    continue
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while dispatching event for %s to %s", entity_id, job
+                )
+
+    @callback
+    def _async_build_dispatch(self, event_type: str) -> tuple[_FilterableJobType, ...]:
+        """Build and cache the dispatch tuple for an event_type.
+
+        Nothing is cached when there are no listeners so firing event
+        types nobody listens to does not grow the cache.
+
+        This method must be run in the event loop.
+        """
+        match_all_listeners = self._match_all_listeners
+        event_listeners = self._listeners.get(event_type)
+        if not event_listeners and not match_all_listeners:
+            return ()
+        listeners = tuple(event_listeners or ())
+        # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
+        if event_type != EVENT_HOMEASSISTANT_CLOSE:
+            listeners = (*match_all_listeners, *listeners)
+        self._dispatch[event_type] = listeners
+        return listeners
+
+    @callback
+    def _async_invalidate_dispatch(self, event_type: str) -> None:
+        """Invalidate the cached dispatch tuples affected by an event_type."""
+        if event_type == MATCH_ALL:
+            self._dispatch.clear()
+        else:
+            self._dispatch.pop(event_type, None)
+
     def listen(
         self,
         event_type: str,
@@ -1129,9 +1275,30 @@ class EventBus:
 
     @callback
     def _async_listen_filterable_job(
-        self, event_type: str, filterable_job: _FilterableJobType
+        self,
+        event_type: str,
+        filterable_job: _FilterableJobType,
+        entity_id: str | None = None,
     ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with a filterable job.
+
+        If entity_id is passed, the job is stored in a secondary index and
+        will only be considered for events of event_type whose data has a
+        matching entity_id, instead of being evaluated for every event.
+        Listeners registered for an entity_id are always dispatched after
+        the listeners without one, regardless of the order they were added.
+        The ones that do not run immediately are dispatched together by a
+        single call_soon per event.
+
+        This method must be run in the event loop.
+        """
+        if entity_id is not None:
+            return self._async_listen_entity_filterable_job(
+                event_type, entity_id, filterable_job
+            )
+
         self._listeners.setdefault(event_type, []).append(filterable_job)
+        self._async_invalidate_dispatch(event_type)
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -1139,6 +1306,27 @@ class EventBus:
 
         return remove_listener
 
+    @callback
+    def _async_listen_entity_filterable_job(
+        self, event_type: str, entity_id: str, filterable_job: _FilterableJobType
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type for a single entity_id."""
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError(
+                "Entity listeners must be registered for a specific event type"
+            )
+        entity_listeners = self._entity_listeners.setdefault(event_type, {})
+        entity_listeners[entity_id] = (
+            *entity_listeners.get(entity_id, ()),
+            filterable_job,
+        )
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_entity_listener(event_type, entity_id, filterable_job)
+
+        return remove_listener
+
     def listen_once(
         self,
         event_type: str,
@@ -1226,6 +1414,35 @@ class EventBus:
             _LOGGER.exception(
                 "Unable to remove unknown job listener %s", filterable_job
             )
+        else:
+            self._async_invalidate_dispatch(event_type)
+
+    @callback
+    def _async_remove_entity_listener(
+        self, event_type: str, entity_id: str, filterable_job: _FilterableJobType
+    ) -> None:
+        """Remove a listener of a specific event_type and entity_id.
+
+        This method must be run in the event loop.
+        """
+        entity_listeners = self._entity_listeners.get(event_type, {})
+        jobs = list(entity_listeners.get(entity_id, ()))
+        try:
+            jobs.remove(filterable_job)
+        except ValueError:
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+            return
+
+        if jobs:
+            entity_listeners[entity_id] = tuple(jobs)
+            return
+
+        del entity_listeners[entity_id]
+        # delete event_type dict if empty
+        if not entity_listeners:
+            del self._entity_listeners[event_type]
 
 
 class State:
@@ -1241,6 +1458,25 @@ class State:
     object_id: Object id of this state.
     """
 
+    __slots__ = (
+        "entity_id",
+        "state",
+        "attributes",
+        "last_updated",
+        "last_changed",
+        "context",
+        "state_info",
+        "domain",
+        "object_id",
+        "_as_dict",
+        "_as_dict_json",
+        "_as_compressed_state",
+        "_as_compressed_state_json",
+        "attributes_fingerprint",
+        "_previous_attributes",
+        "_changed_attributes",
+    )
+
     def __init__(
         self,
         entity_id: str,
@@ -1251,6 +1487,7 @@ class State:
         context: Context | None = None,
         validate_entity_id: bool | None = True,
         state_info: StateInfo | None = None,
+        attributes_fingerprint: Hashable | None = None,
     ) -> None:
         """Initialize a new state."""
         state = str(state)
@@ -1265,13 +1502,26 @@ class State:
 
         self.entity_id = entity_id
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        # ReadOnlyDicts can be shared between states since they cannot change
+        self.attributes = (
+            attributes
+            if type(attributes) is ReadOnlyDict  # pylint: disable=unidiomatic-typecheck
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
         self.state_info = state_info
         self.domain, self.object_id = split_entity_id(self.entity_id)
+        # Serialized representations are only built when first requested
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
+        self._as_dict_json: str | None = None
+        self._as_compressed_state: dict[str, Any] | None = None
+        self._as_compressed_state_json: str | None = None
+        self.attributes_fingerprint = attributes_fingerprint
+        # Set by the state machine, see changed_attributes
+        self._previous_attributes: weakref.ref[ReadOnlyDict[str, Any]] | None = None
+        self._changed_attributes: frozenset[str] | None = None
 
     @property
     def name(self) -> str:
@@ -1280,6 +1530,38 @@ class State:
             "_", " "
         )
 
+    @property
+    def changed_attributes(self) -> frozenset[str] | None:
+        """Return the attribute keys that changed from the replaced state.
+
+        Keys that were added, removed or changed value are included.
+
+        The replaced attributes are only weakly referenced so they are not
+        kept alive by the new state. They are available as long as the
+        replaced state is, for example while the state changed event is
+        being dispatched.
+
+        Returns None if the state did not replace another state in the
+        state machine or if the replaced attributes are no longer
+        available.
+
+        Async friendly.
+        """
+        # Subclasses like the recorder's LazyState do not call __init__
+        if (
+            previous_attributes_ref := getattr(self, "_previous_attributes", None)
+        ) is not None:
+            self._previous_attributes = None
+            if (previous_attributes := previous_attributes_ref()) is not None:
+                attributes = self.attributes
+                self._changed_attributes = frozenset(
+                    key
+                    for key, value in attributes.items()
+                    if key not in previous_attributes
+                    or previous_attributes[key] != value
+                ).union(previous_attributes.keys() - attributes.keys())
+        return getattr(self, "_changed_attributes", None)
+
     def as_dict(self) -> ReadOnlyDict[str, Collection[Any]]:
         """Return a dict representation of the State.
 
@@ -1306,12 +1588,17 @@ class State:
             )
         return self._as_dict
 
-    @cached_property
+    @property
     def as_dict_json(self) -> str:
         """Return a JSON string of the State."""
-        return json_dumps(self.as_dict())
+        # Subclasses like the recorder's LazyState do not call __init__
+        # so the slot may not be set yet
+        if (as_dict_json := getattr(self, "_as_dict_json", None)) is None:
+            as_dict_json = json_dumps(self.as_dict())
+            self._as_dict_json = as_dict_json
+        return as_dict_json
 
-    @cached_property
+    @property
     def as_compressed_state(self) -> dict[str, Any]:
         """Build a compressed dict of a state for adds.
 
@@ -1319,6 +1606,13 @@ class State:
 
         Sends c (context) as a string if it only contains an id.
         """
+        if (as_compressed_state := getattr(self, "_as_compressed_state", None)) is None:
+            as_compressed_state = self._build_compressed_state()
+            self._as_compressed_state = as_compressed_state
+        return as_compressed_state
+
+    def _build_compressed_state(self) -> dict[str, Any]:
+        """Build a compressed dict of a state."""
         state_context = self.context
         if state_context.parent_id is None and state_context.user_id is None:
             context: dict[str, Any] | str = state_context.id
@@ -1336,7 +1630,7 @@ class State:
             )
         return compressed_state
 
-    @cached_property
+    @property
     def as_compressed_state_json(self) -> str:
         """Build a compressed JSON key value pair of a state for adds.
 
@@ -1344,7 +1638,14 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_dumps({self.entity_id: self.as_compressed_state})[1:-1]
+        if (
+            as_compressed_state_json := getattr(self, "_as_compressed_state_json", None)
+        ) is None:
+            as_compressed_state_json = json_dumps(
+                {self.entity_id: self.as_compressed_state}
+            )[1:-1]
+            self._as_compressed_state_json = as_compressed_state_json
+        return as_compressed_state_json
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -1508,6 +1809,35 @@ class StateMachine:
             len(self._states.domain_entity_ids(domain)) for domain in domain_filter
         )
 
+    @callback
+    def async_listen_entity(
+        self,
+        entity_id: str,
+        listener: HassJob[[Event], Coroutine[Any, Any, None] | None]
+        | Callable[[Event], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for state changed events of a single entity.
+
+        The listener is stored in an index keyed by entity_id so
+        async_set and async_remove dispatch directly to it instead of
+        every state changed listener having to filter the event. All
+        listeners of an entity are run by a single call_soon per change.
+
+        Returns function to unsubscribe the listener.
+
+        This method must be run in the event loop.
+        """
+        entity_id = entity_id.lower()
+        job = (
+            listener
+            if isinstance(listener, HassJob)
+            else HassJob(listener, f"listen entity {entity_id}")
+        )
+        # pylint: disable-next=protected-access
+        return self._bus._async_listen_filterable_job(
+            EVENT_STATE_CHANGED, (job, None, False), entity_id
+        )
+
     def all(self, domain_filter: str | Iterable[str] | None = None) -> list[State]:
         """Create a list of all states."""
         return run_callback_threadsafe(
@@ -1641,6 +1971,7 @@ class StateMachine:
         force_update: bool = False,
         context: Context | None = None,
         state_info: StateInfo | None = None,
+        attributes_fingerprint: Hashable | None = None,
     ) -> None:
         """Set the state of an entity, add entity if it does not exist.
 
@@ -1649,6 +1980,11 @@ class StateMachine:
         If you just update the attributes and not the state, last changed will
         not be affected.
 
+        An optional attributes_fingerprint that must change whenever the
+        attributes change can be passed. If it matches the fingerprint of
+        the current state, the attributes are assumed to be unchanged and
+        are not compared.
+
         This method must be run in the event loop.
         """
         entity_id = entity_id.lower()
@@ -1660,12 +1996,22 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            same_attr = (
+                attributes_fingerprint is not None
+                and old_state.attributes_fingerprint == attributes_fingerprint
+            ) or old_state.attributes == attributes
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
             return
 
+        if same_attr:
+            if TYPE_CHECKING:
+                assert old_state is not None
+            # Share the immutable attributes of the old state
+            # instead of making another copy of them
+            attributes = old_state.attributes
+
         if context is None:
             # It is much faster to convert a timestamp to a utc datetime object
             # than converting a utc datetime object to a timestamp since cpython
@@ -1678,9 +2024,9 @@ class StateMachine:
             # timestamp implementation:
             # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
             # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-            timestamp = time.time()
-            now = dt_util.utc_from_timestamp(timestamp)
-            context = Context(id=ulid_at_time(timestamp))
+            context = Context()
+            # pylint: disable-next=protected-access
+            now = dt_util.utc_from_timestamp(context._id_timestamp)
         else:
             now = dt_util.utcnow()
 
@@ -1693,8 +2039,14 @@ class StateMachine:
             context,
             old_state is None,
             state_info,
+            attributes_fingerprint,
         )
         if old_state is not None:
+            # pylint: disable=protected-access
+            if same_attr:
+                state._changed_attributes = _EMPTY_FROZENSET
+            else:
+                state._previous_attributes = weakref.ref(old_state.attributes)
             old_state.expire()
         self._states[entity_id] = state
         self._bus.async_fire(
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from abc import ABC
 import asyncio
-from collections.abc import Coroutine, Iterable, Mapping, MutableMapping
+from collections.abc import Coroutine, Hashable, Iterable, Mapping, MutableMapping
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import timedelta
@@ -79,6 +79,20 @@ DATA_ENTITY_SOURCE = "entity_info"
 # epsilon to make the string representation readable
 FLOAT_PRECISION = abs(int(math.floor(math.log10(abs(sys.float_info.epsilon))))) - 1
 
+# Attributes added to the state by the Entity base class, these are not
+# covered by state_attributes_fingerprint and are part of the fingerprint
+# passed to the state machine instead
+_BASE_STATE_ATTRIBUTES = (
+    ATTR_UNIT_OF_MEASUREMENT,
+    ATTR_ASSUMED_STATE,
+    ATTR_ATTRIBUTION,
+    ATTR_DEVICE_CLASS,
+    ATTR_ENTITY_PICTURE,
+    ATTR_ICON,
+    ATTR_FRIENDLY_NAME,
+    ATTR_SUPPORTED_FEATURES,
+)
+
 
 @callback
 def async_setup(hass: HomeAssistant) -> None:
@@ -338,6 +352,7 @@ class Entity(ABC):
     _attr_name: str | None
     _attr_should_poll: bool = True
     _attr_state: StateType = STATE_UNKNOWN
+    _attr_state_attributes_fingerprint: Hashable | None = None
     _attr_supported_features: int | None = None
     _attr_translation_key: str | None
     _attr_unique_id: str | None = None
@@ -571,6 +586,17 @@ class Entity(ABC):
             return self._attr_extra_state_attributes
         return None
 
+    @property
+    def state_attributes_fingerprint(self) -> Hashable | None:
+        """Return a fingerprint of the attributes provided by the entity.
+
+        If implemented, the fingerprint must change whenever the
+        capability_attributes, state_attributes or extra_state_attributes
+        change. It allows the state machine to skip comparing large
+        attributes on every state write.
+        """
+        return self._attr_state_attributes_fingerprint
+
     @property
     def device_info(self) -> DeviceInfo | None:
         """Return device specific attributes.
@@ -811,6 +837,14 @@ class Entity(ABC):
     @callback
     def _async_generate_attributes(self) -> tuple[str, dict[str, Any]]:
         """Calculate state string and attribute mapping."""
+        state, attr, _ = self._async_generate_attributes_and_fingerprint()
+        return (state, attr)
+
+    @callback
+    def _async_generate_attributes_and_fingerprint(
+        self,
+    ) -> tuple[str, dict[str, Any], Hashable | None]:
+        """Calculate state string, attribute mapping and attributes fingerprint."""
         entry = self.registry_entry
 
         attr = self.capability_attributes
@@ -850,7 +884,14 @@ class Entity(ABC):
         if (supported_features := self.supported_features) is not None:
             attr[ATTR_SUPPORTED_FEATURES] = supported_features
 
-        return (state, attr)
+        if (fingerprint := self.state_attributes_fingerprint) is not None:
+            fingerprint = (
+                fingerprint,
+                available,
+                *map(attr.get, _BASE_STATE_ATTRIBUTES),
+            )
+
+        return (state, attr, fingerprint)
 
     @callback
     def _async_write_ha_state(self) -> None:
@@ -876,7 +917,7 @@ class Entity(ABC):
             return
 
         start = timer()
-        state, attr = self._async_generate_attributes()
+        state, attr, fingerprint = self._async_generate_attributes_and_fingerprint()
         end = timer()
 
         if end - start > 0.4 and not self._slow_reported:
@@ -891,8 +932,12 @@ class Entity(ABC):
             )
 
         # Overwrite properties that have been set in the config file.
-        if customize := hass.data.get(DATA_CUSTOMIZE):
-            attr.update(customize.get(entity_id))
+        if (customize := hass.data.get(DATA_CUSTOMIZE)) and (
+            customized := customize.get(entity_id)
+        ):
+            attr.update(customized)
+            # The fingerprint does not know about customizations
+            fingerprint = None
 
         if (
             self._context_set is not None
@@ -910,6 +955,7 @@ class Entity(ABC):
                 self.force_update,
                 self._context,
                 self._state_info,
+                fingerprint,
             )
         except InvalidStateError:
             _LOGGER.exception("Failed to set state, fall back to %s", STATE_UNKNOWN)
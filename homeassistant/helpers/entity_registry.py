@@ -331,9 +331,11 @@ class DeletedRegistryEntry:
         return split_entity_id(self.entity_id)[0]
 
 
-class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
+class EntityRegistryStore(storage.JournaledStore[dict[str, list[dict[str, Any]]]]):
     """Store entity registry data."""
 
+    journal_collections = ("entities", "deleted_entities")
+
     async def _async_migrate_func(
         self,
         old_major_version: int,
@@ -10,7 +10,7 @@ import functools as ft
 import logging
 from random import randint
 import time
-from typing import Any, Concatenate, ParamSpec, TypedDict, TypeVar
+from typing import Any, Concatenate, ParamSpec, TypedDict, TypeVar, cast
 
 import attr
 
@@ -23,6 +23,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import (
     CALLBACK_TYPE,
+    Event,
     HassJob,
     HomeAssistant,
     State,
@@ -47,9 +48,6 @@ from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
 from .typing import EventType, TemplateVarsType
 
-TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
-TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
-
 TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
 TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
 
@@ -270,45 +268,15 @@ def async_track_state_change_event(
 
     In order to avoid having to iterate a long list
     of EVENT_STATE_CHANGED and fire and create a job
-    for each one, we keep a dict of entity ids that
-    care about the state change events so we can
-    do a fast dict lookup to route events.
+    for each one, the state machine keeps an index of
+    entity ids that care about the state change events
+    so it can do a fast dict lookup to route events.
     """
     if not (entity_ids := _async_string_to_lower_list(entity_ids)):
         return _remove_empty_listener
     return _async_track_state_change_event(hass, entity_ids, action)
 
 
-@callback
-def _async_dispatch_entity_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
-    event: EventType[EventStateChangedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["entity_id"])):
-        return
-    for job in callbacks_list[:]:
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["entity_id"],
-                job,
-            )
-
-
-@callback
-def _async_state_change_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
-    event: EventType[EventStateChangedData],
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event.data["entity_id"] in callbacks
-
-
 @bind_hass
 def _async_track_state_change_event(
     hass: HomeAssistant,
@@ -316,16 +284,30 @@ def _async_track_state_change_event(
     action: Callable[[EventType[EventStateChangedData]], Any],
 ) -> CALLBACK_TYPE:
     """async_track_state_change_event without lowercasing."""
-    return _async_track_event(
-        hass,
-        entity_ids,
-        TRACK_STATE_CHANGE_CALLBACKS,
-        TRACK_STATE_CHANGE_LISTENER,
-        EVENT_STATE_CHANGED,
-        _async_dispatch_entity_id_event,
-        _async_state_change_filter,
-        action,
+    if not entity_ids:
+        return _remove_empty_listener
+
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
+
+    # The state machine passes the state changed event it fired
+    job = cast(
+        HassJob[[Event], Any],
+        HassJob(action, f"track {EVENT_STATE_CHANGED} event {entity_ids}"),
     )
+    async_listen_entity = hass.states.async_listen_entity
+
+    return ft.partial(
+        _remove_listeners,
+        [async_listen_entity(entity_id, job) for entity_id in entity_ids],
+    )
+
+
+@callback
+def _remove_listeners(remove_listeners: list[CALLBACK_TYPE]) -> None:
+    """Remove a list of listeners."""
+    for remove_listener in remove_listeners:
+        remove_listener()
 
 
 @callback
@@ -5,11 +5,13 @@ import asyncio
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import dataclass
+import hashlib
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, TypeVar, cast
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import (
@@ -24,7 +26,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_file_atomic
 
 from . import json as json_helper
 
@@ -35,6 +37,12 @@ STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
+STORAGE_WRITER = "storage_writer"
+
+JOURNAL_SUFFIX = ".journal"
+# A journal is compacted when it holds more records than this or than the
+# number of items in the data, whichever is larger
+JOURNAL_MIN_COMPACT_RECORDS = 500
 
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
@@ -79,6 +87,139 @@ async def async_migrator(
     return config
 
 
+@dataclass(slots=True)
+class StoreWriteStatistics:
+    """Statistics of the writes of a store."""
+
+    writes: int = 0
+    skipped_writes: int = 0
+    bytes_written: int = 0
+
+
+@callback
+def async_get_write_statistics(hass: HomeAssistant) -> dict[str, StoreWriteStatistics]:
+    """Return the write statistics of all stores by storage key."""
+    return _async_get_writer(hass).statistics
+
+
+@callback
+def _async_get_writer(hass: HomeAssistant) -> _StoreWriter:
+    """Return the writer of the stores."""
+    if (writer := hass.data.get(STORAGE_WRITER)) is None:
+        writer = hass.data[STORAGE_WRITER] = _StoreWriter(hass)
+    return writer
+
+
+class _StoreWriter:
+    """Write the data of all stores in batches.
+
+    A batch is written in a single executor job. Writes requested while a
+    batch is being written are written together in the next batch, so a
+    burst of saves of many stores does not need a job per store. A write is
+    skipped when the file already holds the same data.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the writer."""
+        self._hass = hass
+        self._pending: list[tuple[Store, str, dict, asyncio.Future[None]]] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        # Digests of the data last written to each path
+        self._digests: dict[str, bytes] = {}
+        self.statistics: dict[str, StoreWriteStatistics] = {}
+
+    async def async_write(self, store: Store, path: str, data: dict) -> None:
+        """Write the data of a store and wait until it is written."""
+        future: asyncio.Future[None] = self._hass.loop.create_future()
+        self._pending.append((store, path, data, future))
+        if self._flush_task is None:
+            self._flush_task = self._hass.async_create_task(
+                self._async_flush(), "storage writer flush"
+            )
+        await future
+
+    @callback
+    def async_forget(self, path: str) -> None:
+        """Forget the data written to a path when the file is removed."""
+        self._digests.pop(path, None)
+
+    @callback
+    def async_record_write(self, key: str, bytes_written: int | None) -> None:
+        """Record a write of a store, None for a skipped write."""
+        if (statistics := self.statistics.get(key)) is None:
+            statistics = self.statistics[key] = StoreWriteStatistics()
+        if bytes_written is None:
+            statistics.skipped_writes += 1
+        else:
+            statistics.writes += 1
+            statistics.bytes_written += bytes_written
+
+    async def _async_flush(self) -> None:
+        """Write batches until no more writes are pending."""
+        try:
+            while self._pending:
+                batch, self._pending = self._pending, []
+                results = await self._hass.async_add_executor_job(
+                    self._write_batch,
+                    [(store, path, data) for store, path, data, _ in batch],
+                )
+                for (store, _, _, future), result in zip(batch, results):
+                    if future.done():
+                        # The write was cancelled
+                        continue
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                        continue
+                    self.async_record_write(store.key, result)
+                    future.set_result(None)
+        finally:
+            self._flush_task = None
+            for *_, future in self._pending:
+                if not future.done():
+                    future.set_exception(
+                        HomeAssistantError("Storage writer was cancelled")
+                    )
+            self._pending = []
+
+    def _write_batch(
+        self, batch: list[tuple[Store, str, dict]]
+    ) -> list[int | None | Exception]:
+        """Write a batch of data.
+
+        Returns the number of bytes written, None for skipped writes or the
+        exception raised while writing for each item of the batch.
+        """
+        results: list[int | None | Exception] = []
+        for store, path, data in batch:
+            try:
+                results.append(self._write(store, path, data))
+            except Exception as err:  # pylint: disable=broad-except
+                results.append(err)
+        return results
+
+    def _write(self, store: Store, path: str, data: dict) -> int | None:
+        """Write the data of a store unless the file already holds it."""
+        json_data = json_helper.json_dumps_to_save(
+            path, data, encoder=store._encoder  # pylint: disable=protected-access
+        )
+        encoded = json_data.encode("utf-8")
+        digest = hashlib.blake2b(encoded, digest_size=32).digest()
+        if self._digests.get(path) == digest:
+            _LOGGER.debug("Data for %s at %s is unchanged", store.key, path)
+            return None
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        _LOGGER.debug("Writing data for %s to %s", store.key, path)
+        # pylint: disable=protected-access
+        if store._atomic_writes:
+            write_utf8_file_atomic(path, json_data, store._private)
+        else:
+            write_utf8_file(path, json_data, store._private)
+        self._digests[path] = digest
+        return len(encoded)
+
+
 @bind_hass
 class Store(Generic[_T]):
     """Class to help storing data."""
@@ -158,9 +299,7 @@ class Store(Generic[_T]):
             data = deepcopy(data)
         else:
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
+                data = await self.hass.async_add_executor_job(self._load_file)
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -251,6 +390,10 @@ class Store(Generic[_T]):
 
         return stored
 
+    def _load_file(self) -> Any:
+        """Load the data from the file."""
+        return json_util.load_json(self.path)
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
         self._data = {
@@ -354,20 +497,7 @@ class Store(Generic[_T]):
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
     async def _async_write_data(self, path: str, data: dict) -> None:
-        await self.hass.async_add_executor_job(self._write_data, self.path, data)
-
-    def _write_data(self, path: str, data: dict) -> None:
-        """Write the data."""
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-
-        _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_helper.save_json(
-            path,
-            data,
-            self._private,
-            encoder=self._encoder,
-            atomic_writes=self._atomic_writes,
-        )
+        await _async_get_writer(self.hass).async_write(self, path, data)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -377,6 +507,189 @@ class Store(Generic[_T]):
         """Remove all data."""
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
+        _async_get_writer(self.hass).async_forget(self.path)
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+
+class JournaledStore(Store[_T]):
+    """Store that appends the changed items of its data to a journal.
+
+    The data is a dict of the lists in journal_collections, which hold dicts
+    identified by their "id". The file is written on the first save of a run,
+    after that the added, changed and removed items are appended to a journal
+    next to it. The journal is compacted into the file once it holds more
+    records than the data holds items. Loading replays the journal on top of
+    the file, which the journal header identifies by its stat stamp.
+    """
+
+    journal_collections: tuple[str, ...] = ()
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the store."""
+        super().__init__(*args, **kwargs)
+        # Number of records in the journal, None until the file is written
+        self._journal_records: int | None = None
+        # Items by id of each collection as of the last write
+        self._journal_items: dict[str, dict[str, Any]] = {}
+
+    @property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
+    def _load_file(self) -> Any:
+        """Load the data from the file and replay the journal on top of it."""
+        data = super()._load_file()
+        if data:
+            self._replay_journal(data)
+        return data
+
+    def _snapshot_stamp(self) -> list[int]:
+        """Return the stamp that identifies the current file."""
+        stat = os.stat(self.path)
+        return [stat.st_ino, stat.st_mtime_ns, stat.st_size]
+
+    def _journal_header(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Return the header of a journal for the current file."""
+        return {
+            "version": data["version"],
+            "minor_version": data.get("minor_version", 1),
+            "key": data["key"],
+            "snapshot": self._snapshot_stamp(),
+        }
+
+    def _replay_journal(self, data: dict[str, Any]) -> None:
+        """Apply the records of the journal to data loaded from the file."""
+        try:
+            with open(self.journal_path, encoding="utf-8") as journal:
+                lines = journal.read().splitlines()
+        except FileNotFoundError:
+            return
+
+        try:
+            header = json_util.json_loads(lines[0]) if lines else None
+        except json_util.JSON_DECODE_EXCEPTIONS:
+            header = None
+        if header != self._journal_header(data):
+            _LOGGER.warning(
+                "Ignoring journal of %s that does not belong to %s",
+                self.key,
+                self.path,
+            )
+            return
+
+        stored = data["data"]
+        items = {
+            collection: {item["id"]: item for item in stored[collection]}
+            for collection in self.journal_collections
+        }
+        for line in lines[1:]:
+            try:
+                record = json_util.json_loads_object(line)
+            except json_util.JSON_DECODE_EXCEPTIONS:
+                # The last record was not written completely
+                _LOGGER.warning("Ignoring incomplete journal record of %s", self.key)
+                break
+            collection_items = items[cast(str, record["collection"])]
+            if "remove" in record:
+                collection_items.pop(cast(str, record["remove"]), None)
+            else:
+                item = cast(dict[str, Any], record["item"])
+                collection_items[item["id"]] = item
+
+        for collection, collection_items in items.items():
+            stored[collection] = list(collection_items.values())
+        _LOGGER.debug("Replayed %s journal records of %s", len(lines) - 1, self.key)
+
+    def _journal_changes(
+        self, stored: Any
+    ) -> tuple[list[dict[str, Any]], dict[str, dict[str, Any]]] | None:
+        """Return the journal records and items for the data to write.
+
+        Returns None when the file has to be written instead.
+        """
+        if (
+            self._journal_records is None
+            or not isinstance(stored, dict)
+            or stored.keys() != self._journal_items.keys()
+        ):
+            return None
+
+        records: list[dict[str, Any]] = []
+        items: dict[str, dict[str, Any]] = {}
+        for collection, old_items in self._journal_items.items():
+            new_items = items[collection] = {
+                item["id"]: item for item in stored[collection]
+            }
+            for item_id, item in new_items.items():
+                if old_items.get(item_id) != item:
+                    records.append({"collection": collection, "item": item})
+            for item_id in old_items.keys() - new_items.keys():
+                records.append({"collection": collection, "remove": item_id})
+
+        if self._journal_records + len(records) > max(
+            JOURNAL_MIN_COMPACT_RECORDS,
+            sum(len(collection_items) for collection_items in items.values()),
+        ):
+            return None
+        return records, items
+
+    async def _async_write_data(self, path: str, data: dict) -> None:
+        """Append the changed items to the journal or write the file."""
+        stored = data["data"]
+        if (changes := self._journal_changes(stored)) is None:
+            self._journal_records = None
+            await super()._async_write_data(path, data)
+            await self.hass.async_add_executor_job(self._start_journal, data)
+            self._journal_records = 0
+            self._journal_items = {
+                collection: {item["id"]: item for item in stored[collection]}
+                for collection in self.journal_collections
+                if isinstance(stored, dict) and collection in stored
+            }
+            return
+
+        records, items = changes
+        if not records:
+            return
+        journal_records = cast(int, self._journal_records)
+        self._journal_records = None
+        bytes_written = await self.hass.async_add_executor_job(
+            self._append_journal, records
+        )
+        self._journal_records = journal_records + len(records)
+        self._journal_items = items
+        _async_get_writer(self.hass).async_record_write(self.key, bytes_written)
+
+    def _start_journal(self, data: dict[str, Any]) -> None:
+        """Start an empty journal for the file that was just written."""
+        header = f"{json_helper.json_dumps(self._journal_header(data))}\n"
+        if self._atomic_writes:
+            write_utf8_file_atomic(self.journal_path, header, self._private)
+        else:
+            write_utf8_file(self.journal_path, header, self._private)
+
+    def _append_journal(self, records: list[dict[str, Any]]) -> int:
+        """Append records to the journal and return the number of bytes."""
+        encoded = "".join(
+            f"{json_helper.json_dumps(record)}\n" for record in records
+        ).encode("utf-8")
+        _LOGGER.debug("Appending %s records to %s", len(records), self.journal_path)
+        try:
+            with open(self.journal_path, "ab") as journal:
+                journal.write(encoded)
+                if self._atomic_writes:
+                    journal.flush()
+                    os.fsync(journal.fileno())
+        except OSError as err:
+            raise WriteError(err) from err
+        return len(encoded)
+
+    async def async_remove(self) -> None:
+        """Remove all data."""
+        await super().async_remove()
+        self._journal_records = None
+        with suppress(FileNotFoundError):
+            await self.hass.async_add_executor_job(os.unlink, self.journal_path)
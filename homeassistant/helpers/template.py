@@ -8,6 +8,7 @@ import collections.abc
 from collections.abc import Callable, Collection, Generator, Iterable, MutableMapping
 from contextlib import contextmanager, suppress
 from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import cache, lru_cache, partial, wraps
 import json
@@ -20,6 +21,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+from time import perf_counter
 from types import CodeType
 from typing import (
     Any,
@@ -32,7 +34,6 @@ from typing import (
     overload,
 )
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
@@ -145,12 +146,23 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
+#
+# The compiled code of template sources is shared by all Template instances
+# and kept when the templates are thrown away, so reloading automations and
+# template entities does not compile the same sources again.
+#
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
 CACHED_TEMPLATE_LRU: MutableMapping[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: MutableMapping[State, TemplateState] = LRU(
     CACHED_TEMPLATE_STATES
 )
+# Keyed by the source and the limited, strict and has hass flags of the environment
+CACHED_COMPILED_TEMPLATES: MutableMapping[tuple[str, bool, bool, bool], CodeType] = LRU(
+    COMPILED_TEMPLATE_CACHE_SIZE
+)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
 ORJSON_PASSTHROUGH_OPTIONS = (
@@ -158,6 +170,18 @@ ORJSON_PASSTHROUGH_OPTIONS = (
 )
 
 
+@dataclass(slots=True)
+class TemplateCompileStatistics:
+    """Statistics of the compiled template cache."""
+
+    hits: int = 0
+    misses: int = 0
+    compile_time: float = 0.0
+
+
+COMPILE_STATISTICS = TemplateCompileStatistics()
+
+
 def _template_state_no_collect(hass: HomeAssistant, state: State) -> TemplateState:
     """Return a TemplateState for a state without collecting."""
     if template_state := CACHED_TEMPLATE_NO_COLLECT_LRU.get(state):
@@ -726,7 +750,8 @@ class Template:
     ) -> Any:
         """Render template with value exposed.
 
-        If valid JSON will expose value_json too.
+        If valid JSON will expose value_json too, unless the variables
+        already hold the value_json of the value.
 
         This method must be run in the event loop.
         """
@@ -740,8 +765,9 @@ class Template:
         variables = dict(variables or {})
         variables["value"] = value
 
-        with suppress(*JSON_DECODE_EXCEPTIONS):
-            variables["value_json"] = json_loads(value)
+        if "value_json" not in variables:
+            with suppress(*JSON_DECODE_EXCEPTIONS):
+                variables["value_json"] = json_loads(value)
 
         try:
             return _render_with_context(self.template, compiled, **variables).strip()
@@ -942,6 +968,9 @@ class TemplateStateBase(State):
         self._collect = collect
         self._entity_id = entity_id
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
+        self._as_dict_json: str | None = None
+        self._as_compressed_state: dict[str, Any] | None = None
+        self._as_compressed_state_json: str | None = None
 
     def _collect_state(self) -> None:
         if self._collect and (render_info := _render_info.get()):
@@ -2315,9 +2344,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | str | None
-        ] = weakref.WeakValueDictionary()
+        self._compile_flags = (bool(limited), bool(strict), hass is not None)
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -2589,10 +2616,11 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             or filename is not None
             or raw is not False
             or defer_init is not False
+            or not isinstance(source, str)
         ):
-            # If there are any non-default keywords args, we do
-            # not cache.  In prodution we currently do not have
-            # any instance of this.
+            # If there are any non-default keywords args or the source
+            # is already parsed, we do not cache.  In prodution we
+            # currently do not have any instance of this.
             return super().compile(  # type: ignore[no-any-return,call-overload]
                 source,
                 name,
@@ -2601,9 +2629,15 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+        key = (source, *self._compile_flags)
+        if (cached := CACHED_COMPILED_TEMPLATES.get(key)) is not None:
+            COMPILE_STATISTICS.hits += 1
+            return cached
 
+        start = perf_counter()
+        cached = CACHED_COMPILED_TEMPLATES[key] = super().compile(source)
+        COMPILE_STATISTICS.misses += 1
+        COMPILE_STATISTICS.compile_time += perf_counter() - start
         return cached
 
 
@@ -12,8 +12,11 @@ from dataclasses import dataclass
 import functools as ft
 import importlib
 import logging
+import os
 import pathlib
+import stat
 import sys
+import threading
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
 
@@ -25,6 +28,7 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
+from .const import __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -39,6 +43,7 @@ from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
 if TYPE_CHECKING:
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _CallableT = TypeVar("_CallableT", bound=Callable[..., Any])
@@ -48,6 +53,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_INDEX = "manifest_index"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -61,6 +67,10 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+MANIFEST_INDEX_STORAGE_KEY = "core.manifest_index"
+MANIFEST_INDEX_STORAGE_VERSION = 1
+MANIFEST_INDEX_SAVE_DELAY = 30
+
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
 
@@ -184,6 +194,144 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+class _ManifestIndex:
+    """Index of parsed manifests and custom component directories.
+
+    The index is persisted so a restart does not have to read and parse every
+    manifest.json again. Entries of built-in integrations are valid for the
+    release they were read with, all other entries are validated against the
+    modification time of the file or directory they were read from.
+
+    Lookups happen in the executor.
+    """
+
+    def __init__(
+        self, store: Store[dict[str, Any]], data: dict[str, Any] | None
+    ) -> None:
+        """Initialize the index."""
+        self._store = store
+        self._lock = threading.Lock()
+        self._dirty = False
+        # Development checkouts change manifests without changing the version
+        self._trust_built_in = "dev" not in __version__
+        self._manifests: dict[str, dict[str, Any]] = {}
+        self._directories: dict[str, dict[str, Any]] = {}
+        if data is not None and data.get("ha_version") == __version__:
+            self._manifests = data["manifests"]
+            self._directories = data["directories"]
+
+    def get_manifest(
+        self, manifest_path: pathlib.Path, built_in: bool
+    ) -> Manifest | None:
+        """Return the manifest at a path or None if there is no valid manifest."""
+        key = str(manifest_path)
+        entry = self._manifests.get(key)
+        if entry is not None and built_in and self._trust_built_in:
+            return cast(Manifest, dict(entry["manifest"]))
+
+        try:
+            file_stat = manifest_path.stat()
+        except OSError:
+            file_stat = None
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+            if entry is not None:
+                self._update(self._manifests, key, None)
+            return None
+
+        stamp = [file_stat.st_mtime_ns, file_stat.st_size]
+        if entry is not None and entry["stamp"] == stamp:
+            return cast(Manifest, dict(entry["manifest"]))
+
+        try:
+            manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+        except JSON_DECODE_EXCEPTIONS as err:
+            _LOGGER.error(
+                "Error parsing manifest.json file at %s: %s", manifest_path, err
+            )
+            return None
+
+        self._update(self._manifests, key, {"stamp": stamp, "manifest": manifest})
+        return cast(Manifest, dict(manifest))
+
+    def get_sub_directories(self, paths: list[str]) -> list[str]:
+        """Return the names of all sub directories in a set of paths."""
+        names: list[str] = []
+        for path in paths:
+            mtime = os.stat(path).st_mtime_ns
+            if (entry := self._directories.get(path)) is not None and (
+                entry["stamp"] == mtime
+            ):
+                names.extend(entry["names"])
+                continue
+            sub_directories = [
+                sub_path.name
+                for sub_path in pathlib.Path(path).iterdir()
+                if sub_path.is_dir()
+            ]
+            self._update(
+                self._directories, path, {"stamp": mtime, "names": sub_directories}
+            )
+            names.extend(sub_directories)
+        return names
+
+    def _update(
+        self,
+        entries: dict[str, dict[str, Any]],
+        key: str,
+        entry: dict[str, Any] | None,
+    ) -> None:
+        """Replace or remove an entry."""
+        with self._lock:
+            if entry is None:
+                entries.pop(key, None)
+            else:
+                entries[key] = entry
+            self._dirty = True
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule saving the index if it changed."""
+        if self._dirty:
+            self._store.async_delay_save(self._data_to_save, MANIFEST_INDEX_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the index to store."""
+        with self._lock:
+            self._dirty = False
+            return {
+                "ha_version": __version__,
+                "manifests": dict(self._manifests),
+                "directories": dict(self._directories),
+            }
+
+
+async def _async_get_manifest_index(hass: HomeAssistant) -> _ManifestIndex:
+    """Return the manifest index, loading it from storage on first use."""
+    if (index_or_fut := hass.data.get(DATA_MANIFEST_INDEX)) is None:
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        fut: asyncio.Future[_ManifestIndex] = hass.loop.create_future()
+        hass.data[DATA_MANIFEST_INDEX] = fut
+        store = Store[dict[str, Any]](
+            hass, MANIFEST_INDEX_STORAGE_VERSION, MANIFEST_INDEX_STORAGE_KEY
+        )
+        try:
+            data = await store.async_load()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error loading the integration manifest index")
+            data = None
+        index = hass.data[DATA_MANIFEST_INDEX] = _ManifestIndex(store, data)
+        fut.set_result(index)
+        return index
+
+    if isinstance(index_or_fut, asyncio.Future):
+        return cast(_ManifestIndex, await index_or_fut)
+
+    return cast(_ManifestIndex, index_or_fut)
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -196,25 +344,19 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
-
+    manifest_index = await _async_get_manifest_index(hass)
     dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
+        manifest_index.get_sub_directories, list(custom_components.__path__)
     )
 
     integrations = await hass.async_add_executor_job(
         _resolve_integrations_from_root,
         hass,
         custom_components,
-        [comp.name for comp in dirs],
+        dirs,
+        manifest_index,
     )
+    manifest_index.async_schedule_save()
     return {
         integration.domain: integration
         for integration in integrations.values()
@@ -553,22 +695,32 @@ class Integration:
 
     @classmethod
     def resolve_from_root(
-        cls, hass: HomeAssistant, root_module: ModuleType, domain: str
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        manifest_index: _ManifestIndex | None = None,
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        built_in = root_module.__name__ == PACKAGE_BUILTIN
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
+            if manifest_index is not None:
+                manifest = manifest_index.get_manifest(manifest_path, built_in)
+                if manifest is None:
+                    continue
+            else:
+                if not manifest_path.is_file():
+                    continue
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
 
             integration = cls(
                 hass,
@@ -858,13 +1010,18 @@ class Integration:
 
 
 def _resolve_integrations_from_root(
-    hass: HomeAssistant, root_module: ModuleType, domains: list[str]
+    hass: HomeAssistant,
+    root_module: ModuleType,
+    domains: list[str],
+    manifest_index: _ManifestIndex | None = None,
 ) -> dict[str, Integration]:
     """Resolve multiple integrations from root."""
     integrations: dict[str, Integration] = {}
     for domain in domains:
         try:
-            integration = Integration.resolve_from_root(hass, root_module, domain)
+            integration = Integration.resolve_from_root(
+                hass, root_module, domain, manifest_index
+            )
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Error loading integration: %s", domain)
         else:
@@ -951,9 +1108,15 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
+        manifest_index = await _async_get_manifest_index(hass)
         integrations = await hass.async_add_executor_job(
-            _resolve_integrations_from_root, hass, components, list(needed)
+            _resolve_integrations_from_root,
+            hass,
+            components,
+            list(needed),
+            manifest_index,
         )
+        manifest_index.async_schedule_save()
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
@@ -6,19 +6,27 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+import gc
 import json
 import logging
+import os
+import tempfile
 from timeit import default_timer as timer
+import tracemalloc
 from typing import TypeVar
 
-from homeassistant import core
+from homeassistant import config_entries, core, loader
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import entity, recorder as recorder_helper
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -227,6 +235,270 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_entity_id_keyed_listeners(hass):
+    """Fire 100k state changed events at 1000 entity_id keyed listeners."""
+    count = 0
+    entity_id = "light.kitchen"
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    @core.callback
+    def event_filter(event):
+        """Filter event."""
+        return event.data["new_state"].state == "on"
+
+    for idx in range(1000):
+        # pylint: disable-next=protected-access
+        hass.bus._async_listen_filterable_job(
+            EVENT_STATE_CHANGED,
+            (core.HassJob(listener), event_filter, True),
+            f"{entity_id}{idx}",
+        )
+
+    events_data = [
+        {
+            "entity_id": f"{entity_id}{idx}",
+            "old_state": core.State(f"{entity_id}{idx}", "off"),
+            "new_state": core.State(f"{entity_id}{idx}", "on"),
+        }
+        for idx in range(1000)
+    ]
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, events_data[idx % 1000])
+
+    await hass.async_block_till_done()
+
+    runtime = timer() - start
+
+    assert count == events_to_fire
+
+    print(f"{events_to_fire / runtime:.0f} events/sec")
+
+    return runtime
+
+
+@benchmark
+async def state_set_allocations(hass):
+    """Measure memory allocated by 100k state writes of 100 sensors.
+
+    The writes are measured without listeners and again with a
+    state_changed listener, like the recorder adds. Only public APIs are
+    used so the benchmark can be copied to an older checkout to compare.
+
+    The garbage collector is disabled while measuring so memory that
+    can only be reclaimed by it is reported as retained.
+    """
+    writes = 10**5
+    entity_ids = [f"sensor.power_{idx}" for idx in range(100)]
+    attributes = [
+        {
+            "unit_of_measurement": "W",
+            "friendly_name": f"Power {idx}",
+            "device_class": "power",
+            "state_class": "measurement",
+        }
+        for idx in range(100)
+    ]
+    for entity_id, attrs in zip(entity_ids, attributes):
+        hass.states.async_set(entity_id, "0", attrs)
+
+    def _write(idx):
+        hass.states.async_set(entity_ids[idx % 100], str(idx), attributes[idx % 100])
+
+    start = timer()
+    for idx in range(writes):
+        _write(idx)
+    runtime = timer() - start
+
+    for label in ("no listeners", "a state_changed listener"):
+        if label != "no listeners":
+            hass.bus.async_listen(
+                EVENT_STATE_CHANGED, core.callback(lambda event: None)
+            )
+        allocated, retained = _measure_allocations(_write, writes)
+        print(
+            f"With {label}: {allocated / writes:.1f} bytes allocated and "
+            f"{retained / writes:.1f} bytes retained per write"
+        )
+        await hass.async_block_till_done()
+
+    return runtime
+
+
+def _measure_allocations(func, calls):
+    """Return the bytes allocated and retained by calling func calls times.
+
+    The peak of the traced memory during each call, relative to the memory
+    in use before it, is counted as allocated by that call. The overhead of
+    the measurement itself is subtracted.
+    """
+
+    def _measure(target):
+        allocated = 0
+        gc.collect()
+        gc.disable()
+        tracemalloc.start()
+        start_current = tracemalloc.get_traced_memory()[0]
+        for idx in range(calls):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            target(idx)
+            allocated += tracemalloc.get_traced_memory()[1] - before
+        retained = tracemalloc.get_traced_memory()[0] - start_current
+        tracemalloc.stop()
+        gc.enable()
+        return allocated, retained
+
+    overhead, _ = _measure(lambda idx: None)
+    allocated, retained = _measure(func)
+    return allocated - overhead, retained
+
+
+async def _async_setup_recorder(hass, tmpdir):
+    """Set up the recorder with an SQLite database in tmpdir."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    hass.config.config_dir = tmpdir
+    hass.config.skip_pip = True
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    entity.async_setup(hass)
+    loader.async_setup(hass)
+    hass.data[loader.DATA_CUSTOM_COMPONENTS] = {}
+    recorder_helper.async_initialize_recorder(hass)
+    db_url = f"sqlite:///{os.path.join(tmpdir, 'benchmark.db')}"
+    assert await async_setup_component(
+        hass, recorder.DOMAIN, {recorder.DOMAIN: {recorder.CONF_DB_URL: db_url}}
+    )
+    await hass.async_start()
+    instance = recorder.get_instance(hass)
+    await instance.async_recorder_ready.wait()
+    return instance
+
+
+@benchmark
+async def recorder_state_changes(hass):
+    """Record a million state changes of 1000 sensors into SQLite."""
+    state_changes = 10**6
+    batch_size = 10**4
+    entity_ids = [f"sensor.power_{idx}" for idx in range(1000)]
+    attributes = {"unit_of_measurement": "W", "device_class": "power"}
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        instance = await _async_setup_recorder(hass, tmpdir)
+
+        start = timer()
+
+        for batch_start in range(0, state_changes, batch_size):
+            for idx in range(batch_start, batch_start + batch_size):
+                hass.states.async_set(entity_ids[idx % 1000], str(idx), attributes)
+            await hass.async_block_till_done()
+            # Keep the queue from growing past the backlog limit
+            await instance.async_block_till_done()
+
+        # pylint: disable-next=protected-access
+        instance._async_commit(dt_util.utcnow())
+        await instance.async_block_till_done()
+
+        runtime = timer() - start
+        await hass.async_stop()
+
+    print(f"{state_changes / runtime:.0f} rows/sec")
+
+    return runtime
+
+
+@benchmark
+async def statistics_during_period_reduced(hass):
+    """Reduce 2 years of hourly statistics of 500 statistic_ids to months."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import db_schema, statistics
+
+    statistic_ids = [f"sensor.energy_{idx}" for idx in range(500)]
+    hours = 2 * 365 * 24
+    end = dt_util.start_of_local_day().replace(day=1)
+    start = end - timedelta(hours=hours)
+
+    def _insert_statistics(instance):
+        """Insert the hourly statistics."""
+        start_ts = start.timestamp()
+        with instance.engine.begin() as conn:
+            for metadata_id, statistic_id in enumerate(statistic_ids, 1):
+                conn.execute(
+                    db_schema.StatisticsMeta.__table__.insert(),
+                    {
+                        "id": metadata_id,
+                        "statistic_id": statistic_id,
+                        "source": "recorder",
+                        "unit_of_measurement": "kWh",
+                        "has_mean": True,
+                        "has_sum": True,
+                    },
+                )
+                conn.execute(
+                    db_schema.Statistics.__table__.insert(),
+                    [
+                        {
+                            "metadata_id": metadata_id,
+                            "created_ts": start_ts,
+                            "start_ts": start_ts + hour * 3600,
+                            "mean": hour % 24,
+                            "min": 0,
+                            "max": 24,
+                            "state": hour,
+                            "sum": hour,
+                        }
+                        for hour in range(hours)
+                    ],
+                )
+
+    def _statistics_during_period(instance, reduce_in_database):
+        """Run the query and return the runtime."""
+        # pylint: disable-next=protected-access
+        dialect_name = instance._dialect_name
+        if not reduce_in_database:
+            # pylint: disable-next=protected-access
+            instance._dialect_name = None
+        query_start = timer()
+        statistics.statistics_during_period(
+            hass,
+            start,
+            end,
+            set(statistic_ids),
+            "month",
+            None,
+            {"mean", "min", "max", "sum"},
+        )
+        runtime = timer() - query_start
+        # pylint: disable-next=protected-access
+        instance._dialect_name = dialect_name
+        return runtime
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        instance = await _async_setup_recorder(hass, tmpdir)
+        await instance.async_add_executor_job(_insert_statistics, instance)
+        python_runtime = await instance.async_add_executor_job(
+            _statistics_during_period, instance, False
+        )
+        runtime = await instance.async_add_executor_job(
+            _statistics_during_period, instance, True
+        )
+        await hass.async_stop()
+
+    print(f"Reduced in Python in {python_runtime}s")
+
+    return runtime
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -314,6 +586,150 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def mqtt_topic_matching(hass):
+    """Match 100k MQTT messages against 10k wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+    trie = TopicTrie()
+    for i in range(10**4):
+        device = f"device_{i // 2}"
+        if i % 2:
+            trie.add(f"tasmota/{device}/+/STATE", i)
+        else:
+            trie.add(f"zigbee2mqtt/{device}/#", i)
+    topics = [
+        f"tasmota/device_{i % 5000}/tele/STATE"
+        if i % 2
+        else f"zigbee2mqtt/device_{i % 5000}/availability"
+        for i in range(10**4)
+    ]
+
+    start = timer()
+    for i in range(10**5):
+        trie.match(topics[i % 10**4])
+    return timer() - start
+
+
+@benchmark
+async def mqtt_retained_flood(hass):
+    """Receive a retained message for each of 20k subscribed topics."""
+    # pylint: disable=import-outside-toplevel
+    from paho.mqtt.client import MQTTMessage
+
+    from homeassistant.components.mqtt.client import MQTT
+    from homeassistant.components.mqtt.const import DATA_MQTT
+    from homeassistant.components.mqtt.models import MqttData
+
+    client = MQTT(hass, None, {})
+    hass.data[DATA_MQTT] = mqtt_data = MqttData(config=[], client=client)
+    client.start(mqtt_data)
+
+    count = 0
+    messages_to_receive = 2 * 10**4
+    settled = asyncio.Event()
+
+    @core.callback
+    def message_received(_msg):
+        """Count the received messages."""
+        nonlocal count
+        count += 1
+        if count == messages_to_receive:
+            settled.set()
+
+    messages = []
+    for i in range(messages_to_receive):
+        topic = f"zigbee2mqtt/device_{i}"
+        await client.async_subscribe(topic, message_received, 0)
+        msg = MQTTMessage(topic=topic.encode("utf-8"))
+        msg.payload = b'{"state": "ON", "linkquality": 120}'
+        msg.retain = True
+        messages.append(msg)
+
+    def receive_messages():
+        """Receive the messages in the thread of the paho client."""
+        for msg in messages:
+            client._mqtt_on_message(None, None, msg)
+
+    start = timer()
+    await hass.async_add_executor_job(receive_messages)
+    await settled.wait()
+    runtime = timer() - start
+    client.cleanup()
+    return runtime
+
+
+@benchmark
+async def bluetooth_advertisement_batches(hass):
+    """Receive 200k advertisements of 500 devices in batches from 8 proxies."""
+    # pylint: disable=import-outside-toplevel
+    from bleak.backends.device import BLEDevice
+    from bleak.backends.scanner import AdvertisementData
+    from bleak_retry_connector import BleakSlotManager
+    from bluetooth_adapters import get_adapters
+
+    from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
+    from homeassistant.components.bluetooth.manager import BluetoothManager
+    from homeassistant.components.bluetooth.match import IntegrationMatcher
+    from homeassistant.components.bluetooth.storage import BluetoothStorage
+
+    integration_matcher = IntegrationMatcher([])
+    integration_matcher.async_setup()
+    manager = BluetoothManager(
+        hass,
+        integration_matcher,
+        get_adapters(),
+        BluetoothStorage(hass),
+        BleakSlotManager(),
+    )
+
+    count = 0
+
+    @core.callback
+    def advertisement_received(_service_info, _change):
+        """Count the dispatched advertisements."""
+        nonlocal count
+        count += 1
+
+    manager.async_register_callback(advertisement_received, {"connectable": False})
+
+    addresses = [f"AA:BB:CC:DD:{i // 256:02X}:{i % 256:02X}" for i in range(500)]
+    devices = {address: BLEDevice(address, "sensor", {}, -60) for address in addresses}
+    batches = []
+    for batch in range(2000):
+        service_infos = []
+        for i in range(100):
+            address = addresses[(batch * 100 + i) % len(addresses) // 4 * 4]
+            # Devices repeat their payload and change it every 10th batch
+            manufacturer_data = {1: bytes([batch // 10 % 256])}
+            service_infos.append(
+                BluetoothServiceInfoBleak(
+                    name="sensor",
+                    address=address,
+                    rssi=-60,
+                    manufacturer_data=manufacturer_data,
+                    service_data={},
+                    service_uuids=[],
+                    source=f"proxy_{batch % 8}",
+                    device=devices[address],
+                    advertisement=AdvertisementData(
+                        "sensor", manufacturer_data, {}, [], -127, -60, ()
+                    ),
+                    connectable=False,
+                    time=batch + i / 100,
+                )
+            )
+        batches.append(service_infos)
+
+    start = timer()
+    for service_infos in batches:
+        manager.scanner_advs_received(service_infos)
+    runtime = timer() - start
+    print(f"Dispatched {count} of {len(batches) * 100} advertisements")
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -23,6 +23,7 @@ from .exceptions import DependencyError, HomeAssistantError
 from .helpers.issue_registry import IssueSeverity, async_create_issue
 from .helpers.typing import ConfigType
 from .util import dt as dt_util, ensure_unique_string
+from .util.timeline import TRACK_MAIN, Timeline
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,6 +55,24 @@ DATA_SETUP_STARTED = "setup_started"
 # setting up a component.
 DATA_SETUP_TIME = "setup_time"
 
+# DATA_PRE_IMPORTS is a dict[str, asyncio.Task[None]], indicating components which
+# are being imported in the executor before they are set up:
+# - Tasks are added to DATA_PRE_IMPORTS during bootstrap, the key is the domain
+#   being imported.
+# - Tasks are removed from DATA_PRE_IMPORTS when the import is done, regardless
+#   of if the import was successful or not.
+DATA_PRE_IMPORTS = "setup_pre_imports"
+
+# DATA_IMPORT_TIME is a dict [str, timedelta], indicating how time was spent
+# importing a component and its platforms before it was set up.
+DATA_IMPORT_TIME = "import_time"
+
+# DATA_STARTUP_TIMELINE is a Timeline, indicating the phases of the startup are
+# being recorded:
+# - The timeline is added by bootstrap when Home Assistant is started with
+#   --startup-trace and removed once the startup trace is written.
+DATA_STARTUP_TIMELINE = "startup_timeline"
+
 DATA_DEPS_REQS = "deps_reqs_processed"
 
 SLOW_SETUP_WARNING = 10
@@ -209,17 +228,21 @@ async def _async_setup_component(
         log_error(str(err))
         return False
 
-    # Some integrations fail on import because they call functions incorrectly.
-    # So we do it before validating config to catch these errors.
-    try:
-        component = integration.get_component()
-    except ImportError as err:
-        log_error(f"Unable to import component: {err}", err)
-        return False
+    with async_record_startup_phase(hass, "import", "import", domain):
+        await _async_wait_pre_import(hass, domain)
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+        # Some integrations fail on import because they call functions incorrectly.
+        # So we do it before validating config to catch these errors.
+        try:
+            component = integration.get_component()
+        except ImportError as err:
+            log_error(f"Unable to import component: {err}", err)
+            return False
+
+    with async_record_startup_phase(hass, "config validation", "config", domain):
+        processed_config = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
 
     if processed_config is None:
         log_error("Invalid config.")
@@ -305,6 +328,8 @@ async def _async_setup_component(
             end = timer()
             if warn_task:
                 warn_task.cancel()
+            if (timeline := hass.data.get(DATA_STARTUP_TIMELINE)) is not None:
+                timeline.add_phase("async_setup", "setup", start, end, domain)
         _LOGGER.info("Setup of domain %s took %.1f seconds", domain, end - start)
 
         if result is False:
@@ -325,15 +350,16 @@ async def _async_setup_component(
         # call to avoid a deadlock when forwarding platforms
         hass.config.components.add(domain)
 
-        await asyncio.gather(
-            *(
-                asyncio.create_task(
-                    entry.async_setup(hass, integration=integration),
-                    name=f"config entry setup {entry.title} {entry.domain} {entry.entry_id}",
+        with async_record_startup_phase(hass, "config entries", "setup", domain):
+            await asyncio.gather(
+                *(
+                    asyncio.create_task(
+                        entry.async_setup(hass, integration=integration),
+                        name=f"config entry setup {entry.title} {entry.domain} {entry.entry_id}",
+                    )
+                    for entry in hass.config_entries.async_entries(domain)
                 )
-                for entry in hass.config_entries.async_entries(domain)
             )
-        )
 
     # Cleanup
     if domain in hass.data[DATA_SETUP]:
@@ -373,6 +399,8 @@ async def async_prepare_setup_platform(
         log_error(str(err))
         return None
 
+    await _async_wait_pre_import(hass, integration.domain)
+
     try:
         platform = integration.get_platform(domain)
     except ImportError as exc:
@@ -401,6 +429,18 @@ async def async_prepare_setup_platform(
     return platform
 
 
+async def _async_wait_pre_import(hass: core.HomeAssistant, domain: str) -> None:
+    """Wait until an integration imported in the executor is imported.
+
+    Importing the same module in the event loop would block the loop on the
+    import lock held by the executor.
+    """
+    if (pre_imports := hass.data.get(DATA_PRE_IMPORTS)) and (
+        pre_import := pre_imports.get(domain)
+    ):
+        await asyncio.wait((pre_import,))
+
+
 async def async_process_deps_reqs(
     hass: core.HomeAssistant, config: ConfigType, integration: loader.Integration
 ) -> None:
@@ -413,13 +453,18 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
-    if failed_deps := await _async_process_dependencies(hass, config, integration):
+    with async_record_startup_phase(hass, "dependencies", "setup", integration.domain):
+        failed_deps = await _async_process_dependencies(hass, config, integration)
+    if failed_deps:
         raise DependencyError(failed_deps)
 
     async with hass.timeout.async_freeze(integration.domain):
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+        with async_record_startup_phase(
+            hass, "requirements", "requirements", integration.domain
+        ):
+            await requirements.async_get_integration_with_requirements(
+                hass, integration.domain
+            )
 
     processed.add(integration.domain)
 
@@ -498,6 +543,20 @@ def async_get_loaded_integrations(hass: core.HomeAssistant) -> set[str]:
     return integrations
 
 
+@contextlib.contextmanager
+def async_record_startup_phase(
+    hass: core.HomeAssistant, name: str, category: str, track: str = TRACK_MAIN
+) -> Generator[None, None, None]:
+    """Record a phase of the startup if the startup is being traced."""
+    timeline: Timeline | None = hass.data.get(DATA_STARTUP_TIMELINE)
+    if timeline is None:
+        yield
+        return
+
+    with timeline.phase(name, category, track):
+        yield
+
+
 @contextlib.contextmanager
 def async_start_setup(
     hass: core.HomeAssistant, components: Iterable[str]
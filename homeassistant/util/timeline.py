@@ -0,0 +1,89 @@
+"""Record a timeline of phases in the Chrome trace event format.
+
+The trace can be opened with chrome://tracing or https://ui.perfetto.dev.
+"""
+from __future__ import annotations
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any
+
+TRACK_MAIN = "main"
+
+_PROCESS_ID = 1
+
+
+class Timeline:
+    """A timeline of named phases.
+
+    Phases are grouped in tracks, which trace viewers show as threads. Phases
+    in the same track should not overlap unless one is nested in the other.
+    """
+
+    __slots__ = ("_start", "_tracks", "_events")
+
+    def __init__(self) -> None:
+        """Initialize the timeline."""
+        self._start = perf_counter()
+        self._tracks: dict[str, int] = {}
+        self._events: list[dict[str, Any]] = []
+
+    @contextmanager
+    def phase(
+        self,
+        name: str,
+        category: str,
+        track: str = TRACK_MAIN,
+        args: dict[str, Any] | None = None,
+    ) -> Generator[None, None, None]:
+        """Record the phase that runs within the context."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, category, start, perf_counter(), track, args)
+
+    def add_phase(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        track: str = TRACK_MAIN,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Record a phase between two time.perf_counter() values."""
+        if (thread_id := self._tracks.get(track)) is None:
+            thread_id = self._tracks[track] = len(self._tracks) + 1
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - self._start) * 1_000_000),
+            "dur": round((end - start) * 1_000_000),
+            "pid": _PROCESS_ID,
+            "tid": thread_id,
+        }
+        if args:
+            event["args"] = args
+        self._events.append(event)
+
+    def as_trace_events(self) -> dict[str, Any]:
+        """Return the timeline in the Chrome trace event format."""
+        return {
+            "traceEvents": [
+                *(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": _PROCESS_ID,
+                        "tid": thread_id,
+                        "args": {"name": track},
+                    }
+                    for track, thread_id in self._tracks.items()
+                ),
+                *self._events,
+            ],
+            "displayTimeUnit": "ms",
+        }
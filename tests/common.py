@@ -1272,6 +1272,10 @@ def mock_storage(
         "homeassistant.helpers.storage.Store._async_write_data",
         side_effect=mock_write_data,
         autospec=True,
+    ), patch(
+        "homeassistant.helpers.storage.JournaledStore._async_write_data",
+        side_effect=mock_write_data,
+        autospec=True,
     ), patch(
         "homeassistant.helpers.storage.Store.async_remove",
         side_effect=mock_remove,
@@ -14,6 +14,7 @@ from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth import (
     MONOTONIC_TIME,
     BaseHaRemoteScanner,
+    BluetoothServiceInfoBleak,
     HaBluetoothConnector,
     storage,
 )
@@ -638,3 +639,85 @@ async def test_scanner_stops_responding(
 
     cancel()
     unsetup()
+
+
+async def test_remote_scanner_batch_of_advertisements(
+    hass: HomeAssistant, enable_bluetooth: None
+) -> None:
+    """Test the remote scanner hands a batch of advertisements over at once."""
+    manager = _get_manager()
+    batches: list[list[BluetoothServiceInfoBleak]] = []
+
+    @callback
+    def _new_infos_callback(service_infos: list[BluetoothServiceInfoBleak]) -> None:
+        batches.append(service_infos)
+        manager.scanner_advs_received(service_infos)
+
+    class FakeScanner(BaseHaRemoteScanner):
+        """A fake remote scanner."""
+
+        def inject_advertisements(
+            self, advertisements: list[tuple[BLEDevice, AdvertisementData]]
+        ) -> None:
+            """Inject a batch of advertisements."""
+            now = MONOTONIC_TIME()
+            self._async_on_advertisements(
+                (
+                    device.address,
+                    advertisement_data.rssi,
+                    device.name,
+                    advertisement_data.service_uuids,
+                    advertisement_data.service_data,
+                    advertisement_data.manufacturer_data,
+                    advertisement_data.tx_power,
+                    {"scanner_specific_data": "test"},
+                    now,
+                )
+                for device, advertisement_data in advertisements
+            )
+
+    connector = (
+        HaBluetoothConnector(MockBleakClient, "mock_bleak_client", lambda: False),
+    )
+    scanner = FakeScanner(
+        hass,
+        "esp32",
+        "esp32",
+        manager.scanner_adv_received,
+        connector,
+        True,
+        _new_infos_callback,
+    )
+    unsetup = scanner.async_setup()
+    cancel = manager.async_register_scanner(scanner, True)
+
+    switchbot_device = generate_ble_device("44:44:33:11:23:45", "wohand", {})
+    switchbot_device_adv = generate_advertisement_data(
+        local_name="wohand", manufacturer_data={1: b"\x01"}, rssi=-100
+    )
+    switchbot_device_adv_2 = generate_advertisement_data(
+        local_name="wohand", manufacturer_data={2: b"\x02"}, rssi=-90
+    )
+    scanner.inject_advertisements(
+        [
+            (switchbot_device, switchbot_device_adv),
+            (switchbot_device, switchbot_device_adv_2),
+        ]
+    )
+
+    assert len(batches) == 1
+    assert [service_info.manufacturer_data for service_info in batches[0]] == [
+        {1: b"\x01"},
+        # The advertisements are merged like single advertisements
+        {1: b"\x01", 2: b"\x02"},
+    ]
+    data = scanner.discovered_devices_and_advertisement_data
+    assert data[switchbot_device.address][1].rssi == -90
+    service_info = bluetooth.async_last_service_info(
+        hass, switchbot_device.address, True
+    )
+    assert service_info is not None
+    assert service_info.manufacturer_data == {1: b"\x01", 2: b"\x02"}
+
+    cancel()
+    unsetup()
@@ -20,6 +20,7 @@ from homeassistant.components.bluetooth import (
     HaBluetoothConnector,
     async_ble_device_from_address,
     async_get_advertisement_callback,
+    async_get_advertisements_callback,
     async_get_fallback_availability_interval,
     async_get_learned_advertising_interval,
     async_scanner_count,
@@ -1199,3 +1200,73 @@ async def test_set_fallback_interval_big(
 
     # We should forget fallback interval after it expires
     assert async_get_fallback_availability_interval(hass, "44:44:33:11:23:12") is None
+
+
+async def test_batched_advertisements_are_deduplicated(
+    hass: HomeAssistant,
+    enable_bluetooth: None,
+    register_hci0_scanner: None,
+) -> None:
+    """Test repeated advertisements of an address in a batch are handled once."""
+    callbacks: list[BluetoothServiceInfoBleak] = []
+
+    @callback
+    def _fake_subscriber(
+        service_info: BluetoothServiceInfoBleak,
+        change: BluetoothChange,
+    ) -> None:
+        """Fake subscriber for the BleakScanner."""
+        callbacks.append(service_info)
+
+    cancel = bluetooth.async_register_callback(
+        hass,
+        _fake_subscriber,
+        {"connectable": False},
+        BluetoothScanningMode.ACTIVE,
+    )
+
+    def _service_info(
+        address: str, manufacturer_data: dict[int, bytes], time: float
+    ) -> BluetoothServiceInfoBleak:
+        device = generate_ble_device(address, "wohand")
+        adv = generate_advertisement_data(
+            local_name="wohand", manufacturer_data=manufacturer_data, rssi=-60
+        )
+        return BluetoothServiceInfoBleak(
+            name="wohand",
+            address=address,
+            rssi=-60,
+            manufacturer_data=manufacturer_data,
+            service_data={},
+            service_uuids=[],
+            source="hci0",
+            device=device,
+            advertisement=adv,
+            connectable=False,
+            time=time,
+        )
+
+    async_get_advertisements_callback(hass)(
+        [
+            _service_info("44:44:33:11:23:41", {1: b"\x01"}, 1.0),
+            _service_info("44:44:33:11:23:42", {1: b"\x01"}, 1.0),
+            _service_info("44:44:33:11:23:41", {1: b"\x01"}, 2.0),
+            _service_info("44:44:33:11:23:41", {1: b"\x02"}, 3.0),
+            _service_info("44:44:33:11:23:41", {1: b"\x02"}, 4.0),
+        ]
+    )
+
+    assert [
+        (service_info.address, service_info.manufacturer_data, service_info.time)
+        for service_info in callbacks
+    ] == [
+        ("44:44:33:11:23:41", {1: b"\x01"}, 2.0),
+        ("44:44:33:11:23:42", {1: b"\x01"}, 1.0),
+        ("44:44:33:11:23:41", {1: b"\x02"}, 4.0),
+    ]
+    last_service_info = bluetooth.async_last_service_info(
+        hass, "44:44:33:11:23:41", False
+    )
+    assert last_service_info is not None
+    assert last_service_info.time == 4.0
+    cancel()
@@ -523,6 +523,68 @@ async def test_history_stream_historical_only(
     }
 
 
+@pytest.mark.parametrize(
+    ("minimal_response", "no_attributes"), [(False, False), (True, True)]
+)
+async def test_history_stream_historical_only_chunked(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Test history stream sending the historical states in chunks."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state, attributes in (
+        ("on", {"any": "attr"}),
+        ("off", {"any": "attr"}),
+        ("off", {"any": "changed"}),
+        ("on", {"any": "changed"}),
+    ):
+        hass.states.async_set("sensor.one", state, attributes=attributes)
+        await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.two", "off", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    request = {
+        "type": "history/stream",
+        "entity_ids": ["sensor.one", "sensor.two"],
+        "start_time": now.isoformat(),
+        "end_time": end_time.isoformat(),
+        "significant_changes_only": False,
+        "no_attributes": no_attributes,
+        "minimal_response": minimal_response,
+    }
+    await client.send_json({"id": 1, **request})
+    response = await client.receive_json()
+    assert response["success"]
+    expected = (await client.receive_json())["event"]
+
+    await client.send_json({"id": 2, **request, "chunk_size": 2})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 2
+
+    states: dict[str, list[dict]] = {}
+    while "start_time" not in (event := (await client.receive_json())["event"]):
+        assert sum(len(state_list) for state_list in event["states"].values()) <= 2
+        for entity_id, state_list in event["states"].items():
+            states.setdefault(entity_id, []).extend(state_list)
+
+    assert event == {
+        "end_time": expected["end_time"],
+        "start_time": expected["start_time"],
+        "states": {},
+    }
+    assert states == expected["states"]
+    assert len(states["sensor.one"]) == (3 if minimal_response else 4)
+
+
 async def test_history_stream_significant_domain_historical_only(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -40,13 +40,13 @@ from homeassistant.const import (
     ATTR_MODEL,
     ATTR_SERVICE,
     ATTR_SW_VERSION,
+    EVENT_STATE_CHANGED,
     STATE_OFF,
     STATE_ON,
     STATE_UNAVAILABLE,
     __version__ as hass_version,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import TRACK_STATE_CHANGE_CALLBACKS
 
 from tests.common import async_mock_service
 
@@ -64,9 +64,9 @@ async def test_accessory_cancels_track_state_change_on_stop(
         "homeassistant.components.homekit.accessories.HomeAccessory.async_update_state"
     ):
         await acc.run()
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS][entity_id]) == 1
+    assert hass.bus.async_entity_listeners(EVENT_STATE_CHANGED)[entity_id] == 1
     await acc.stop()
-    assert entity_id not in hass.data[TRACK_STATE_CHANGE_CALLBACKS]
+    assert entity_id not in hass.bus.async_entity_listeners(EVENT_STATE_CHANGED)
 
 
 async def test_home_accessory(hass: HomeAssistant, hk_driver) -> None:
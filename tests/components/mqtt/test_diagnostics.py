@@ -48,7 +48,11 @@ async def test_entry_diagnostics(
         "connected": True,
         "devices": [],
         "mqtt_config": default_config,
-        "mqtt_debug_info": {"entities": [], "triggers": []},
+        "mqtt_debug_info": {
+            "entities": [],
+            "payload_json": {"parsed": 0, "reused": 0},
+            "triggers": [],
+        },
     }
 
     # Discover a device with an entity and a trigger
@@ -132,7 +136,10 @@ async def test_entry_diagnostics(
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": default_config,
-        "mqtt_debug_info": expected_debug_info,
+        "mqtt_debug_info": {
+            **expected_debug_info,
+            "payload_json": {"parsed": 0, "reused": 0},
+        },
     }
 
     assert await get_diagnostics_for_device(
@@ -259,7 +266,10 @@ async def test_redact_diagnostics(
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": expected_config,
-        "mqtt_debug_info": expected_debug_info,
+        "mqtt_debug_info": {
+            **expected_debug_info,
+            "payload_json": {"parsed": 0, "reused": 0},
+        },
     }
 
     assert await get_diagnostics_for_device(
@@ -8,6 +8,7 @@ import ssl
 from typing import Any, TypedDict
 from unittest.mock import ANY, MagicMock, call, mock_open, patch
 
+from paho.mqtt.client import MQTTMessage
 import pytest
 import voluptuous as vol
 
@@ -16,11 +17,13 @@ from homeassistant.components.mqtt import debug_info
 from homeassistant.components.mqtt.client import EnsureJobAfterCooldown
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
+from homeassistant.components.mqtt.topic_trie import TopicTrie
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
 from homeassistant.const import (
     ATTR_ASSUMED_STATE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
@@ -895,6 +898,142 @@ async def test_handle_logging_on_writing_the_entity_state(
         assert "Exception raised when updating state of" in caplog.text
 
 
+def _mqtt_message(topic: str, payload: bytes) -> MQTTMessage:
+    """Return a message like the paho client receives it."""
+    msg = MQTTMessage(topic=topic.encode("utf-8"))
+    msg.payload = payload
+    return msg
+
+
+@patch("homeassistant.components.mqtt.client.MAX_RECEIVED_MESSAGES_BATCH_SIZE", 2)
+async def test_received_messages_are_handled_in_batches(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test a burst of received messages wakes up the event loop once."""
+    mqtt_mock = await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    with patch.object(
+        hass.loop, "call_soon_threadsafe", wraps=hass.loop.call_soon_threadsafe
+    ) as mock_call_soon_threadsafe:
+        # The loop does not run while the messages are received
+        for index in range(3):
+            mqtt_mock._mqtt_on_message(
+                None, None, _mqtt_message(f"test-topic/{index}", b"test-payload")
+            )
+        # The first batch schedules the second one
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    assert [
+        mock_call[1][0].__name__
+        for mock_call in mock_call_soon_threadsafe.mock_calls
+        if getattr(mock_call[1][0], "__name__", None)
+        == "_mqtt_handle_received_messages"
+    ] == ["_mqtt_handle_received_messages"]
+    assert [call.topic for call in calls] == [
+        "test-topic/0",
+        "test-topic/1",
+        "test-topic/2",
+    ]
+
+
+@pytest.mark.parametrize(
+    "hass_config",
+    [
+        {
+            mqtt.DOMAIN: {
+                "sensor": [
+                    {
+                        "name": "test-sensor",
+                        "state_topic": "test/state",
+                        "json_attributes_topic": "test/attributes",
+                    }
+                ]
+            }
+        }
+    ],
+)
+async def test_state_writes_are_coalesced_per_batch(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test an entity writes its state once per batch unless a topic repeats."""
+    mqtt_mock = await mqtt_mock_entry()
+    await hass.async_block_till_done()
+    states: list[str] = []
+
+    @callback
+    def record_state(event: ha.Event) -> None:
+        if new_state := event.data["new_state"]:
+            states.append(new_state.state)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, record_state)
+
+    mqtt_mock._mqtt_handle_messages(
+        [
+            _mqtt_message("test/state", b"1"),
+            _mqtt_message("test/attributes", b'{"key": "value"}'),
+        ]
+    )
+    await hass.async_block_till_done()
+    assert states == ["1"]
+    state = hass.states.get("sensor.test_sensor")
+    assert state.attributes["key"] == "value"
+
+    mqtt_mock._mqtt_handle_messages(
+        [_mqtt_message("test/state", b"2"), _mqtt_message("test/state", b"3")]
+    )
+    await hass.async_block_till_done()
+    assert states == ["1", "2", "3"]
+
+
+@pytest.mark.parametrize(
+    "hass_config",
+    [
+        {
+            mqtt.DOMAIN: {
+                "sensor": [
+                    {
+                        "name": "temperature",
+                        "state_topic": "test/state",
+                        "value_template": "{{ value_json.temperature }}",
+                    },
+                    {
+                        "name": "humidity",
+                        "state_topic": "test/state",
+                        "value_template": "{{ value_json.humidity }}",
+                    },
+                ]
+            }
+        }
+    ],
+)
+async def test_value_templates_share_parsed_payload(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test the value templates of a message parse its JSON payload once."""
+    await mqtt_mock_entry()
+    payload_json_cache = hass.data["mqtt"].payload_json_cache
+
+    async_fire_mqtt_message(hass, "test/state", '{"temperature": 21, "humidity": 50}')
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.temperature").state == "21"
+    assert hass.states.get("sensor.humidity").state == "50"
+    assert payload_json_cache.parsed == 1
+    assert payload_json_cache.reused == 1
+
+    async_fire_mqtt_message(hass, "test/state", '{"temperature": 22, "humidity": 50}')
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.temperature").state == "22"
+    assert payload_json_cache.parsed == 2
+    assert payload_json_cache.reused == 2
+
+
 async def test_receiving_non_utf8_message_gets_logged(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -1223,6 +1362,69 @@ async def test_subscribe_topic_level_wildcard_and_wildcard_no_match(
     assert len(calls) == 0
 
 
+async def test_subscribe_invalidates_only_matching_topics(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test subscribing only drops the cached matches of the topics it matches."""
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic/a", record_calls)
+    unsub = await mqtt.async_subscribe(hass, "test-topic/+", record_calls)
+
+    async_fire_mqtt_message(hass, "test-topic/a", "test-payload")
+    async_fire_mqtt_message(hass, "other-topic/b", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    with patch.object(
+        TopicTrie, "match", autospec=True, side_effect=TopicTrie.match
+    ) as mock_match:
+        async_fire_mqtt_message(hass, "test-topic/a", "test-payload")
+        async_fire_mqtt_message(hass, "other-topic/b", "test-payload")
+        await hass.async_block_till_done()
+    assert [call[1][1] for call in mock_match.mock_calls] == ["test-topic/a"]
+    assert len(calls) == 5
+    assert {call.subscribed_topic for call in calls[2:]} == {
+        "test-topic/a",
+        "test-topic/+",
+        "test-topic/#",
+    }
+
+    unsub()
+
+    async_fire_mqtt_message(hass, "test-topic/a", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 7
+
+
+@patch("homeassistant.components.mqtt.client.MAX_MATCHING_SUBSCRIPTIONS_CACHE_SIZE", 2)
+async def test_matching_subscriptions_cache_is_bounded(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test the cache of matching subscriptions evicts the oldest topic."""
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    for topic in ("test-topic/a", "test-topic/b", "test-topic/c"):
+        async_fire_mqtt_message(hass, topic, "test-payload")
+
+    with patch.object(
+        TopicTrie, "match", autospec=True, side_effect=TopicTrie.match
+    ) as mock_match:
+        async_fire_mqtt_message(hass, "test-topic/c", "test-payload")
+        async_fire_mqtt_message(hass, "test-topic/a", "test-payload")
+        await hass.async_block_till_done()
+    assert [call[1][1] for call in mock_match.mock_calls] == ["test-topic/a"]
+    assert len(calls) == 5
+
+
 async def test_subscribe_topic_sys_root(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -0,0 +1,94 @@
+"""Test the MQTT topic trie."""
+from paho.mqtt.matcher import MQTTMatcher
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie, topic_matches
+
+TOPIC_FILTERS = [
+    "#",
+    "+",
+    "+/+",
+    "sport/#",
+    "sport/+",
+    "sport/tennis/#",
+    "sport/tennis/+",
+    "sport/tennis/player1",
+    "sport/+/player1",
+    "+/tennis/#",
+    "$SYS/#",
+    "$SYS/+/info",
+    "/+",
+    "+/",
+]
+
+TOPICS = [
+    "sport",
+    "sport/",
+    "sport/tennis",
+    "sport/tennis/player1",
+    "sport/tennis/player1/ranking",
+    "sport/golf/player1",
+    "other/tennis",
+    "/finance",
+    "$SYS/broker/info",
+    "$SYS",
+    "",
+]
+
+
+def _paho_matches(topic_filter: str, topic: str) -> bool:
+    """Return if paho matches a topic filter with a topic."""
+    matcher = MQTTMatcher()
+    matcher[topic_filter] = True
+    return next(matcher.iter_match(topic), False)
+
+
+@pytest.mark.parametrize("topic", TOPICS)
+def test_match(topic: str) -> None:
+    """Test the trie and topic_matches match topics like paho does."""
+    trie: TopicTrie[str] = TopicTrie()
+    for topic_filter in TOPIC_FILTERS:
+        trie.add(topic_filter, topic_filter)
+
+    expected = [
+        topic_filter
+        for topic_filter in TOPIC_FILTERS
+        if _paho_matches(topic_filter, topic)
+    ]
+    assert sorted(trie.match(topic)) == sorted(expected)
+    assert [
+        topic_filter
+        for topic_filter in TOPIC_FILTERS
+        if topic_matches(topic_filter, topic)
+    ] == expected
+
+
+def test_add_remove() -> None:
+    """Test adding and removing values of topic filters."""
+    trie: TopicTrie[int] = TopicTrie()
+    trie.add("sport/+/player1", 1)
+    trie.add("sport/+/player1", 2)
+    trie.add("sport/#", 3)
+
+    assert "sport/+/player1" in trie
+    assert "sport/+" not in trie
+    assert sorted(trie.values()) == [1, 2, 3]
+    assert sorted(trie.match("sport/tennis/player1")) == [1, 2, 3]
+
+    trie.remove("sport/+/player1", 1)
+    assert sorted(trie.match("sport/tennis/player1")) == [2, 3]
+
+    trie.remove("sport/+/player1", 2)
+    assert "sport/+/player1" not in trie
+    assert trie.match("sport/tennis/player1") == [3]
+    # The nodes of the removed filter are pruned
+    assert list(trie._root.children["sport"].children) == ["#"]
+
+    with pytest.raises(KeyError):
+        trie.remove("sport/+/player1", 2)
+    with pytest.raises(ValueError):
+        trie.remove("sport/#", 2)
+
+    trie.remove("sport/#", 3)
+    assert not trie._root.children
+    assert list(trie.values()) == []
@@ -14,6 +14,7 @@ from homeassistant.components.profiler import (
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_STORAGE_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
@@ -27,6 +28,7 @@ from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import storage
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -237,6 +239,35 @@ async def test_log_scheduled(
     await hass.async_block_till_done()
 
 
+async def test_log_storage_stats(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test logging the write stats of stores."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_STORAGE_STATS)
+
+    statistics = storage.async_get_write_statistics(hass)
+    statistics["core.small"] = storage.StoreWriteStatistics(1, 0, 10)
+    statistics["core.large"] = storage.StoreWriteStatistics(5, 2, 5000)
+
+    await hass.services.async_call(DOMAIN, SERVICE_LOG_STORAGE_STATS, {}, blocking=True)
+
+    assert (
+        "Storage writes for core.large: 5 writes, 2 skipped, 5000 bytes written"
+        in caplog.text
+    )
+    assert caplog.text.index("core.large") < caplog.text.index("core.small")
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 async def test_lru_stats(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
     """Test logging lru stats."""
 
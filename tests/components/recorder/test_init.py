@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import sqlite3
 import threading
+import time
 from typing import cast
 from unittest.mock import MagicMock, Mock, patch
 
@@ -35,8 +36,10 @@ from homeassistant.components.recorder.const import (
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
+    MAX_QUEUE_BACKLOG_MIN_VALUE,
     SupportedDialect,
 )
+from homeassistant.components.recorder.core import _coalesce_state_changed_tasks
 from homeassistant.components.recorder.db_schema import (
     SCHEMA_VERSION,
     EventData,
@@ -60,6 +63,7 @@ from homeassistant.components.recorder.table_managers import (
     state_attributes as state_attributes_table_manager,
     states_meta as states_meta_table_manager,
 )
+from homeassistant.components.recorder.tasks import CommitTask, EventTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import (
     EVENT_COMPONENT_LOADED,
@@ -67,11 +71,12 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     MATCH_ALL,
     STATE_LOCKED,
     STATE_UNLOCKED,
 )
-from homeassistant.core import Context, CoreState, Event, HomeAssistant, callback
+from homeassistant.core import Context, CoreState, Event, HomeAssistant, State, callback
 from homeassistant.helpers import entity_registry as er, recorder as recorder_helper
 from homeassistant.setup import async_setup_component, setup_component
 from homeassistant.util import dt as dt_util
@@ -79,6 +84,7 @@ from homeassistant.util.json import json_loads
 
 from .common import (
     async_block_recorder,
+    async_recorder_block_till_done,
     async_wait_recording_done,
     convert_pending_states_to_meta,
     corrupt_db_file,
@@ -378,11 +384,8 @@ def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        if get_instance(hass).bulk_writer.states:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
@@ -420,11 +423,8 @@ def test_saving_state_with_sqlalchemy_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        if get_instance(hass).bulk_writer.states:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
@@ -1390,6 +1390,95 @@ def test_saving_sets_old_state(hass_recorder: Callable[..., HomeAssistant]) -> N
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("use_returning", [True, False])
+async def test_saving_sets_old_state_in_same_commit(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    use_returning: bool,
+) -> None:
+    """Test old state is linked for states written in bulk in the same commit."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 30}
+    )
+    assert instance.bulk_writer.use_returning is True
+    instance.bulk_writer.use_returning = use_returning
+
+    hass.states.async_set("test.one", "s1", {})
+    hass.states.async_set("test.two", "s2", {"attr": 1})
+    hass.states.async_set("test.one", "s3", {})
+    hass.states.async_set("test.one", "s4", {"attr": 2})
+    hass.states.async_set("test.two", "s5", {"attr": 1})
+    hass.bus.async_fire("test_event", {"data": 1})
+    hass.bus.async_fire("test_event")
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    assert instance.bulk_writer.states == []
+    assert instance.bulk_writer.events == []
+    hass.states.async_set("test.one", "s6", {})
+    # Removing and adding an entity again in the same commit writes
+    # two states without an old state in the commit for it
+    hass.states.async_remove("test.two")
+    hass.states.async_set("test.two", "s7", {})
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    def _get_states_and_events():
+        with session_scope(hass=hass, read_only=True) as session:
+            states = list(
+                session.query(
+                    StatesMeta.entity_id,
+                    States.state_id,
+                    States.old_state_id,
+                    States.state,
+                    StateAttributes.shared_attrs,
+                )
+                .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .outerjoin(
+                    StateAttributes,
+                    States.attributes_id == StateAttributes.attributes_id,
+                )
+            )
+            events = list(
+                session.query(EventTypes.event_type, EventData.shared_data)
+                .select_from(Events)
+                .outerjoin(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                .outerjoin(EventData, Events.data_id == EventData.data_id)
+                .filter(EventTypes.event_type == "test_event")
+            )
+            return states, events
+
+    states, events = await instance.async_add_executor_job(_get_states_and_events)
+    assert len(states) == 8
+    states_by_state = {state.state: state for state in states}
+
+    assert [states_by_state[f"s{idx}"].entity_id for idx in range(1, 8)] == [
+        "test.one",
+        "test.two",
+        "test.one",
+        "test.one",
+        "test.two",
+        "test.one",
+        "test.two",
+    ]
+    assert states_by_state["s1"].old_state_id is None
+    assert states_by_state["s2"].old_state_id is None
+    assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+    assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+    assert states_by_state["s5"].old_state_id == states_by_state["s2"].state_id
+    assert states_by_state["s6"].old_state_id == states_by_state["s4"].state_id
+    assert states_by_state[None].entity_id == "test.two"
+    assert states_by_state[None].old_state_id == states_by_state["s5"].state_id
+    assert states_by_state["s7"].old_state_id is None
+    assert states_by_state["s2"].shared_attrs == '{"attr":1}'
+    assert states_by_state["s4"].shared_attrs == '{"attr":2}'
+    assert states_by_state["s5"].shared_attrs == '{"attr":1}'
+
+    assert sorted(events, key=lambda event: event.shared_data or "") == [
+        ("test_event", None),
+        ("test_event", '{"data":1}'),
+    ]
+
+
 def test_saving_state_with_serializable_data(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -2093,6 +2182,172 @@ async def test_async_block_till_done(
     await hass.async_block_till_done()
 
 
+def test_coalesce_state_changed_tasks() -> None:
+    """Test only attribute changes superseded by a later one are coalesced."""
+    now = dt_util.utcnow()
+
+    def _state_changed_task(
+        entity_id: str, state: str | None, last_changed: datetime, seconds: int
+    ) -> EventTask:
+        new_state = None
+        if state is not None:
+            new_state = State(
+                entity_id,
+                state,
+                last_changed=last_changed,
+                last_updated=now + timedelta(seconds=seconds),
+            )
+        return EventTask(
+            Event(EVENT_STATE_CHANGED, {"entity_id": entity_id, "new_state": new_state})
+        )
+
+    on_1 = _state_changed_task("light.one", "on", now, 0)
+    attrs_2 = _state_changed_task("light.one", "on", now, 2)
+    other_3 = _state_changed_task("light.two", "on", now + timedelta(seconds=3), 3)
+    attrs_4 = _state_changed_task("light.one", "on", now, 4)
+    off_5 = _state_changed_task("light.one", "off", now + timedelta(seconds=5), 5)
+    event_6 = EventTask(Event("test_event"))
+    on_7 = _state_changed_task("light.one", "on", now + timedelta(seconds=7), 7)
+    other_8 = _state_changed_task("light.two", "off", now + timedelta(seconds=8), 8)
+    commit_9 = CommitTask()
+    off_10 = _state_changed_task("light.one", "off", now + timedelta(seconds=10), 10)
+    removed_11 = _state_changed_task("light.one", None, now, 11)
+    on_12 = _state_changed_task("light.one", "on", now + timedelta(seconds=12), 12)
+    attrs_13 = _state_changed_task("light.one", "on", now + timedelta(seconds=12), 13)
+    removed_14 = _state_changed_task("light.one", None, now, 14)
+
+    assert _coalesce_state_changed_tasks(
+        [
+            on_1,
+            attrs_2,
+            other_3,
+            attrs_4,
+            off_5,
+            event_6,
+            on_7,
+            other_8,
+            commit_9,
+            off_10,
+            removed_11,
+            on_12,
+            attrs_13,
+            removed_14,
+        ]
+    ) == [
+        on_1,
+        other_3,
+        off_5,
+        event_6,
+        on_7,
+        other_8,
+        commit_9,
+        off_10,
+        removed_11,
+        on_12,
+        attrs_13,
+        removed_14,
+    ]
+
+
+async def test_state_changes_coalesced_when_backlogged(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test state changes are coalesced when the recorder has a backlog."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+    instance.max_backlog = 8
+
+    await async_block_recorder(hass, 0.1)
+    hass.states.async_set("test.one", "on", {})
+    hass.states.async_set("test.one", "on", {"attr": 1})
+    hass.states.async_set("test.one", "on", {"attr": 2})
+    hass.states.async_set("test.one", "off", {"attr": 2})
+    hass.states.async_set("test.one", "on", {"attr": 2})
+    hass.states.async_set("test.one", "on", {"attr": 3})
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    assert "state changes for the same entity will be coalesced" in caplog.text
+
+    def _fetch_states():
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                (
+                    db_state.state,
+                    db_state.last_changed_ts is None,
+                    db_state_attributes.shared_attrs,
+                )
+                for db_state, db_state_attributes in session.query(
+                    States, StateAttributes
+                )
+                .outerjoin(
+                    StateAttributes,
+                    States.attributes_id == StateAttributes.attributes_id,
+                )
+                .order_by(States.state_id)
+            ]
+
+    assert await instance.async_add_executor_job(_fetch_states) == [
+        ("on", True, "{}"),
+        ("off", True, '{"attr":2}'),
+        ("on", True, '{"attr":2}'),
+        ("on", False, '{"attr":3}'),
+    ]
+
+    instance.max_backlog = MAX_QUEUE_BACKLOG_MIN_VALUE
+    hass.states.async_set("test.one", "off", {})
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    assert "caught up with the backlog after coalescing 2 state changes" in (
+        caplog.text
+    )
+
+
+async def test_commit_interval_stretched_when_backlogged(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the commit interval is stretched while working through a backlog."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 5}
+    )
+    await async_wait_recording_done(hass)
+
+    assert instance._stretched_commit_interval() is None
+
+    instance._drain_rate = 100
+    with patch.object(Recorder, "backlog", 400):
+        assert instance._stretched_commit_interval() is None
+    with patch.object(Recorder, "backlog", 2000):
+        assert instance._stretched_commit_interval() == 20
+    with patch.object(Recorder, "backlog", 10000):
+        assert instance._stretched_commit_interval() == 30
+
+        with patch.object(
+            instance, "_commit_event_session_or_retry"
+        ) as commit_event_session:
+            instance._last_commit_time = time.monotonic()
+            instance._periodic_commit()
+            assert not commit_event_session.called
+            instance._last_commit_time -= 30
+            instance._periodic_commit()
+            assert commit_event_session.called
+
+    # Tasks taken from the queue to be coalesced are part of the backlog
+    instance._coalesce_window_size = 5
+    assert instance.backlog == 5
+    instance._coalesce_window_size = 0
+
+    # Time the recorder was idle does not lower the drain rate
+    instance._drain_rate = 0
+    instance._last_commit_time = time.monotonic() - 3600
+    hass.states.async_set("test.one", "on")
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    assert instance._drain_rate > 10
+
+
 @pytest.mark.parametrize(
     ("db_url", "echo"),
     (
@@ -25,6 +25,7 @@ import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import InvalidEntityFormatError
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 
 def test_from_event_to_db_event() -> None:
@@ -370,6 +371,42 @@ async def test_lazy_state_handles_same_last_updated_and_last_changed(
     }
 
 
+async def test_lazy_state_serializes() -> None:
+    """Test the cached serializations of State work with LazyState."""
+    now = datetime(2021, 6, 12, 3, 4, 1, 323, tzinfo=dt_util.UTC)
+    row = PropertyMock(
+        entity_id="sensor.valid",
+        state="off",
+        attributes='{"shared":true}',
+        last_updated_ts=now.timestamp(),
+        last_changed_ts=now.timestamp(),
+        context_id_bin=None,
+        context_user_id_bin=None,
+        context_parent_id_bin=None,
+    )
+    lstate = LazyState(
+        row, {}, None, row.entity_id, row.state, row.last_updated_ts, False
+    )
+    assert json_loads(lstate.as_dict_json) == {
+        "attributes": {"shared": True},
+        "entity_id": "sensor.valid",
+        "last_changed": "2021-06-12T03:04:01.000323+00:00",
+        "last_updated": "2021-06-12T03:04:01.000323+00:00",
+        "state": "off",
+    }
+    compressed_state = lstate.as_compressed_state
+    assert compressed_state == {
+        "a": {"shared": True},
+        "c": lstate.context.id,
+        "lc": now.timestamp(),
+        "s": "off",
+    }
+    assert lstate.as_compressed_state is compressed_state
+    assert json_loads(f"{{{lstate.as_compressed_state_json}}}") == {
+        "sensor.valid": compressed_state
+    }
+
+
 @pytest.mark.parametrize(
     "time_zone", ["Europe/Berlin", "America/Chicago", "US/Hawaii", "UTC"]
 )
@@ -5,9 +5,11 @@ from unittest.mock import patch
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
+from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.components.recorder.db_schema import StatisticsShortTerm
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
@@ -16,8 +18,10 @@ from homeassistant.components.recorder.models import (
 from homeassistant.components.recorder.statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
     _generate_max_mean_min_statistic_in_sub_period_stmt,
+    _generate_reduced_statistics_during_period_stmt,
     _generate_statistics_at_time_stmt,
     _generate_statistics_during_period_stmt,
+    _utc_offset_segments,
     async_add_external_statistics,
     async_import_statistics,
     get_last_short_term_statistics,
@@ -2371,3 +2375,128 @@ def test_change_with_none(
     assert stats == {}
 
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
+@pytest.mark.parametrize(
+    "timezone",
+    ["America/New_York", "America/Regina", "Australia/Lord_Howe", "Europe/Vienna"],
+)
+@pytest.mark.parametrize("period", ["day", "week", "month"])
+@pytest.mark.freeze_time("2021-11-15 00:00:00+00:00")
+def test_reduced_statistics_match_python_reduction(
+    hass_recorder: Callable[..., HomeAssistant],
+    timezone,
+    period,
+) -> None:
+    """Test reducing statistics in the database matches reducing them in Python."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone(timezone))
+
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+
+    # Spans the daylight saving time changes in Australia, Europe and the US
+    start = dt_util.parse_datetime("2021-09-25 00:00:00+00:00")
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "last_reset": start + timedelta(hours=hour - hour % 100),
+            "mean": hour * 0.37,
+            "min": hour * 0.37 - 1,
+            "max": hour * 0.37 + 1,
+            "state": hour % 7,
+            "sum": hour * 2.5,
+        }
+        for hour in range(46 * 24)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+    for start_time, end_time in (
+        (start, None),
+        (start + timedelta(hours=5), start + timedelta(days=40, hours=3)),
+    ):
+        with patch.object(
+            statistics,
+            "_reduced_statistics_during_period",
+            wraps=statistics._reduced_statistics_during_period,
+        ) as reduced_mock:
+            reduced = statistics_during_period(
+                hass,
+                start_time,
+                end_time,
+                statistic_ids={"test:total_energy_import"},
+                period=period,
+                types=types,
+            )
+        assert reduced_mock.call_count == 1
+
+        with patch.object(instance, "_dialect_name", None):
+            python_reduced = statistics_during_period(
+                hass,
+                start_time,
+                end_time,
+                statistic_ids={"test:total_energy_import"},
+                period=period,
+                types=types,
+            )
+
+        assert reduced["test:total_energy_import"]
+        assert reduced == {
+            statistic_id: [{**row, "mean": pytest.approx(row["mean"])} for row in rows]
+            for statistic_id, rows in python_reduced.items()
+        }
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
+def test_utc_offset_segments() -> None:
+    """Test finding the UTC offsets of the configured time zone."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Vienna"))
+
+    change_ts = dt_util.parse_datetime("2021-10-31 01:00:00+00:00").timestamp()
+    start_ts = change_ts - 3 * 86400 + 0.5
+    assert _utc_offset_segments(start_ts, change_ts + 3 * 86400 + 0.5) == [
+        (start_ts, 7200.0),
+        (change_ts, 3600.0),
+    ]
+    assert _utc_offset_segments(change_ts, change_ts + 86400) == [(change_ts, 3600.0)]
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
+@pytest.mark.parametrize(
+    ("dialect_name", "dialect", "period_key"),
+    [
+        (
+            SupportedDialect.MYSQL,
+            mysql.dialect(),
+            "EXTRACT(year_month FROM timestampadd(SECOND, floor(statistics.start_ts",
+        ),
+        (
+            SupportedDialect.POSTGRESQL,
+            postgresql.dialect(),
+            "to_char(timezone(",
+        ),
+        (SupportedDialect.SQLITE, sqlite.dialect(), "strftime("),
+    ],
+)
+def test_generate_reduced_statistics_during_period_stmt(
+    dialect_name, dialect, period_key
+) -> None:
+    """Test the monthly period key and the last row join for each dialect."""
+    stmt = _generate_reduced_statistics_during_period_stmt(
+        dialect_name, "month", 0, None, 86400 * 40, [1], {"mean", "sum"}
+    )
+    compiled = str(stmt.compile(dialect=dialect))
+    assert period_key in compiled
+    assert "statistics.start_ts = anon_1.last_start_ts" in compiled
@@ -525,6 +525,44 @@ def test_compile_hourly_statistics_only_state_is_and_end_of_period(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_hourly_statistics_mean_microsecond_last_updated(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test the mean is weighted by the durations between the datetimes."""
+    zero = dt_util.utcnow()
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    offsets_and_values = [
+        (timedelta(seconds=13, microseconds=333333), 10.1),
+        (timedelta(seconds=71, microseconds=999999), -3.7),
+        (timedelta(seconds=150, microseconds=1), 21.3),
+        (timedelta(seconds=299, microseconds=654321), 7.9),
+    ]
+    with freeze_time(zero) as freezer:
+        for offset, value in offsets_and_values:
+            freezer.move_to(zero + offset)
+            hass.states.set(
+                "sensor.test1", str(value), attributes=TEMPERATURE_SENSOR_ATTRIBUTES
+            )
+    wait_recording_done(hass)
+
+    accumulated = 0.0
+    for (offset, value), (next_offset, _) in zip(
+        offsets_and_values,
+        [*offsets_and_values[1:], (timedelta(minutes=5), None)],
+    ):
+        accumulated += value * (next_offset - offset).total_seconds()
+    period = timedelta(minutes=5) - offsets_and_values[0][0]
+
+    do_adhoc_statistics(hass, start=zero)
+    wait_recording_done(hass)
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats["sensor.test1"][0]["mean"] == accumulated / period.total_seconds()
+    assert stats["sensor.test1"][0]["min"] == -3.7
+    assert stats["sensor.test1"][0]["max"] == 21.3
+
+
 @pytest.mark.parametrize(
     ("device_class", "state_unit", "display_unit", "statistics_unit", "unit_class"),
     [
@@ -33,6 +33,7 @@ from homeassistant.components.stream.const import (
     CONF_SEGMENT_DURATION,
     DOMAIN,
     HLS_PROVIDER,
+    KEYFRAME_IMAGE_TTL,
     MAX_MISSING_DTS,
     PACKETS_TO_WAIT_FOR_AUDIO,
     RECORDER_PROVIDER,
@@ -989,7 +990,7 @@ async def test_get_image(hass: HomeAssistant, h264_video, filename) -> None:
         "av.open", new=blocking_open
     ):
         make_recording = hass.async_create_task(stream.async_record(filename))
-        assert stream._keyframe_converter._image is None
+        assert not stream._keyframe_converter._images
         # async_get_image should not work because there is no keyframe yet
         assert not await stream.async_get_image()
         # async_get_image should work if called with wait_for_next_keyframe=True
@@ -1043,7 +1044,7 @@ async def test_get_image_rotated(hass: HomeAssistant, h264_video, filename) -> N
             with patch.object(hass.config, "is_allowed_path", return_value=True):
                 make_recording = hass.async_create_task(stream.async_record(filename))
                 await make_recording
-            assert stream._keyframe_converter._image is None
+            assert not stream._keyframe_converter._images
 
             assert await stream.async_get_image() == EMPTY_8_6_JPEG
             await stream.stop()
@@ -1057,3 +1058,46 @@ async def test_get_image_rotated(hass: HomeAssistant, h264_video, filename) -> N
                 0
             ][0]
         ).all()
+
+
+async def test_get_image_cached(hass: HomeAssistant, h264_video, filename) -> None:
+    """Test images of a keyframe are cached by size."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    # Since libjpeg-turbo is not installed on the CI runner, we use a mock
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        stream = create_stream(hass, h264_video, {}, dynamic_stream_settings())
+    encode = mock_turbo_jpeg_singleton.instance.return_value.encode
+
+    with patch.object(hass.config, "is_allowed_path", return_value=True):
+        await stream.async_record(filename)
+
+    with patch.object(
+        stream._keyframe_converter,
+        "_decode_packet",
+        wraps=stream._keyframe_converter._decode_packet,
+    ) as mock_decode_packet:
+        images = await asyncio.gather(
+            stream.async_get_image(),
+            stream.async_get_image(),
+            stream.async_get_image(width=4, height=2),
+            stream.async_get_image(width=4, height=2),
+        )
+    assert images == [EMPTY_8_6_JPEG] * 4
+    # The keyframe is decoded once and encoded once per size
+    assert mock_decode_packet.call_count == 1
+    assert encode.call_count == 2
+    assert encode.call_args_list[1][0][0].shape == (2, 4, 3)
+
+    # Images expire after their time to live
+    images_cache = stream._keyframe_converter._images
+    for key, (image, created) in images_cache.items():
+        images_cache[key] = (image, created - KEYFRAME_IMAGE_TTL - 1)
+    assert await stream.async_get_image() == EMPTY_8_6_JPEG
+    assert encode.call_count == 3
+    assert len(images_cache) == 1
+
+    await stream.stop()
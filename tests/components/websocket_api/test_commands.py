@@ -20,10 +20,10 @@ from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAG
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, template
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.setup import DATA_IMPORT_TIME, DATA_SETUP_TIME, async_setup_component
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -611,6 +611,33 @@ async def test_ping(websocket_client: MockHAClientWebSocket) -> None:
     assert msg["type"] == "pong"
 
 
+async def test_template_cache_stats(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test template/cache_stats command."""
+    template_str = "{{ 'template cache stats test' }}"
+    template.CACHED_COMPILED_TEMPLATES.pop((template_str, False, False, True), None)
+    hits = template.COMPILE_STATISTICS.hits
+    misses = template.COMPILE_STATISTICS.misses
+    for _ in range(2):
+        template.Template(template_str, hass).ensure_valid()
+
+    await websocket_client.send_json({"id": 5, "type": "template/cache_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == {
+        "hits": hits + 1,
+        "misses": misses + 1,
+        "compile_seconds": ANY,
+        "size": len(template.CACHED_COMPILED_TEMPLATES),
+        "max_size": template.COMPILED_TEMPLATE_CACHE_SIZE,
+    }
+    assert msg["result"]["compile_seconds"] > 0
+
+
 async def test_call_service_context_with_user(
     hass: HomeAssistant,
     hass_client_no_auth: ClientSessionGenerator,
@@ -1128,6 +1155,61 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_share_one_listener(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribe_entities subscriptions share a single state listener."""
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.not_permitted", "off")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    init_count = sum(hass.bus.async_listeners().values())
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "entity_ids": ["light.permitted"]}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"]["a"].keys() == {"light.permitted"}
+
+    await websocket_client.send_json({"id": 8, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["event"]["a"].keys() == {"light.permitted"}
+
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on")
+
+    received = {}
+    for _ in range(2):
+        msg = await websocket_client.receive_json()
+        assert msg["type"] == "event"
+        received[msg["id"]] = msg["event"]
+    assert received.keys() == {7, 8}
+    for event in received.values():
+        assert event == {
+            "c": {"light.permitted": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+        }
+
+    for msg_id, subscription in ((9, 7), (10, 8)):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2305,6 +2387,7 @@ async def test_integration_setup_info(
         "august": datetime.timedelta(seconds=12.5),
         "isy994": datetime.timedelta(seconds=12.8),
     }
+    hass.data[DATA_IMPORT_TIME] = {"august": datetime.timedelta(seconds=1.5)}
     await websocket_client.send_json({"id": 7, "type": "integration/setup_info"})
 
     msg = await websocket_client.receive_json()
@@ -2312,8 +2395,8 @@ async def test_integration_setup_info(
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"] == [
-        {"domain": "august", "seconds": 12.5},
-        {"domain": "isy994", "seconds": 12.8},
+        {"domain": "august", "seconds": 12.5, "import_seconds": 1.5},
+        {"domain": "isy994", "seconds": 12.8, "import_seconds": None},
     ]
 
 
@@ -238,6 +238,52 @@ async def test_state_diff_event(hass: HomeAssistant) -> None:
     }
 
 
+async def test_state_diff_event_uses_changed_attributes(hass: HomeAssistant) -> None:
+    """Test the state diff only includes the attributes that changed."""
+    state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    context = Context(id="id")
+    hass.states.async_set(
+        "media_player.tv", "on", {"source": "a", "list": [1, 2]}, context=context
+    )
+    hass.states.async_set(
+        "media_player.tv", "on", {"source": "b", "volume": 1}, context=context
+    )
+    await hass.async_block_till_done()
+
+    last_state_event: Event = state_change_events[-1]
+    new_state: State = last_state_event.data["new_state"]
+    assert new_state.changed_attributes == {"source", "volume", "list"}
+    message = _state_diff_event(last_state_event)
+    assert message == {
+        "c": {
+            "media_player.tv": {
+                "+": {
+                    "a": {"source": "b", "volume": 1},
+                    "lu": new_state.last_updated.timestamp(),
+                },
+                "-": {"a": ["list"]},
+            }
+        }
+    }
+
+    hass.states.async_set(
+        "media_player.tv", "off", {"source": "b", "volume": 1}, context=context
+    )
+    await hass.async_block_till_done()
+
+    last_state_event = state_change_events[-1]
+    new_state = last_state_event.data["new_state"]
+    assert new_state.changed_attributes == frozenset()
+    message = _state_diff_event(last_state_event)
+    assert message == {
+        "c": {
+            "media_player.tv": {
+                "+": {"lc": new_state.last_changed.timestamp(), "s": "off"}
+            }
+        }
+    }
+
+
 async def test_message_to_json(caplog: pytest.LogCaptureFixture) -> None:
     """Test we can serialize websocket messages."""
 
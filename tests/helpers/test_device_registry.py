@@ -1877,3 +1877,10 @@ async def test_loading_invalid_configuration_url_from_storage(
         identifiers={("serial", "12:34:56:AB:CD:EF")},
     )
     assert entry.configuration_url == "invalid"
+
+
+def test_journal_collections(device_registry: dr.DeviceRegistry) -> None:
+    """Test the journal of the store covers all data of the registry."""
+    assert set(device_registry._data_to_save()) == set(
+        dr.DeviceRegistryStore.journal_collections
+    )
@@ -11,6 +11,7 @@ from unittest.mock import MagicMock, PropertyMock, patch
 import pytest
 import voluptuous as vol
 
+from homeassistant.config import DATA_CUSTOMIZE
 from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
@@ -21,6 +22,7 @@ from homeassistant.const import (
 from homeassistant.core import Context, HomeAssistant, HomeAssistantError
 from homeassistant.helpers import device_registry as dr, entity, entity_registry as er
 from homeassistant.helpers.entity_component import async_update_entity
+from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 
 from tests.common import (
@@ -736,6 +738,47 @@ async def test_capability_attrs(hass: HomeAssistant) -> None:
     assert state.attributes["always"] == "there"
 
 
+async def test_state_attributes_fingerprint(hass: HomeAssistant) -> None:
+    """Test the attributes fingerprint is passed to the state machine."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_extra_state_attributes = {"forecast": [1, 2, 3]}
+    ent.async_write_ha_state()
+    old_state = hass.states.get("hello.world")
+    assert old_state.attributes_fingerprint is None
+
+    ent._attr_state_attributes_fingerprint = 1
+    ent._attr_icon = "mdi:test"
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.attributes_fingerprint == (
+        1,
+        True,
+        None,
+        None,
+        None,
+        None,
+        None,
+        "mdi:test",
+        None,
+        None,
+    )
+    assert state.changed_attributes == {"icon"}
+
+    # Attributes added by the base class are part of the fingerprint
+    ent._attr_icon = "mdi:other"
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes["icon"] == "mdi:other"
+
+    # Customized entities are compared in full
+    hass.data[DATA_CUSTOMIZE] = EntityValues({"hello.world": {"custom": "yes"}})
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.attributes_fingerprint is None
+    assert state.attributes["custom"] == "yes"
+
+
 async def test_warn_slow_write_state(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
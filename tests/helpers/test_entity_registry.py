@@ -1684,3 +1684,10 @@ async def test_restore_entity(hass, update_events, freezer):
     assert update_events[11] == {"action": "remove", "entity_id": "light.hue_1234"}
     # Restore entities the 3rd time
     assert update_events[12] == {"action": "create", "entity_id": "light.hue_1234"}
+
+
+def test_journal_collections(entity_registry: er.EntityRegistry) -> None:
+    """Test the journal of the store covers all data of the registry."""
+    assert set(entity_registry._data_to_save()) == set(
+        er.EntityRegistryStore.journal_collections
+    )
@@ -733,3 +733,202 @@ async def test_read_only_store(
     hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
     await hass.async_block_till_done()
     assert read_only_store.key not in hass_storage
+
+
+async def test_batched_writes_skip_unchanged_data(tmpdir: py.path.local) -> None:
+    """Test saves of stores are written in batches and unchanged data is skipped."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    stores = [storage.Store(hass, MOCK_VERSION, f"storage-test-{i}") for i in range(3)]
+    write_batch = storage._StoreWriter._write_batch
+
+    with patch.object(
+        storage._StoreWriter, "_write_batch", autospec=True, side_effect=write_batch
+    ) as mock_write_batch:
+        await asyncio.gather(*(store.async_save(MOCK_DATA) for store in stores))
+
+    assert len(mock_write_batch.mock_calls) == 1
+    assert len(mock_write_batch.mock_calls[0][1][1]) == 3
+    for store in stores:
+        assert await hass.async_add_executor_job(os.path.exists, store.path)
+
+    statistics = storage.async_get_write_statistics(hass)
+    bytes_written = statistics["storage-test-0"].bytes_written
+    assert bytes_written == os.path.getsize(stores[0].path)
+    assert statistics["storage-test-0"] == storage.StoreWriteStatistics(
+        writes=1, skipped_writes=0, bytes_written=bytes_written
+    )
+
+    with patch("homeassistant.helpers.storage.write_utf8_file") as mock_write:
+        await stores[0].async_save(MOCK_DATA)
+    assert not mock_write.called
+    assert statistics["storage-test-0"] == storage.StoreWriteStatistics(
+        writes=1, skipped_writes=1, bytes_written=bytes_written
+    )
+
+    await stores[0].async_save(MOCK_DATA2)
+    assert await stores[0].async_load() == MOCK_DATA2
+    assert statistics["storage-test-0"].writes == 2
+
+    # A removed file is written again
+    await stores[1].async_remove()
+    await stores[1].async_save(MOCK_DATA)
+    assert await hass.async_add_executor_job(os.path.exists, stores[1].path)
+    assert statistics["storage-test-1"].writes == 2
+
+    await hass.async_stop(force=True)
+
+
+async def test_batched_write_error(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failing write does not fail the other writes of the batch."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    failing_store = storage.Store(hass, MOCK_VERSION, "storage-test-failing")
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+
+    await asyncio.gather(
+        failing_store.async_save({"bad": object()}), store.async_save(MOCK_DATA)
+    )
+
+    assert "Error writing config for storage-test-failing" in caplog.text
+    assert not await hass.async_add_executor_job(os.path.exists, failing_store.path)
+    assert await hass.async_add_executor_job(os.path.exists, store.path)
+    assert "storage-test-failing" not in storage.async_get_write_statistics(hass)
+
+    await hass.async_stop(force=True)
+
+
+class MockJournaledStore(storage.JournaledStore):
+    """Journaled store of mock items."""
+
+    journal_collections = ("items", "deleted_items")
+
+
+async def test_journaled_store(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a journaled store appends changes and replays them when loading."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    store = MockJournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+    data = {
+        "items": [{"id": "1", "name": "one"}, {"id": "2", "name": "two"}],
+        "deleted_items": [],
+    }
+
+    def read_journal() -> list[Any]:
+        with open(store.journal_path, encoding="utf-8") as journal:
+            return [json.loads(line) for line in journal]
+
+    # The first save writes the file and starts an empty journal
+    await store.async_save(data)
+    snapshot = await hass.async_add_executor_job(os.stat, store.path)
+    journal = await hass.async_add_executor_job(read_journal)
+    assert journal == [
+        {
+            "version": MOCK_VERSION,
+            "minor_version": 1,
+            "key": MOCK_KEY,
+            "snapshot": [snapshot.st_ino, snapshot.st_mtime_ns, snapshot.st_size],
+        }
+    ]
+
+    # Later saves only append the changed items
+    data = {
+        "items": [{"id": "1", "name": "renamed"}, {"id": "3", "name": "three"}],
+        "deleted_items": [{"id": "2", "name": "two"}],
+    }
+    await store.async_save(data)
+    assert (await hass.async_add_executor_job(os.stat, store.path)) == snapshot
+    journal = await hass.async_add_executor_job(read_journal)
+    assert journal[1:] == [
+        {"collection": "items", "item": {"id": "1", "name": "renamed"}},
+        {"collection": "items", "item": {"id": "3", "name": "three"}},
+        {"collection": "items", "remove": "2"},
+        {"collection": "deleted_items", "item": {"id": "2", "name": "two"}},
+    ]
+    statistics = storage.async_get_write_statistics(hass)[MOCK_KEY]
+    assert statistics.writes == 2
+
+    # Saving unchanged data appends nothing
+    await store.async_save(data)
+    assert await hass.async_add_executor_job(read_journal) == journal
+
+    # Loading replays the journal
+    assert await MockJournaledStore(hass, MOCK_VERSION, MOCK_KEY).async_load() == data
+
+    # An incomplete record is ignored
+    def append_incomplete_record() -> None:
+        with open(store.journal_path, "a", encoding="utf-8") as journal:
+            journal.write('{"collection": "items", "remove"')
+
+    await hass.async_add_executor_job(append_incomplete_record)
+    assert await MockJournaledStore(hass, MOCK_VERSION, MOCK_KEY).async_load() == data
+    assert "Ignoring incomplete journal record of storage-test" in caplog.text
+
+    # A journal of another file is ignored
+    await hass.async_add_executor_job(os.unlink, store.path)
+    await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_save(
+        {"items": [], "deleted_items": []}
+    )
+    assert await MockJournaledStore(hass, MOCK_VERSION, MOCK_KEY).async_load() == {
+        "items": [],
+        "deleted_items": [],
+    }
+    assert "Ignoring journal of storage-test" in caplog.text
+
+    await hass.async_stop(force=True)
+
+
+async def test_journaled_store_compacts_journal(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted into the file when it grows too large."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    store = MockJournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+
+    def count_journal_lines() -> int:
+        with open(store.journal_path, encoding="utf-8") as journal:
+            return len(journal.readlines())
+
+    def save(name: str):
+        return store.async_save(
+            {
+                "items": [{"id": "1", "name": name}, {"id": "2", "name": name}],
+                "deleted_items": [],
+            }
+        )
+
+    with patch("homeassistant.helpers.storage.JOURNAL_MIN_COMPACT_RECORDS", 0):
+        await save("one")
+        await save("two")
+        assert await hass.async_add_executor_job(count_journal_lines) == 3
+
+        # Two more records exceed the two items of the data
+        await save("three")
+        assert await hass.async_add_executor_job(count_journal_lines) == 1
+
+    data = await hass.async_add_executor_job(storage.json_util.load_json, store.path)
+    assert data["data"]["items"] == [
+        {"id": "1", "name": "three"},
+        {"id": "2", "name": "three"},
+    ]
+
+    await hass.async_stop(force=True)
@@ -1403,6 +1403,17 @@ def test_render_with_possible_json_value_with_valid_json(hass: HomeAssistant) ->
     assert tpl.async_render_with_possible_json_value('{"hello": "world"}') == "world"
 
 
+def test_render_with_possible_json_value_with_parsed_json(hass: HomeAssistant) -> None:
+    """Render with possible JSON value with the JSON already parsed."""
+    tpl = template.Template("{{ value_json.hello }}", hass)
+    assert (
+        tpl.async_render_with_possible_json_value(
+            '{"hello": "world"}', variables={"value_json": {"hello": "parsed"}}
+        )
+        == "parsed"
+    )
+
+
 def test_render_with_possible_json_value_with_invalid_json(hass: HomeAssistant) -> None:
     """Render with possible JSON value with invalid JSON."""
     tpl = template.Template("{{ value_json }}", hass)
@@ -4073,27 +4084,58 @@ def test_iif(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
-async def test_cache_garbage_collection() -> None:
-    """Test caching a template."""
+async def test_compiled_template_cache() -> None:
+    """Test the compiled code of a template is shared and kept."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
+    key = (template_string, False, False, False)
+    template.CACHED_COMPILED_TEMPLATES.pop(key, None)
+    statistics = template.COMPILE_STATISTICS
+    hits = statistics.hits
+    misses = statistics.misses
+
     tpl = template.Template(
         (template_string),
     )
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert template.CACHED_COMPILED_TEMPLATES.get(key)
+    assert statistics.misses == misses + 1
+    assert statistics.hits == hits
+
+    # The compiled code is kept when the template is thrown away
+    del tpl
+    assert template.CACHED_COMPILED_TEMPLATES.get(key)
 
     tpl2 = template.Template(
         (template_string),
     )
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert statistics.misses == misses + 1
+    assert statistics.hits == hits + 1
+    assert tpl2._compiled_code is template.CACHED_COMPILED_TEMPLATES[key]
 
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+
+async def test_compiled_template_cache_by_environment(hass: HomeAssistant) -> None:
+    """Test templates with and without hass do not share compiled code."""
+    template_string = "{{ 'compiled_cache_test' }}"
+    for has_hass in (False, True):
+        template.CACHED_COMPILED_TEMPLATES.pop(
+            (template_string, False, False, has_hass), None
+        )
+
+    template.Template(template_string).ensure_valid()
+    assert template.Template(template_string, hass).async_render() == (
+        "compiled_cache_test"
+    )
+
+    for has_hass in (False, True):
+        assert (
+            template_string,
+            False,
+            False,
+            has_hass,
+        ) in template.CACHED_COMPILED_TEMPLATES
 
 
 def test_is_template_string() -> None:
@@ -3,12 +3,13 @@ import asyncio
 from collections.abc import Generator, Iterable
 import glob
 import os
+import threading
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, runner
+from homeassistant import bootstrap, loader, runner
 import homeassistant.config as config_util
 from homeassistant.config_entries import HANDLERS, ConfigEntry
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -17,6 +18,11 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
+from homeassistant.setup import (
+    DATA_IMPORT_TIME,
+    DATA_PRE_IMPORTS,
+    DATA_STARTUP_TIMELINE,
+)
 
 from .common import (
     MockConfigEntry,
@@ -958,3 +964,140 @@ async def test_bootstrap_dependencies(
     assert (
         f"Dependency {integration} will wait for dependencies ['mqtt']" in caplog.text
     )
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_pre_import_stage_2_integrations(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test stage 2 integrations are imported in the executor before set up."""
+    pre_imported: dict[str, tuple[bool, set[str]]] = {}
+    pre_import_integration = bootstrap._pre_import_integration
+
+    def _mock_pre_import_integration(
+        integration: Integration, platforms: set[str]
+    ) -> float | None:
+        pre_imported[integration.domain] = (
+            threading.current_thread() is threading.main_thread(),
+            platforms,
+        )
+        return pre_import_integration(integration, platforms)
+
+    with patch.object(
+        bootstrap, "_pre_import_integration", _mock_pre_import_integration
+    ):
+        await bootstrap._async_set_up_integrations(
+            hass, {"test_package": {}, "light": {}}
+        )
+
+    assert pre_imported["test_package"] == (False, {"light"})
+    assert pre_imported["light"] == (False, {"light"})
+    assert "test_package" in hass.config.components
+    assert "test_package" in hass.data[DATA_IMPORT_TIME]
+    assert hass.data[DATA_PRE_IMPORTS] == {}
+
+
+async def test_pre_import_integration_platforms(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test only platforms of entity domains being set up are pre-imported."""
+    integration = await loader.async_get_integration(hass, "test")
+
+    with patch.object(bootstrap.importlib, "import_module") as mock_import:
+        seconds = await hass.async_add_executor_job(
+            bootstrap._pre_import_integration, integration, {"light", "vacuum"}
+        )
+
+    assert seconds is not None
+    assert [call[0][0] for call in mock_import.call_args_list] == [
+        "custom_components.test",
+        "custom_components.test.light",
+    ]
+
+
+async def test_pre_import_integration_failure(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test a failing pre-import is left to the set up to report."""
+    integration = await loader.async_get_integration(hass, "test_package")
+
+    with patch.object(bootstrap.importlib, "import_module", side_effect=ImportError):
+        assert (
+            await hass.async_add_executor_job(
+                bootstrap._pre_import_integration, integration, set()
+            )
+            is None
+        )
+
+
+@pytest.mark.parametrize("hass_config", [{"browser": {}, "frontend": {}}])
+async def test_setup_hass_startup_trace(
+    mock_hass_config: None,
+    mock_enable_logging: Mock,
+    mock_is_virtual_env: Mock,
+    mock_mount_local_lib_path: AsyncMock,
+    mock_ensure_config_exists: AsyncMock,
+    mock_process_ha_config_upgrade: Mock,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test a trace of the startup is written when requested."""
+    with patch.object(bootstrap, "save_json") as mock_save_json:
+        hass = await bootstrap.async_setup_hass(
+            runner.RuntimeConfig(
+                config_dir=get_test_config_dir(),
+                skip_pip=True,
+                startup_trace=True,
+            ),
+        )
+
+    assert DATA_STARTUP_TIMELINE not in hass.data
+    assert len(mock_save_json.mock_calls) == 1
+    path, trace = mock_save_json.mock_calls[0][1]
+    assert path == hass.config.path(bootstrap.STARTUP_TRACE_FILENAME)
+
+    tracks = {
+        event["tid"]: event["args"]["name"]
+        for event in trace["traceEvents"]
+        if event["ph"] == "M"
+    }
+    phases = {
+        (tracks[event["tid"]], event["name"])
+        for event in trace["traceEvents"]
+        if event["ph"] == "X"
+    }
+    assert {
+        ("main", "load configuration"),
+        ("main", "load registries"),
+        ("main", "core integrations"),
+        ("main", "resolve integrations"),
+        ("main", "frontend"),
+        ("main", "stage 2"),
+        ("main", "wrap up"),
+        ("entity_registry", "entity_registry"),
+        ("browser", "dependencies"),
+        ("browser", "requirements"),
+        ("browser", "import"),
+        ("browser", "config validation"),
+        ("browser", "async_setup"),
+        ("browser", "config entries"),
+        ("browser (executor)", "pre-import"),
+    } <= phases
+
+
+@pytest.mark.parametrize("hass_config", [{"browser": {}, "frontend": {}}])
+async def test_setup_hass_without_startup_trace(
+    mock_hass_config: None,
+    mock_enable_logging: Mock,
+    mock_is_virtual_env: Mock,
+    mock_mount_local_lib_path: AsyncMock,
+    mock_ensure_config_exists: AsyncMock,
+    mock_process_ha_config_upgrade: Mock,
+    event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test no startup trace is recorded by default."""
+    with patch.object(bootstrap, "save_json") as mock_save_json:
+        await bootstrap.async_setup_hass(
+            runner.RuntimeConfig(config_dir=get_test_config_dir(), skip_pip=True),
+        )
+
+    assert len(mock_save_json.mock_calls) == 0
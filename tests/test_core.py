@@ -839,6 +839,138 @@ async def test_eventbus_unsubscribe_listener(hass: HomeAssistant) -> None:
     assert len(calls) == 1
 
 
+async def test_eventbus_listener_added_and_removed_while_firing(
+    hass: HomeAssistant,
+) -> None:
+    """Test the dispatch tuple is rebuilt when listeners change."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(("specific", event))
+
+    @ha.callback
+    def match_all_listener(event):
+        """Mock listener."""
+        calls.append(("match_all", event))
+        # Adding a listener while dispatching must not affect this event
+        unsubs.append(hass.bus.async_listen("test", listener, run_immediately=True))
+
+    unsubs = [
+        hass.bus.async_listen(MATCH_ALL, match_all_listener, run_immediately=True)
+    ]
+
+    hass.bus.async_fire("test")
+    assert [kind for kind, _ in calls] == ["match_all"]
+
+    calls.clear()
+    unsubs.pop(0)()
+    hass.bus.async_fire("test")
+    assert [kind for kind, _ in calls] == ["specific"]
+
+    for unsub in unsubs:
+        unsub()
+    calls.clear()
+    hass.bus.async_fire("test")
+    assert calls == []
+
+
+async def test_eventbus_entity_id_keyed_listener(hass: HomeAssistant) -> None:
+    """Test listeners indexed by entity_id only see their own events."""
+    calls = []
+    old_count = hass.bus.async_listeners().get("test", 0)
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def filter(event):
+        """Mock filter."""
+        return not event.data.get("filtered")
+
+    unsub_1 = hass.bus._async_listen_filterable_job(
+        "test", (ha.HassJob(listener), None, True), "light.kitchen"
+    )
+    unsub_2 = hass.bus._async_listen_filterable_job(
+        "test", (ha.HassJob(listener), filter, True), "light.kitchen"
+    )
+    assert hass.bus.async_listeners()["test"] == old_count + 2
+
+    hass.bus.async_fire("test", {"entity_id": "light.living_room"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    assert len(calls) == 2
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "filtered": True})
+    assert len(calls) == 3
+
+    unsub_1()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    assert len(calls) == 4
+
+    unsub_2()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    assert len(calls) == 4
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus._async_listen_filterable_job(
+            MATCH_ALL, (ha.HassJob(listener), None, True), "light.kitchen"
+        )
+
+
+async def test_eventbus_dispatch_cache(hass: HomeAssistant) -> None:
+    """Test dispatch tuples are only cached for event types with listeners."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append("listener")
+
+    @ha.callback
+    def keyed_listener(event):
+        """Mock listener."""
+        calls.append("keyed_listener")
+
+    assert not hass.bus._match_all_listeners
+    hass.bus.async_fire("no_listeners")
+    assert "no_listeners" not in hass.bus._dispatch
+
+    # Keyed listeners run after the others even if they were added first
+    unsub_keyed = hass.bus._async_listen_filterable_job(
+        "test", (ha.HassJob(keyed_listener), None, True), "light.kitchen"
+    )
+    unsub = hass.bus.async_listen("test", listener, run_immediately=True)
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert calls == ["listener", "keyed_listener"]
+    assert "test" in hass.bus._dispatch
+
+    unsub()
+    unsub_keyed()
+    assert "test" not in hass.bus._dispatch
+
+
+async def test_eventbus_remove_unknown_entity_id_keyed_listener(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test removing an entity_id keyed listener twice logs an error."""
+    unsub = hass.bus._async_listen_filterable_job(
+        "test", (ha.HassJob(lambda event: None), None, False), "light.kitchen"
+    )
+    unsub()
+    unsub()
+    assert "Unable to remove unknown job listener" in caplog.text
+
+
 async def test_eventbus_listen_once_event_with_callback(hass: HomeAssistant) -> None:
     """Test listen_once_event method."""
     runs = []
@@ -1114,6 +1246,37 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_listen_entity(hass: HomeAssistant) -> None:
+    """Test listening for state changes of a single entity."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.states.async_listen_entity("light.Bowl", listener)
+    assert hass.bus.async_entity_listeners(EVENT_STATE_CHANGED) == {"light.bowl": 1}
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert calls[0].data["entity_id"] == "light.bowl"
+    assert calls[0].data["new_state"].state == "on"
+
+    hass.states.async_remove("light.bowl")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert calls[1].data["new_state"] is None
+
+    unsub()
+    assert hass.bus.async_entity_listeners(EVENT_STATE_CHANGED) == {}
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1664,6 +1827,99 @@ def test_context() -> None:
     assert c.id is not None
 
 
+def test_context_id_generated_lazily() -> None:
+    """Test the context id is only generated once on first access."""
+    with patch("homeassistant.core.ulid_at_time", return_value="lazy_id") as ulid:
+        c = ha.Context()
+        assert ulid.call_count == 0
+        assert c.id == "lazy_id"
+        assert c.id == "lazy_id"
+        assert ulid.call_count == 1
+
+        c = ha.Context(id="given_id")
+        assert c.id == "given_id"
+        assert ulid.call_count == 1
+
+
+async def test_statemachine_shares_unchanged_attributes(hass: HomeAssistant) -> None:
+    """Test unchanged attributes are shared instead of copied."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    new_state = hass.states.get("light.bowl")
+    assert new_state.attributes is state.attributes
+
+    hass.states.async_set("light.bowl", "on", {"brightness": 50})
+    assert hass.states.get("light.bowl").attributes == {"brightness": 50}
+
+
+async def test_statemachine_changed_attributes(hass: HomeAssistant) -> None:
+    """Test states know which attributes changed from the state they replaced."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100, "effect": "none"})
+    assert hass.states.get("light.bowl").changed_attributes is None
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100, "effect": "none"})
+    assert hass.states.get("light.bowl").changed_attributes == frozenset()
+
+    # Listeners of the state changed event hold the replaced state
+    old_state = hass.states.get("light.bowl")
+    hass.states.async_set("light.bowl", "off", {"brightness": 50, "color": "red"})
+    assert hass.states.get("light.bowl").changed_attributes == {
+        "brightness",
+        "color",
+        "effect",
+    }
+    del old_state
+
+    # The replaced attributes are not kept alive by the new state
+    hass.states.async_set("light.bowl", "off", {"brightness": 50})
+    gc.collect()
+    assert hass.states.get("light.bowl").changed_attributes is None
+
+    assert ha.State("light.bowl", "on").changed_attributes is None
+
+
+async def test_statemachine_attributes_fingerprint(hass: HomeAssistant) -> None:
+    """Test a matching attributes fingerprint skips comparing the attributes."""
+    hass.states.async_set(
+        "media_player.tv", "on", {"source_list": ["a"]}, attributes_fingerprint=1
+    )
+    state = hass.states.get("media_player.tv")
+    assert state.attributes_fingerprint == 1
+
+    # The fingerprint is trusted, so the attributes are not compared
+    hass.states.async_set(
+        "media_player.tv", "off", {"source_list": ["b"]}, attributes_fingerprint=1
+    )
+    new_state = hass.states.get("media_player.tv")
+    assert new_state.state == "off"
+    assert new_state.attributes is state.attributes
+    assert new_state.changed_attributes == frozenset()
+
+    hass.states.async_set(
+        "media_player.tv", "off", {"source_list": ["b"]}, attributes_fingerprint=2
+    )
+    new_state = hass.states.get("media_player.tv")
+    assert new_state.attributes == {"source_list": ["b"]}
+    assert new_state.changed_attributes == {"source_list"}
+
+
+async def test_eventbus_does_not_create_events_without_listeners(
+    hass: HomeAssistant,
+) -> None:
+    """Test no event is created when nothing listens to it."""
+    with patch("homeassistant.core.Event") as mock_event, patch.object(
+        ha._LOGGER, "isEnabledFor", return_value=False
+    ):
+        hass.bus.async_fire("no_listeners")
+        assert mock_event.call_count == 0
+
+        hass.bus.async_listen("no_listeners", lambda event: None)
+        hass.bus.async_fire("no_listeners")
+        assert mock_event.call_count == 1
+
+
 async def test_async_functions_with_callback(hass: HomeAssistant) -> None:
     """Test we deal with async functions accidentally marked as callback."""
     runs = []
@@ -2342,6 +2598,18 @@ async def test_event_context(hass: HomeAssistant) -> None:
     assert dummy_event2.context.origin_event == dummy_event
 
 
+async def test_origin_event_not_set_without_listeners(hass: HomeAssistant) -> None:
+    """Test the origin event is only set if the event is created."""
+    context = ha.Context()
+    hass.bus.async_fire("no_listeners", context=context)
+    assert context.origin_event is None
+
+    events = async_capture_events(hass, "dummy_event")
+    hass.bus.async_fire("dummy_event", context=context)
+    await hass.async_block_till_done()
+    assert context.origin_event is events[0]
+
+
 def _get_full_name(obj) -> str:
     """Get the full name of an object in memory."""
     objtype = type(obj)
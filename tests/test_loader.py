@@ -1,4 +1,6 @@
 """Test to verify that we can load components."""
+from datetime import timedelta
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -7,8 +9,14 @@ from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
 from homeassistant.core import HomeAssistant, callback
+import homeassistant.util.dt as dt_util
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -744,3 +752,92 @@ async def test_loggers(hass: HomeAssistant) -> None:
         },
     )
     assert integration.loggers == ["name1", "name2"]
+
+
+def _restart_loader(hass: HomeAssistant) -> None:
+    """Forget everything the loader resolved, as if Home Assistant restarted."""
+    hass.data.pop(loader.DATA_MANIFEST_INDEX)
+    hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+    loader.async_setup(hass)
+
+
+async def _async_save_manifest_index(hass: HomeAssistant) -> None:
+    """Wait for the manifest index to be saved."""
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_INDEX_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+
+async def test_manifest_index(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    enable_custom_integrations: None,
+) -> None:
+    """Test resolved manifests are stored and used after a restart."""
+    await loader.async_get_integrations(hass, ["http", "test_package"])
+    await _async_save_manifest_index(hass)
+
+    data = hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]
+    assert {entry["manifest"]["domain"] for entry in data["manifests"].values()} >= {
+        "http",
+        "test_package",
+    }
+    assert any(
+        "test_package" in entry["names"] for entry in data["directories"].values()
+    )
+
+    _restart_loader(hass)
+    with patch("pathlib.Path.read_text", side_effect=OSError), patch(
+        "pathlib.Path.iterdir", side_effect=OSError
+    ):
+        integrations = await loader.async_get_integrations(
+            hass, ["http", "test_package"]
+        )
+    assert integrations["http"].name == "HTTP"
+    assert integrations["test_package"].name == "Test Package"
+    assert integrations["test_package"].is_built_in is False
+
+
+async def test_manifest_index_changed_manifest(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    enable_custom_integrations: None,
+) -> None:
+    """Test a manifest that changed since it was indexed is read again."""
+    integration = await loader.async_get_integration(hass, "test_package")
+    await _async_save_manifest_index(hass)
+
+    manifest_path = str(integration.file_path / "manifest.json")
+    entry = hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]["manifests"][
+        manifest_path
+    ]
+    entry["stamp"] = [0, 0]
+    entry["manifest"]["name"] = "Outdated"
+
+    _restart_loader(hass)
+    integration = await loader.async_get_integration(hass, "test_package")
+    assert integration.name == "Test Package"
+
+
+async def test_manifest_index_other_version(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test the index of another Home Assistant version is not used."""
+    with patch.object(loader, "__version__", "2023.1.0"):
+        integration = await loader.async_get_integration(hass, "http")
+        await _async_save_manifest_index(hass)
+
+        manifest_path = str(integration.file_path / "manifest.json")
+        manifests = hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]["manifests"]
+        manifests[manifest_path]["manifest"]["name"] = "Indexed"
+
+        # Manifests of built-in integrations are not validated on releases
+        _restart_loader(hass)
+        integration = await loader.async_get_integration(hass, "http")
+        assert integration.name == "Indexed"
+
+    _restart_loader(hass)
+    integration = await loader.async_get_integration(hass, "http")
+    assert integration.name == "HTTP"
@@ -0,0 +1,78 @@
+"""Test the timeline recorder."""
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.util.timeline import Timeline
+
+
+def test_timeline() -> None:
+    """Test phases are exported as Chrome trace events."""
+    with patch("homeassistant.util.timeline.perf_counter", return_value=10.0):
+        timeline = Timeline()
+
+    with patch(
+        "homeassistant.util.timeline.perf_counter", side_effect=[10.5, 12.25]
+    ), timeline.phase("stage 1", "bootstrap"):
+        pass
+    timeline.add_phase("async_setup", "setup", 11.0, 11.000002, "hue", {"a": 1})
+    timeline.add_phase("import", "import", 10.75, 11.0, "hue")
+
+    assert timeline.as_trace_events() == {
+        "traceEvents": [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 1,
+                "args": {"name": "main"},
+            },
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 2,
+                "args": {"name": "hue"},
+            },
+            {
+                "name": "stage 1",
+                "cat": "bootstrap",
+                "ph": "X",
+                "ts": 500000,
+                "dur": 1750000,
+                "pid": 1,
+                "tid": 1,
+            },
+            {
+                "name": "async_setup",
+                "cat": "setup",
+                "ph": "X",
+                "ts": 1000000,
+                "dur": 2,
+                "pid": 1,
+                "tid": 2,
+                "args": {"a": 1},
+            },
+            {
+                "name": "import",
+                "cat": "import",
+                "ph": "X",
+                "ts": 750000,
+                "dur": 250000,
+                "pid": 1,
+                "tid": 2,
+            },
+        ],
+        "displayTimeUnit": "ms",
+    }
+
+
+def test_timeline_phase_raises() -> None:
+    """Test a phase is recorded when it raises."""
+    timeline = Timeline()
+
+    with pytest.raises(ValueError), timeline.phase("failing", "setup", "track"):
+        raise ValueError
+
+    events = timeline.as_trace_events()["traceEvents"]
+    assert [event["name"] for event in events] == ["thread_name", "failing"]